@@ -157,6 +157,7 @@ def load_config(config_dir: str = 'config') -> Tuple[Dict[str, Any], Dict[str, i
         'email': meta.get('email'),
         'lookup_frequency': meta.get('lookup_frequency', '1 week'),
         'update_date': meta.get('update_date', 'N/A'),
+        'ncbi_api_key': meta.get('ncbi_api_key'),
         'journals': journals.get('journals', []),
         'topics': topics.get('topics', []),
         'authors': raw_authors,
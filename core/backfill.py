@@ -0,0 +1,190 @@
+"""
+Backfill runner for the Journal Lookup Tool.
+Searches every configured date range (optionally split into smaller slices)
+on a worker pool, checkpoints each finished slice to disk and merges the
+results into one deduplicated set.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from core.date_utils import split_date_range
+from core.paper import Paper
+from core.paper_processor import deduplicate_categories
+from fetch_modules.executor import DEFAULT_MAX_WORKERS, run_ordered
+from output_modules.file_writers import stream_json
+
+
+CHECKPOINT_DIRNAME = "backfill_checkpoints"
+
+# Result of searching one slice: (components_keyword, components_orcid, keyword_frequencies)
+SliceResult = Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]
+
+
+def build_backfill_slices(
+    date_ranges: List[List[str]],
+    slice_days: int = 0
+) -> List[Tuple[str, str]]:
+    """
+    Expand configured date ranges into the slices to search.
+
+    Args:
+        date_ranges: [start, end] pairs from dates.yaml
+        slice_days: Days per slice; 0 searches each range as a whole
+
+    Returns:
+        Unique (start_date, end_date) slices in chronological order
+    """
+    slices = []
+    for start_date, end_date in date_ranges:
+        slices.extend(split_date_range(start_date, end_date, slice_days))
+    return sorted(set(slices))
+
+
+def search_fingerprint(config: Dict[str, Any], mode: str) -> str:
+    """
+    Fingerprint the search settings a checkpoint depends on.
+
+    Args:
+        config: Configuration dictionary
+        mode: Search mode ("keywords", "authors", or "both")
+
+    Returns:
+        Short hex digest of mode, topics, journals and ORCIDs
+    """
+    settings = {
+        "mode": mode,
+        "topics": config.get("topics", []),
+        "journals": config.get("journals", []),
+        "orcids": config.get("orcids", [])
+    }
+    encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def checkpoint_path(checkpoint_dir: Path, date_range: Tuple[str, str]) -> Path:
+    """Return the checkpoint file for a slice."""
+    start_date, end_date = date_range
+    return checkpoint_dir / f"slice_{start_date.replace('/', '')}_{end_date.replace('/', '')}.json"
+
+
+def load_checkpoint(path: Path, fingerprint: str) -> SliceResult:
+    """
+    Load a finished slice if it was searched with the same settings.
+
+    Args:
+        path: Checkpoint file path
+        fingerprint: Current search fingerprint
+
+    Returns:
+        Slice result, or None if missing, stale or unreadable
+    """
+    if not path.exists():
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️  Ignoring unreadable checkpoint {path.name}: {e}")
+        return None
+
+    if checkpoint.get("fingerprint") != fingerprint:
+        return None
+    return (
+        [Paper.from_dict(component) for component in checkpoint.get("components_keyword", [])],
+        [Paper.from_dict(component) for component in checkpoint.get("components_orcid", [])],
+        checkpoint.get("keyword_frequencies", {})
+    )
+
+
+def save_checkpoint(path: Path, fingerprint: str, date_range: Tuple[str, str], result: SliceResult) -> None:
+    """
+    Write a finished slice atomically.
+
+    Args:
+        path: Checkpoint file path
+        fingerprint: Current search fingerprint
+        date_range: Slice date range
+        result: Slice result to store
+    """
+    components_keyword, components_orcid, keyword_frequencies = result
+    checkpoint = {
+        "fingerprint": fingerprint,
+        "start_end_date": list(date_range),
+        "components_keyword": components_keyword,
+        "components_orcid": components_orcid,
+        "keyword_frequencies": keyword_frequencies
+    }
+
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        stream_json(checkpoint, f)
+    os.replace(temp_path, path)
+
+
+def run_backfill(
+    config: Dict[str, Any],
+    mode: str,
+    slices: List[Tuple[str, str]],
+    search_slice: Callable[[Dict[str, Any], Tuple[str, str], int], SliceResult],
+    checkpoint_dir: str,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> SliceResult:
+    """
+    Search every slice on a worker pool and merge the results.
+
+    Slices with a matching checkpoint are not searched again, so an
+    interrupted backfill continues where it stopped. All slices share the
+    process-wide rate limiter and whatever caches search_slice uses.
+
+    Args:
+        config: Configuration dictionary
+        mode: Search mode ("keywords", "authors", or "both")
+        slices: (start_date, end_date) slices from build_backfill_slices
+        search_slice: Function (config, date_range, max_workers) returning
+            (components_keyword, components_orcid, keyword_frequencies)
+        checkpoint_dir: Directory for per-slice checkpoint files
+        max_workers: Total number of concurrent queries
+
+    Returns:
+        Tuple of (components_keyword, components_orcid, keyword_frequencies)
+        merged over all slices, with duplicates removed
+    """
+    checkpoint_root = Path(checkpoint_dir)
+    checkpoint_root.mkdir(parents=True, exist_ok=True)
+    fingerprint = search_fingerprint(config, mode)
+
+    # Split the worker budget between slices and the queries inside each slice
+    slice_workers = max(1, min(max_workers, len(slices)))
+    query_workers = max(1, max_workers // slice_workers)
+
+    def process_slice(date_range: Tuple[str, str]) -> SliceResult:
+        path = checkpoint_path(checkpoint_root, date_range)
+        result = load_checkpoint(path, fingerprint)
+        if result is not None:
+            print(f"   Reusing checkpoint for {date_range[0]} to {date_range[1]}")
+            return result
+
+        result = search_slice(config, date_range, query_workers)
+        save_checkpoint(path, fingerprint, date_range, result)
+        print(f"   Checkpointed {date_range[0]} to {date_range[1]}")
+        return result
+
+    components_keyword = []
+    components_orcid = []
+    keyword_frequencies = {topic: 0 for topic in config.get("topics", [])}
+
+    # Slices print their own progress, so their output is shown one slice at a time
+    for slice_keyword, slice_orcid, slice_frequencies in run_ordered(
+        process_slice, slices, slice_workers, "Backfill", buffer_output=True
+    ):
+        components_keyword.extend(slice_keyword)
+        components_orcid.extend(slice_orcid)
+        for keyword, count in slice_frequencies.items():
+            keyword_frequencies[keyword] = keyword_frequencies.get(keyword, 0) + count
+
+    components_keyword, components_orcid, _ = deduplicate_categories(components_keyword, components_orcid)
+    return components_keyword, components_orcid, keyword_frequencies
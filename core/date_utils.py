@@ -5,7 +5,7 @@ Handles date parsing, validation, and range calculations.
 
 import re
 from datetime import datetime, timedelta
-from typing import Tuple
+from typing import List, Tuple
 
 
 
@@ -104,6 +104,35 @@ def calculate_date_range(frequency: str, end_date: str = '3000/01/01') -> Tuple[
 
 
 
+def split_date_range(start_date: str, end_date: str, slice_days: int = 0) -> List[Tuple[str, str]]:
+    """
+    Split an inclusive date range into consecutive slices.
+    
+    Args:
+        start_date: Start date in YYYY/MM/DD format
+        end_date: End date in YYYY/MM/DD format (capped at today when slicing)
+        slice_days: Days per slice; 0 keeps the range whole
+        
+    Returns:
+        List of (start_date, end_date) tuples covering the range without overlap
+    """
+    if slice_days <= 0:
+        return [(start_date, end_date)]
+    
+    start = datetime.strptime(start_date, "%Y/%m/%d")
+    end = min(datetime.strptime(end_date, "%Y/%m/%d"), datetime.now())
+    
+    slices = []
+    while start <= end:
+        slice_end = min(start + timedelta(days=slice_days - 1), end)
+        slices.append((start.strftime("%Y/%m/%d"), slice_end.strftime("%Y/%m/%d")))
+        start = slice_end + timedelta(days=1)
+    return slices
+
+
+
+
+
 def ask_user_date(lookup_frequency: str, end_date_default: str = '3000/01/01', auto_mode: bool = False) -> Tuple[str, str]:
     """
     Get date range from user or calculate automatically.
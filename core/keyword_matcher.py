@@ -0,0 +1,184 @@
+"""
+Multi-keyword matcher for the Journal Lookup Tool.
+Compiles a keyword list into an Aho-Corasick automaton so a title or
+abstract is scanned once for every keyword, instead of once per keyword.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+
+# Matched span: (start, end, keyword) with end exclusive
+Span = Tuple[int, int, str]
+
+# Words for whole-word matching: runs of letters and digits
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _fold_case(text: str) -> str:
+    """Lower-case text without changing its length, so spans index the original."""
+    folded = text.lower()
+    if len(folded) == len(text):
+        return folded
+    # A few characters (e.g. "İ") lower-case to two; keep one per character
+    return "".join(char.lower()[:1] for char in text)
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive Aho-Corasick automaton over a fixed keyword list.
+
+    By default keywords match anywhere, like a substring test. With
+    whole_words the automaton runs over words instead of characters, so
+    "gene" does not match "genes" and "gene editing" matches "Gene-editing"
+    (punctuation and spacing between words are ignored); scanning words is
+    also several times faster.
+    """
+
+    def __init__(self, keywords: Iterable[str], whole_words: bool = False):
+        """
+        Compile keywords into an automaton.
+
+        Args:
+            keywords: Keywords to match (blank keywords are ignored)
+            whole_words: Match whole words instead of substrings
+        """
+        self.whole_words = whole_words
+        self.keywords: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Per state: (keyword index, pattern length in symbols) of every pattern ending there
+        self._outputs: List[List[Tuple[int, int]]] = [[]]
+
+        for keyword in keywords:
+            symbols = self._symbols(_fold_case(keyword.strip())) if isinstance(keyword, str) else ()
+            if symbols:
+                self._add_pattern(symbols, len(self.keywords))
+                self.keywords.append(keyword)
+
+        self._build_failure_links()
+
+    def _symbols(self, folded: str) -> Sequence[str]:
+        """Split case-folded text into automaton symbols (characters or words)."""
+        return TOKEN_PATTERN.findall(folded) if self.whole_words else folded
+
+    def _add_pattern(self, symbols: Sequence[str], keyword_index: int) -> None:
+        """Add one pattern to the trie."""
+        state = 0
+        for symbol in symbols:
+            next_state = self._goto[state].get(symbol)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][symbol] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+        self._outputs[state].append((keyword_index, len(symbols)))
+
+    def _build_failure_links(self) -> None:
+        """Link each state to its longest proper suffix state (breadth-first)."""
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for symbol, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and symbol not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(symbol, 0)
+                # Patterns ending at the suffix state also end here
+                self._outputs[next_state] = self._outputs[next_state] + self._outputs[self._fail[next_state]]
+
+    def _step(self, state: int, symbol: str) -> int:
+        """Follow a symbol that has no trie edge from state."""
+        goto = self._goto
+        fallback = state
+        while fallback and symbol not in goto[fallback]:
+            fallback = self._fail[fallback]
+        next_state = goto[fallback].get(symbol, 0)
+        # Cache resolved character transitions (the alphabet is small); words
+        # are not cached, since their vocabulary is unbounded
+        if state and not self.whole_words:
+            goto[state][symbol] = next_state
+        return next_state
+
+    def _scan(self, symbols: Sequence[str]) -> Iterator[Tuple[int, List[Tuple[int, int]]]]:
+        """Yield (symbol index, patterns ending there) for every match position."""
+        goto, outputs, step = self._goto, self._outputs, self._step
+        state = 0
+        for position, symbol in enumerate(symbols):
+            next_state = goto[state].get(symbol)
+            state = next_state if next_state is not None else step(state, symbol)
+            if outputs[state]:
+                yield position, outputs[state]
+
+    def iter_spans(self, text: str) -> Iterator[Span]:
+        """
+        Scan text once and yield every keyword occurrence.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (start, end, keyword) spans into text, ordered by end position
+            (overlapping and nested matches are all reported)
+        """
+        if not text or not self.keywords:
+            return
+
+        folded = _fold_case(text)
+        if not self.whole_words:
+            for position, matched in self._scan(folded):
+                for keyword_index, length in matched:
+                    yield position + 1 - length, position + 1, self.keywords[keyword_index]
+            return
+
+        words = list(TOKEN_PATTERN.finditer(folded))
+        for position, matched in self._scan([word.group() for word in words]):
+            for keyword_index, length in matched:
+                yield words[position + 1 - length].start(), words[position].end(), self.keywords[keyword_index]
+
+    def find_spans(self, text: str) -> List[Span]:
+        """Return every keyword occurrence in text (see iter_spans)."""
+        return list(self.iter_spans(text))
+
+    def find_keywords(self, text: str) -> List[str]:
+        """
+        Get the keywords occurring in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matched keywords, each once, in order of first occurrence
+        """
+        if not text or not self.keywords:
+            return []
+
+        found = {}
+        for _, matched in self._scan(self._symbols(_fold_case(text))):
+            for keyword_index, _ in matched:
+                found.setdefault(keyword_index, None)
+        return [self.keywords[keyword_index] for keyword_index in found]
+
+    def matches_any(self, text: str) -> bool:
+        """Check whether any keyword occurs in text, stopping at the first match."""
+        if not text or not self.keywords:
+            return False
+        return next(self._scan(self._symbols(_fold_case(text))), None) is not None
+
+
+@lru_cache(maxsize=32)
+def get_keyword_matcher(keywords: Tuple[str, ...], whole_words: bool = False) -> KeywordMatcher:
+    """
+    Get a compiled matcher, reusing it for repeated keyword lists.
+
+    Args:
+        keywords: Keywords as a tuple (so the list can be cached)
+        whole_words: Match whole words instead of substrings
+
+    Returns:
+        KeywordMatcher for the keywords
+    """
+    return KeywordMatcher(keywords, whole_words)
@@ -0,0 +1,231 @@
+"""
+Near-duplicate detection for the Journal Lookup Tool.
+Finds papers whose title and abstract opening are nearly identical
+(preprints, corrections, errata) with MinHash signatures bucketed by
+locality-sensitive hashing, so candidates are found without comparing
+every pair of papers.
+"""
+
+import random
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from core.paper_processor import MARKUP_PATTERN, NON_WORD_PATTERN, merge_paper_records
+
+try:
+    import numpy
+except ImportError:  # Optional; signatures are computed in pure Python without it
+    numpy = None
+
+
+DEFAULT_THRESHOLD = 0.8  # Minimum Jaccard similarity of shingle sets
+NUM_PERMUTATIONS = 64  # MinHash signature length
+SHINGLE_SIZE = 2  # Words per shingle
+ABSTRACT_PREFIX_CHARS = 300  # Only the start of the abstract is compared
+NEAR_DUPLICATE_ACTIONS = ("flag", "merge")
+
+MAX_HASH = (1 << 32) - 1
+
+
+def paper_shingles(component: Dict[str, Any], shingle_size: int = SHINGLE_SIZE) -> FrozenSet[int]:
+    """
+    Get hashed word shingles of a paper's title and abstract opening.
+
+    Args:
+        component: Paper component
+        shingle_size: Words per shingle
+
+    Returns:
+        Set of 32-bit shingle hashes (empty if the paper has no usable text)
+    """
+    parts = []
+    for key, limit in (("Title", None), ("Abstract", ABSTRACT_PREFIX_CHARS)):
+        text = component.get(key)
+        if isinstance(text, str) and not text.startswith("No "):
+            parts.append(text[:limit])
+
+    text = MARKUP_PATTERN.sub(" ", " ".join(parts)).lower()
+    words = NON_WORD_PATTERN.sub(" ", text).split()
+    if len(words) < shingle_size:
+        return frozenset((hash(tuple(words)) & MAX_HASH,)) if words else frozenset()
+
+    # Consecutive word tuples, hashed without building joined strings
+    return frozenset([
+        hash(shingle) & MAX_HASH
+        for shingle in zip(*(words[offset:] for offset in range(shingle_size)))
+    ])
+
+
+def make_permutations(num_perm: int = NUM_PERMUTATIONS, seed: int = 1) -> List[int]:
+    """
+    Create the random masks that stand in for MinHash permutations.
+
+    Shingle hashes are already well mixed, so XOR with a random mask
+    reorders them like an independent hash function at a fraction of the
+    cost of modular arithmetic. Candidates are verified with the exact
+    Jaccard similarity, so the approximation cannot create false matches.
+    """
+    rng = random.Random(seed)
+    return [rng.getrandbits(32) for _ in range(num_perm)]
+
+
+def minhash_signature(shingles: FrozenSet[int], permutations: List[int]) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a shingle set.
+
+    Args:
+        shingles: Shingle hashes from paper_shingles
+        permutations: Masks from make_permutations
+
+    Returns:
+        Tuple with the minimum hash under each permutation
+    """
+    if numpy is not None:
+        values = numpy.fromiter(shingles, dtype=numpy.uint32, count=len(shingles))
+        masks = numpy.array(permutations, dtype=numpy.uint32)
+        return tuple((values[None, :] ^ masks[:, None]).min(axis=1).tolist())
+
+    values = list(shingles)
+    return tuple(min([value ^ mask for value in values]) for mask in permutations)
+
+
+def lsh_parameters(threshold: float, num_perm: int = NUM_PERMUTATIONS) -> Tuple[int, int]:
+    """
+    Choose LSH bands and rows whose similarity cut-off is closest to the threshold.
+
+    Two signatures share a bucket with probability 1 - (1 - s^rows)^bands,
+    which rises steeply around s = (1 / bands)^(1 / rows).
+
+    Args:
+        threshold: Target Jaccard similarity
+        num_perm: Signature length
+
+    Returns:
+        Tuple of (bands, rows) with bands * rows <= num_perm
+    """
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        # Bias slightly low so pairs just above the threshold are still candidates
+        error = abs((1 / bands) ** (1 / rows) - (threshold - 0.05))
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def _find(parents: List[int], item: int) -> int:
+    """Find the cluster root of an item, compressing the path."""
+    root = item
+    while parents[root] != root:
+        root = parents[root]
+    while parents[item] != root:
+        parents[item], item = root, parents[item]
+    return root
+
+
+def find_near_duplicates(
+    components: List[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = NUM_PERMUTATIONS,
+    shingle_size: int = SHINGLE_SIZE
+) -> List[List[int]]:
+    """
+    Group papers whose title and abstract opening are near-duplicates.
+
+    Papers sharing an LSH bucket are candidates; a candidate pair joins a
+    cluster only if the exact Jaccard similarity of its shingle sets is at
+    least the threshold.
+
+    Args:
+        components: Paper components
+        threshold: Minimum Jaccard similarity (0-1)
+        num_perm: MinHash signature length
+        shingle_size: Words per shingle
+
+    Returns:
+        Clusters of component indices (two or more each, in input order)
+    """
+    permutations = make_permutations(num_perm)
+    bands, rows = lsh_parameters(threshold, num_perm)
+
+    shingle_sets = [paper_shingles(component, shingle_size) for component in components]
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    for index, shingles in enumerate(shingle_sets):
+        if not shingles:
+            continue
+        signature = minhash_signature(shingles, permutations)
+        for band in range(bands):
+            key = (band, signature[band * rows:(band + 1) * rows])
+            buckets.setdefault(key, []).append(index)
+
+    parents = list(range(len(components)))
+    for members in buckets.values():
+        for position, first in enumerate(members):
+            for second in members[position + 1:]:
+                first_root, second_root = _find(parents, first), _find(parents, second)
+                if first_root == second_root:
+                    continue
+                a, b = shingle_sets[first], shingle_sets[second]
+                if len(a & b) >= threshold * len(a | b):
+                    parents[max(first_root, second_root)] = min(first_root, second_root)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(components)):
+        clusters.setdefault(_find(parents, index), []).append(index)
+    return [members for members in clusters.values() if len(members) > 1]
+
+
+def merge_near_duplicates(
+    components: List[Dict[str, Any]],
+    clusters: List[List[int]]
+) -> List[Dict[str, Any]]:
+    """
+    Keep the first paper of each cluster, filling its gaps from the others.
+
+    Args:
+        components: Paper components
+        clusters: Clusters from find_near_duplicates
+
+    Returns:
+        Components with the later members of each cluster removed
+    """
+    merged: Dict[int, Dict[str, Any]] = {}
+    dropped = set()
+    for members in clusters:
+        kept = components[members[0]].copy()
+        for index in members[1:]:
+            merge_paper_records(kept, components[index])
+            dropped.add(index)
+        merged[members[0]] = kept
+
+    return [
+        merged.get(index, component)
+        for index, component in enumerate(components)
+        if index not in dropped
+    ]
+
+
+def handle_near_duplicates(
+    components: List[Dict[str, Any]],
+    action: Optional[str],
+    threshold: float = DEFAULT_THRESHOLD
+) -> Tuple[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+    """
+    Run the near-duplicate stage on one result category.
+
+    Args:
+        components: Paper components
+        action: "flag" to report clusters, "merge" to also merge them, or
+            None to skip the stage
+        threshold: Minimum Jaccard similarity
+
+    Returns:
+        Tuple of (components, clusters as lists of components)
+    """
+    if not action or len(components) < 2:
+        return components, []
+
+    clusters = find_near_duplicates(components, threshold)
+    cluster_components = [[components[index] for index in members] for members in clusters]
+    if action == "merge":
+        components = merge_near_duplicates(components, clusters)
+    return components, cluster_components
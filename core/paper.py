@@ -0,0 +1,185 @@
+"""
+Compact paper record for the Journal Lookup Tool.
+Stores a standardized paper component in a slotted object with tuple-backed
+list fields and interned source labels, while still answering the dict-style
+lookups ("Title", "Authors", ...) the output modules use.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, Mapping, Tuple
+
+
+# Component keys and the slots that hold them, in output order
+FIELD_SLOTS = {
+    "Title": "title",
+    "Journal": "journal",
+    "Link": "link",
+    "Authors": "authors",
+    "Keywords": "keywords",
+    "Institution": "institution",
+    "Abstract": "abstract",
+    "Date": "date",
+    "Source": "source",
+    "PMID": "pmid",
+    "Search Terms": "search_terms"
+}
+
+# Fields stored as tuples (returned as lists through the dict-style accessors)
+TUPLE_FIELDS = frozenset(("authors", "keywords", "institution", "search_terms"))
+
+# Fields with few distinct values, shared between records via sys.intern
+INTERNED_FIELDS = frozenset(("journal", "source"))
+
+# Values used when a source does not provide a field
+FIELD_DEFAULTS = {
+    "title": "No title available",
+    "journal": "No journal available",
+    "link": "No link available",
+    "authors": ("No authors available",),
+    "keywords": ("No keywords available",),
+    "institution": ("No institution listed",),
+    "abstract": "No abstract available",
+    "date": "No date available",
+    "source": "unknown",
+    "pmid": "",
+    "search_terms": ()  # Configured keywords or author names whose searches found the paper
+}
+
+
+def _normalize(slot: str, value: Any) -> Any:
+    """Convert a field value to its stored form."""
+    if slot in TUPLE_FIELDS:
+        if isinstance(value, str):
+            return (str(value),)
+        return tuple(str(item) if isinstance(item, str) else item for item in value or ())
+    if isinstance(value, str):
+        # Entrez StringElement carries an attribute dict per value; keep the text
+        value = str(value)
+        if slot in INTERNED_FIELDS:
+            value = sys.intern(value)
+    return value
+
+
+class Paper:
+    """Standardized paper component with slotted, typed fields."""
+
+    __slots__ = tuple(FIELD_SLOTS.values())
+
+    title: str
+    journal: str
+    link: str
+    authors: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+    institution: Tuple[str, ...]
+    abstract: str
+    date: Any
+    source: str
+    pmid: str
+    search_terms: Tuple[str, ...]
+
+    def __init__(self, **fields: Any):
+        """
+        Create a paper record.
+
+        Args:
+            **fields: Slot values (title, journal, link, authors, keywords,
+                institution, abstract, date, source, pmid, search_terms); missing fields
+                get the usual "No ... available" placeholders
+        """
+        unknown = set(fields) - set(self.__slots__)
+        if unknown:
+            raise TypeError(f"Unknown Paper field(s): {', '.join(sorted(unknown))}")
+
+        for slot in self.__slots__:
+            object.__setattr__(self, slot, _normalize(slot, fields.get(slot, FIELD_DEFAULTS[slot])))
+
+    def __setattr__(self, slot: str, value: Any) -> None:
+        object.__setattr__(self, slot, _normalize(slot, value))
+
+    @classmethod
+    def from_dict(cls, component: Mapping[str, Any], **overrides: Any) -> "Paper":
+        """
+        Build a paper record from a component dictionary.
+
+        Args:
+            component: Component with "Title", "Authors", ... keys; other
+                keys (such as search metadata) are ignored
+            **overrides: Slot values replacing those from the component
+
+        Returns:
+            Paper record
+        """
+        fields = {
+            slot: component[key]
+            for key, slot in FIELD_SLOTS.items()
+            if key in component
+        }
+        fields.update(overrides)
+        return cls(**fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the component as a plain dictionary with list fields."""
+        return dict(self.items())
+
+    def copy(self) -> "Paper":
+        """Return a copy of the record (its tuples are shared, not copied)."""
+        duplicate = object.__new__(Paper)
+        for slot in self.__slots__:
+            object.__setattr__(duplicate, slot, getattr(self, slot))
+        return duplicate
+
+    # Dict-style access, so code written for component dictionaries keeps working
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            slot = FIELD_SLOTS[key]
+        except KeyError:
+            raise KeyError(key) from None
+        value = getattr(self, slot)
+        return list(value) if slot in TUPLE_FIELDS else value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            slot = FIELD_SLOTS[key]
+        except KeyError:
+            raise KeyError(f"Paper has no field {key!r}") from None
+        setattr(self, slot, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field by component key, or default for unknown keys."""
+        if key in FIELD_SLOTS:
+            return self[key]
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in FIELD_SLOTS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELD_SLOTS)
+
+    def __len__(self) -> int:
+        return len(FIELD_SLOTS)
+
+    def keys(self) -> Iterable[str]:
+        """Return the component keys."""
+        return FIELD_SLOTS.keys()
+
+    def values(self) -> Iterator[Any]:
+        """Return the field values in key order."""
+        return (self[key] for key in FIELD_SLOTS)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """Return (key, value) pairs in key order."""
+        return ((key, self[key]) for key in FIELD_SLOTS)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Paper):
+            return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # Mutable, like the dictionaries it replaces
+
+    def __repr__(self) -> str:
+        return f"Paper(title={self.title!r}, source={self.source!r})"
@@ -3,8 +3,19 @@ Paper processing utilities for the Journal Lookup Tool.
 Handles extraction and standardization of paper metadata from different sources.
 """
 
-from typing import List, Dict, Any, Tuple
+import hashlib
+import re
+from typing import List, Dict, Any, Optional, Tuple
 from core.date_utils import parse_api_date
+from core.keyword_matcher import get_keyword_matcher
+from core.paper import Paper
+
+
+# Identity keys in matching priority: a lower key only matches if no higher key conflicts
+IDENTITY_KEYS = ("doi", "pmid", "title")
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+MARKUP_PATTERN = re.compile(r"<[^>]+>")
+NON_WORD_PATTERN = re.compile(r"[\W_]+")
 
 
 
@@ -124,40 +135,255 @@ def extract_crossref_authors(paper: Dict[str, Any]) -> List[str]:
 
 
 
-def remove_duplicate_papers(components: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def normalize_doi(value: Any) -> str:
+    """
+    Normalize a DOI or DOI URL for comparison.
+    
+    Args:
+        value: DOI, doi.org URL or "doi:" reference
+        
+    Returns:
+        Lower-cased bare DOI ("10.x/y"), or "" if value is not a DOI
+    """
+    if not isinstance(value, str):
+        return ""
+    
+    doi = value.strip().lower()
+    for prefix in DOI_PREFIXES:
+        if doi.startswith(prefix):
+            doi = doi[len(prefix):]
+            break
+    return doi if doi.startswith("10.") else ""
+
+
+def title_fingerprint(title: Any) -> str:
+    """
+    Hash a title with markup, case, punctuation and spacing removed.
+    
+    Args:
+        title: Paper title
+        
+    Returns:
+        Hex digest, or "" for missing and placeholder titles
+    """
+    if not isinstance(title, str) or title.startswith("No title"):
+        return ""
+    
+    normalized = NON_WORD_PATTERN.sub(" ", MARKUP_PATTERN.sub(" ", title).lower()).strip()
+    if not normalized:
+        return ""
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def paper_identity(component: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Get the identity keys of a paper component.
+    
+    Args:
+        component: Paper component
+        
+    Returns:
+        Dictionary with 'doi', 'pmid' and 'title' keys ("" when unknown)
+    """
+    return {
+        "doi": normalize_doi(component.get("Link")),
+        "pmid": str(component.get("PMID") or ""),
+        "title": title_fingerprint(component.get("Title"))
+    }
+
+
+def is_placeholder(value: Any) -> bool:
+    """Check whether a field holds no data or only a "No ... available" placeholder."""
+    if not value:
+        return True
+    if isinstance(value, str):
+        return value.startswith("No ")
+    if isinstance(value, (list, tuple)):
+        return all(isinstance(item, str) and item.startswith("No ") for item in value)
+    return False
+
+
+def merge_paper_records(primary: Dict[str, Any], duplicate: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Fill fields missing from a paper with data from a duplicate record.
+    
+    Args:
+        primary: Record that is kept (modified in place)
+        duplicate: Record for the same work, e.g. from another source
+        
+    Returns:
+        The primary record
+    """
+    for key, value in duplicate.items():
+        if key == "Source" or key not in primary:
+            continue
+        if key == "Search Terms":
+            # Keep every search that found either record
+            primary[key] = list(dict.fromkeys(list(primary.get(key) or []) + list(value or [])))
+        elif is_placeholder(primary.get(key)) and not is_placeholder(value):
+            primary[key] = value
+    
+    # Prefer a DOI link over a publisher or ELocationID link
+    if not normalize_doi(primary.get("Link")) and normalize_doi(duplicate.get("Link")):
+        primary["Link"] = duplicate.get("Link")
+    
+    return primary
+
+
+def _find_identity_match(
+    index: Dict[Tuple[str, str], int],
+    identities: List[Dict[str, str]],
+    identity: Dict[str, str]
+) -> Tuple[Optional[int], Optional[str]]:
+    """Find the first kept record sharing an identity key without a conflicting higher key."""
+    for level, kind in enumerate(IDENTITY_KEYS):
+        if not identity[kind]:
+            continue
+        
+        position = index.get((kind, identity[kind]))
+        if position is None:
+            continue
+        
+        # Different DOIs (or PMIDs) mean different works, even with equal titles
+        kept = identities[position]
+        if any(
+            identity[higher] and kept[higher] and identity[higher] != kept[higher]
+            for higher in IDENTITY_KEYS[:level]
+        ):
+            continue
+        return position, kind
+    
+    return None, None
+
+
+def deduplicate_papers(components: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """
-    Remove duplicate papers based on title.
+    Merge records of the same work using an identity index.
+    
+    Each record is looked up by normalized DOI, then PMID, then title hash,
+    so PubMed and CrossRef records of one paper collapse into a single
+    record enriched with the fields either source provides. The first
+    record of each work keeps its position and Source. Runs in O(n).
     
     Args:
-        components: List of paper component dictionaries
+        components: Paper components
         
     Returns:
-        Deduplicated list of paper components
+        Tuple of (unique components, statistics with 'records', 'unique'
+        and the number of records merged by 'doi', 'pmid' and 'title')
     """
-    seen_titles = set()
+    index: Dict[Tuple[str, str], int] = {}
+    identities: List[Dict[str, str]] = []
     unique_components = []
+    copied = set()
+    stats = {"records": len(components), "doi": 0, "pmid": 0, "title": 0}
     
     for component in components:
-        title = component.get("Title", "").strip().lower()
-        if title and title not in seen_titles:
-            seen_titles.add(title)
+        identity = paper_identity(component)
+        position, kind = _find_identity_match(index, identities, identity)
+        
+        if position is None:
+            position = len(unique_components)
             unique_components.append(component)
+            identities.append(identity)
+        else:
+            # Copy before the first merge so input records are never modified
+            if position not in copied:
+                unique_components[position] = unique_components[position].copy()
+                copied.add(position)
+            merge_paper_records(unique_components[position], component)
+            for key, value in identity.items():
+                identities[position][key] = identities[position][key] or value
+            stats[kind] += 1
+        
+        for key in IDENTITY_KEYS:
+            if identities[position][key]:
+                index.setdefault((key, identities[position][key]), position)
     
-    return unique_components
+    stats["unique"] = len(unique_components)
+    return unique_components, stats
+
 
+def remove_duplicate_papers(components: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Remove duplicate papers, merging records of the same work.
+    
+    Args:
+        components: List of paper components
+        
+    Returns:
+        Deduplicated list of paper components (see deduplicate_papers)
+    """
+    return deduplicate_papers(components)[0]
 
 
+def deduplicate_categories(
+    components_keyword: List[Dict[str, Any]],
+    components_orcid: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Merge records of the same work across keyword and ORCID results.
+    
+    Both categories go through one identity index, so a PubMed keyword
+    record and the CrossRef record of the same work become one paper. The
+    merged paper keeps the Source of its first record (keyword results
+    come first) and is returned in that category.
+    
+    Args:
+        components_keyword: Keyword-based components
+        components_orcid: ORCID-based components (PubMed author and CrossRef)
+        
+    Returns:
+        Tuple of (keyword components, ORCID components, statistics from
+        deduplicate_papers)
+    """
+    unique_components, stats = deduplicate_papers(components_keyword + components_orcid)
+    return split_categories(unique_components) + (stats,)
 
 
-def process_pubmed_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def split_categories(components: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Split components into keyword-based and ORCID-based results by Source.
+    
+    Args:
+        components: Paper components of both categories
+        
+    Returns:
+        Tuple of (keyword components, ORCID components), each in input order
+    """
+    keyword = [component for component in components if component.get("Source") == "keyword"]
+    orcid = [component for component in components if component.get("Source") != "keyword"]
+    return keyword, orcid
+
+
+def format_merge_stats(stats: Dict[str, int]) -> str:
+    """Describe deduplicate_papers statistics in one line."""
+    merged = stats["records"] - stats["unique"]
+    return (
+        f"merged {merged} duplicate record(s) "
+        f"(DOI: {stats['doi']}, PMID: {stats['pmid']}, title: {stats['title']})"
+    )
+
+
+
+
+
+def search_terms(paper: Dict[str, Any]) -> List[str]:
+    """Get the keywords or author names whose searches returned a fetched record."""
+    return list(paper.get("search_keywords") or paper.get("search_authors") or [])
+
+
+def process_pubmed_papers(papers: List[Dict[str, Any]]) -> List[Paper]:
     """
     Process PubMed papers into standardized format.
     
     Args:
-        papers: List of PubMed paper dictionaries
+        papers: List of PubMed paper dictionaries (Entrez.read records or
+            components from core.pubmed_parser), optionally tagged with
+            search_keywords or search_authors
         
     Returns:
-        List of standardized paper components
+        List of standardized paper records
     """
     components = []
     
@@ -167,11 +393,16 @@ def process_pubmed_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
             for article in paper["PubmedArticle"]:
                 if "MedlineCitation" in article and "Article" in article["MedlineCitation"]:
                     component = extract_pubmed_paper_info(article)
+                    component.search_terms = search_terms(paper)
                     components.append(component)
+        elif "Title" in paper and "Source" in paper:
+            # Already a component (streaming parser)
+            components.append(Paper.from_dict(paper, source="pubmed", search_terms=search_terms(paper)))
         else:
             # Handle direct article format
             if "MedlineCitation" in paper and "Article" in paper["MedlineCitation"]:
                 component = extract_pubmed_paper_info(paper)
+                component.search_terms = search_terms(paper)
                 components.append(component)
     
     return components
@@ -180,7 +411,7 @@ def process_pubmed_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 
-def process_crossref_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def process_crossref_papers(papers: List[Dict[str, Any]]) -> List[Paper]:
     """
     Process CrossRef papers into standardized format.
     
@@ -188,7 +419,7 @@ def process_crossref_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]
         papers: List of CrossRef paper dictionaries
         
     Returns:
-        List of standardized paper components
+        List of standardized paper records
     """
     components = []
     
@@ -205,8 +436,9 @@ def process_crossref_papers(papers: List[Dict[str, Any]]) -> List[Dict[str, Any]
 def process_papers(
     keyword_papers: List[Dict[str, Any]], 
     pubmed_author_papers: List[Dict[str, Any]], 
-    crossref_papers: List[Dict[str, Any]]
-) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    crossref_papers: List[Dict[str, Any]],
+    paper_store: Any = None
+) -> Tuple[List[Paper], List[Paper]]:
     """
     Process all papers and separate into keyword-based and ORCID-based results.
     
@@ -214,6 +446,8 @@ def process_papers(
         keyword_papers: Papers from keyword searches
         pubmed_author_papers: Papers from PubMed author searches
         crossref_papers: Papers from CrossRef ORCID searches
+        paper_store: Optional core.paper_store.PaperStore that every
+            processed paper is added to
         
     Returns:
         Tuple of (keyword_components, orcid_components)
@@ -221,24 +455,29 @@ def process_papers(
     # Process keyword-based papers
     components_keyword = process_pubmed_papers(keyword_papers)
     for component in components_keyword:
-        component["Source"] = "keyword"
+        component.source = "keyword"
     
     # Process PubMed author-based papers
     components_pubmed_author = process_pubmed_papers(pubmed_author_papers)
     for component in components_pubmed_author:
-        component["Source"] = "pubmed_author"
+        component.source = "pubmed_author"
     
     # Process CrossRef papers
     components_crossref = process_crossref_papers(crossref_papers)
     for component in components_crossref:
-        component["Source"] = "crossref"
+        component.source = "crossref"
     
     # Combine ORCID-based results
     components_orcid = components_pubmed_author + components_crossref
     
-    # Remove duplicates within each category
-    components_keyword = remove_duplicate_papers(components_keyword)
-    components_orcid = remove_duplicate_papers(components_orcid)
+    # Merge duplicates across both categories, so PubMed and CrossRef records of a work become one
+    components_keyword, components_orcid, stats = deduplicate_categories(components_keyword, components_orcid)
+    if stats["records"] > stats["unique"]:
+        print(f"   Keyword and author results: {format_merge_stats(stats)}")
+    
+    if paper_store is not None:
+        counts = paper_store.add_papers(components_keyword + components_orcid)
+        print(f"   Paper store: {counts['added']} new, {counts['updated']} already stored")
     
     return components_keyword, components_orcid
 
@@ -273,7 +512,8 @@ def filter_papers_by_criteria(
     
     Args:
         components: List of paper components
-        criteria: Filter criteria dictionary
+        criteria: Filter criteria dictionary ('journals', 'keywords', and
+            'whole_words' to match keywords only as whole words)
         
     Returns:
         Filtered list of components
@@ -291,14 +531,11 @@ def filter_papers_by_criteria(
     
     # Filter by keywords in title or abstract
     if criteria.get('keywords'):
-        target_keywords = [k.lower() for k in criteria['keywords']]
+        matcher = get_keyword_matcher(tuple(criteria['keywords']), criteria.get('whole_words', False))
         filtered = [
             comp for comp in filtered
-            if any(
-                keyword in comp.get('Title', '').lower() or 
-                keyword in comp.get('Abstract', '').lower()
-                for keyword in target_keywords
-            )
+            if matcher.matches_any(comp.get('Title', '')) or
+            matcher.matches_any(comp.get('Abstract', ''))
         ]
     
 
@@ -320,7 +557,8 @@ def enrich_paper_metadata(component: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Enriched component dictionary
     """
-    enriched = component.copy()
+    # Plain dictionary, since the computed fields are not Paper fields
+    enriched = dict(component)
     
     # Add computed fields
     enriched['has_abstract'] = bool(
@@ -498,28 +736,29 @@ def get_journal_frequencies(components: List[Dict[str, Any]]) -> Dict[str, int]:
 
 def extract_keywords_from_text(
     components: List[Dict[str, Any]], 
-    target_keywords: List[str]
+    target_keywords: List[str],
+    whole_words: bool = False
 ) -> Dict[str, List[Dict[str, Any]]]:
     """
     Extract papers that mention specific keywords in title or abstract.
     
+    All keywords are matched in a single pass over each paper's text.
+    
     Args:
         components: List of paper components
-        target_keywords: List of keywords to search for
+        target_keywords: List of keywords to search for (case-insensitive)
+        whole_words: Only count keywords not embedded in a longer word
         
     Returns:
         Dictionary mapping keywords to lists of matching papers
     """
     keyword_matches = {kw: [] for kw in target_keywords}
+    matcher = get_keyword_matcher(tuple(target_keywords), whole_words)
     
     for component in components:
-        title = component.get('Title', '').lower()
-        abstract = component.get('Abstract', '').lower()
-        text_content = f"{title} {abstract}"
-        
-        for keyword in target_keywords:
-            if keyword.lower() in text_content:
-                keyword_matches[keyword].append(component)
+        text_content = f"{component.get('Title', '')} {component.get('Abstract', '')}"
+        for keyword in matcher.find_keywords(text_content):
+            keyword_matches[keyword].append(component)
     
     return keyword_matches
 
@@ -613,7 +852,7 @@ def clean_paper_data(components: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 
-def extract_crossref_paper_info(paper: Dict[str, Any]) -> Dict[str, Any]:
+def extract_crossref_paper_info(paper: Dict[str, Any]) -> Paper:
     """
     Extract paper information from CrossRef format.
     
@@ -621,21 +860,19 @@ def extract_crossref_paper_info(paper: Dict[str, Any]) -> Dict[str, Any]:
         paper: CrossRef paper dictionary
         
     Returns:
-        Standardized paper component dictionary
-    """
-    component = {
-        "Title": extract_crossref_title(paper),
-        "Journal": extract_crossref_journal(paper),
-        "Link": paper.get("URL", "No link available"),
-        "Authors": extract_crossref_authors(paper),
-        "Keywords": ["No keywords (CrossRef)"],  # CrossRef rarely has keywords
-        "Institution": ["No institution listed (CrossRef)"],  # CrossRef rarely has institutions
-        "Abstract": paper.get("abstract", "No abstract available"),
-        "Date": parse_api_date(paper.get("issued"), "crossref"),
-        "Source": "crossref"
-    }
-    
-    return component
+        Standardized paper record
+    """
+    return Paper(
+        title=extract_crossref_title(paper),
+        journal=extract_crossref_journal(paper),
+        link=paper.get("URL", "No link available"),
+        authors=extract_crossref_authors(paper),
+        keywords=["No keywords (CrossRef)"],  # CrossRef rarely has keywords
+        institution=["No institution listed (CrossRef)"],  # CrossRef rarely has institutions
+        abstract=paper.get("abstract", "No abstract available"),
+        date=parse_api_date(paper.get("issued"), "crossref"),
+        source="crossref"
+    )
 
 
 
@@ -705,7 +942,7 @@ def extract_pubmed_link(article_data: Dict[str, Any]) -> str:
 
         
 
-def extract_pubmed_paper_info(article: Dict[str, Any]) -> Dict[str, Any]:
+def extract_pubmed_paper_info(article: Dict[str, Any]) -> Paper:
     """
     Extract paper information from PubMed article format.
     
@@ -713,24 +950,23 @@ def extract_pubmed_paper_info(article: Dict[str, Any]) -> Dict[str, Any]:
         article: PubMed article dictionary
         
     Returns:
-        Standardized paper component dictionary
+        Standardized paper record
     """
     citation = article.get("MedlineCitation", {})
     article_data = citation.get("Article", {})
     
-    component = {
-        "Title": article_data.get("ArticleTitle", "No title available"),
-        "Journal": article_data.get("Journal", {}).get("Title", "No journal available"),
-        "Link": extract_pubmed_link(article_data),
-        "Authors": extract_pubmed_authors(article_data),
-        "Keywords": extract_pubmed_keywords(citation),
-        "Institution": extract_pubmed_institutions(article_data),
-        "Abstract": extract_pubmed_abstract(article_data),
-        "Date": parse_api_date(article_data.get("ArticleDate"), "pubmed"),
-        "Source": "pubmed"
-    }
-    
-    return component
+    return Paper(
+        title=article_data.get("ArticleTitle", "No title available"),
+        journal=article_data.get("Journal", {}).get("Title", "No journal available"),
+        link=extract_pubmed_link(article_data),
+        authors=extract_pubmed_authors(article_data),
+        keywords=extract_pubmed_keywords(citation),
+        institution=extract_pubmed_institutions(article_data),
+        abstract=extract_pubmed_abstract(article_data),
+        date=parse_api_date(article_data.get("ArticleDate"), "pubmed"),
+        source="pubmed",
+        pmid=citation.get("PMID", "")
+    )
 
 
 
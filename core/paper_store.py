@@ -0,0 +1,250 @@
+"""
+Persistent paper store for the Journal Lookup Tool.
+Keeps every processed paper in SQLite with an FTS5 full-text index over
+title, abstract, keywords, authors and journal, so earlier results can be
+searched locally without querying PubMed or CrossRef again.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from core.paper import Paper
+from core.paper_processor import is_placeholder, paper_identity
+
+
+PAPER_STORE_FILENAME = "papers.sqlite"
+PAPER_SOURCES = ("keyword", "pubmed_author", "crossref")
+LIST_SEPARATOR = "; "
+
+# Columns indexed for full-text search and their BM25 weights
+FTS_COLUMNS = ("title", "abstract", "keywords", "authors", "journal")
+BM25_WEIGHTS = (10.0, 1.0, 5.0, 3.0, 2.0)
+
+# Paper fields stored as text columns (lists are joined with LIST_SEPARATOR)
+STORED_FIELDS = {
+    "title": "Title",
+    "journal": "Journal",
+    "link": "Link",
+    "authors": "Authors",
+    "keywords": "Keywords",
+    "institution": "Institution",
+    "abstract": "Abstract",
+    "date": "Date",
+    "source": "Source"
+}
+
+
+def _stored_value(value: Any) -> str:
+    """Convert a field to its stored text; placeholders are stored empty so they are not indexed."""
+    if is_placeholder(value):
+        return ""
+    if isinstance(value, (list, tuple)):
+        return LIST_SEPARATOR.join(str(item) for item in value if not is_placeholder(item))
+    return str(value)
+
+
+class PaperStore:
+    """SQLite store of processed papers with an FTS5 search index."""
+
+    def __init__(self, path: str):
+        """
+        Open (or create) a paper store.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.lock = threading.Lock()
+
+        columns = ", ".join(FTS_COLUMNS)
+        new_columns = ", ".join(f"new.{column}" for column in FTS_COLUMNS)
+        old_columns = ", ".join(f"old.{column}" for column in FTS_COLUMNS)
+
+        self.connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.connection.executescript(f"""
+            CREATE TABLE IF NOT EXISTS papers (
+                id INTEGER PRIMARY KEY,
+                doi TEXT NOT NULL DEFAULT '',
+                pmid TEXT NOT NULL DEFAULT '',
+                title_hash TEXT NOT NULL DEFAULT '',
+                title TEXT NOT NULL DEFAULT '',
+                journal TEXT NOT NULL DEFAULT '',
+                link TEXT NOT NULL DEFAULT '',
+                authors TEXT NOT NULL DEFAULT '',
+                keywords TEXT NOT NULL DEFAULT '',
+                institution TEXT NOT NULL DEFAULT '',
+                abstract TEXT NOT NULL DEFAULT '',
+                date TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL DEFAULT '',
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS papers_doi ON papers (doi);
+            CREATE INDEX IF NOT EXISTS papers_pmid ON papers (pmid);
+            CREATE INDEX IF NOT EXISTS papers_title_hash ON papers (title_hash);
+            CREATE INDEX IF NOT EXISTS papers_date ON papers (date);
+            CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+                {columns},
+                content='papers', content_rowid='id',
+                tokenize='porter unicode61 remove_diacritics 2'
+            );
+            CREATE TRIGGER IF NOT EXISTS papers_insert AFTER INSERT ON papers BEGIN
+                INSERT INTO papers_fts (rowid, {columns}) VALUES (new.id, {new_columns});
+            END;
+            CREATE TRIGGER IF NOT EXISTS papers_delete AFTER DELETE ON papers BEGIN
+                INSERT INTO papers_fts (papers_fts, rowid, {columns}) VALUES ('delete', old.id, {old_columns});
+            END;
+            CREATE TRIGGER IF NOT EXISTS papers_update AFTER UPDATE ON papers BEGIN
+                INSERT INTO papers_fts (papers_fts, rowid, {columns}) VALUES ('delete', old.id, {old_columns});
+                INSERT INTO papers_fts (rowid, {columns}) VALUES (new.id, {new_columns});
+            END;
+        """)
+        self.connection.commit()
+
+    def _find_existing(self, identity: Dict[str, str]) -> Optional[Tuple[Any, ...]]:
+        """Find the stored row for a paper by DOI, then PMID, then title hash (lock must be held)."""
+        for level, key in enumerate(("doi", "pmid", "title_hash")):
+            value = identity["title" if key == "title_hash" else key]
+            if not value:
+                continue
+
+            rows = self.connection.execute(
+                f"SELECT id, doi, pmid FROM papers WHERE {key} = ?", (value,)
+            ).fetchall()
+            for row in rows:
+                # Same rule as deduplicate_papers: a differing DOI or PMID means a different work
+                stored = {"doi": row[1], "pmid": row[2]}
+                if any(
+                    identity[higher] and stored[higher] and identity[higher] != stored[higher]
+                    for higher in ("doi", "pmid")[:level]
+                ):
+                    continue
+                return row
+        return None
+
+    def add_papers(self, components: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert new papers and fill in missing fields of known ones.
+
+        Args:
+            components: Paper components from process_papers
+
+        Returns:
+            Dictionary with the number of 'added' and 'updated' papers
+        """
+        now = time.time()
+        counts = {"added": 0, "updated": 0}
+
+        with self.lock:
+            for component in components:
+                identity = paper_identity(component)
+                values = {column: _stored_value(component.get(field)) for column, field in STORED_FIELDS.items()}
+                values.update(doi=identity["doi"], pmid=identity["pmid"], title_hash=identity["title"])
+
+                existing = self._find_existing(identity)
+                if existing is None:
+                    columns = list(values) + ["first_seen", "last_seen"]
+                    self.connection.execute(
+                        f"INSERT INTO papers ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                        list(values.values()) + [now, now]
+                    )
+                    counts["added"] += 1
+                else:
+                    # Keep stored values (and the first source); only fill empty columns
+                    assignments = ", ".join(
+                        f"{column} = CASE WHEN {column} = '' THEN ? ELSE {column} END" for column in values
+                    )
+                    self.connection.execute(
+                        f"UPDATE papers SET {assignments}, last_seen = ? WHERE id = ?",
+                        list(values.values()) + [now, existing[0]]
+                    )
+                    counts["updated"] += 1
+            self.connection.commit()
+
+        return counts
+
+    def search(
+        self,
+        query: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        sources: Optional[Sequence[str]] = None,
+        limit: int = 20
+    ) -> List[Tuple[Paper, float]]:
+        """
+        Full-text search ranked by BM25 (title and keyword hits weigh most).
+
+        Args:
+            query: FTS5 query, e.g. 'crispr AND "base editing"' or 'cas*'
+            start_date: Only papers dated on or after this YYYY/MM/DD date
+            end_date: Only papers dated on or before this YYYY/MM/DD date
+            sources: Only papers from these sources (see PAPER_SOURCES)
+            limit: Maximum number of results
+
+        Returns:
+            List of (paper, score) pairs, best match first (lower BM25
+            scores are better)
+
+        Raises:
+            sqlite3.OperationalError: If the query is not valid FTS5 syntax
+        """
+        conditions = ["papers_fts MATCH ?"]
+        parameters: List[Any] = [query]
+        if start_date:
+            conditions.append("p.date >= ?")
+            parameters.append(start_date)
+        if end_date:
+            # Zero-padded YYYY/MM/DD strings compare in date order
+            conditions.append("p.date <= ? AND p.date != ''")
+            parameters.append(end_date)
+        if sources:
+            conditions.append(f"p.source IN ({', '.join('?' * len(sources))})")
+            parameters.extend(sources)
+        parameters.append(limit)
+
+        weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+        columns = ", ".join(f"p.{column}" for column in list(STORED_FIELDS) + ["pmid"])
+        with self.lock:
+            rows = self.connection.execute(
+                f"SELECT {columns}, bm25(papers_fts, {weights}) AS score "
+                f"FROM papers_fts JOIN papers p ON p.id = papers_fts.rowid "
+                f"WHERE {' AND '.join(conditions)} ORDER BY score LIMIT ?",
+                parameters
+            ).fetchall()
+
+        results = []
+        for row in rows:
+            fields = dict(zip(list(STORED_FIELDS) + ["pmid"], row[:-1]))
+            for column in ("authors", "keywords", "institution"):
+                fields[column] = fields[column].split(LIST_SEPARATOR) if fields[column] else ()
+            # Empty columns fall back to the usual placeholders
+            paper = Paper(**{slot: value for slot, value in fields.items() if value or slot == "pmid"})
+            results.append((paper, row[-1]))
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        """Return the number of stored papers."""
+        with self.lock:
+            count = self.connection.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+        return {"papers": count}
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.connection.close()
+
+
+def open_paper_store(output_dir: str) -> PaperStore:
+    """
+    Open the paper store inside an output directory.
+
+    Args:
+        output_dir: Output directory path
+
+    Returns:
+        PaperStore instance
+    """
+    return PaperStore(Path(output_dir) / PAPER_STORE_FILENAME)
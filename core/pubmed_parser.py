@@ -0,0 +1,134 @@
+"""
+Streaming PubMed XML parser for the Journal Lookup Tool.
+Builds paper components straight from EFetch XML with ElementTree.iterparse,
+keeping only the fields the output stage uses and freeing each article as
+soon as it has been read.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Union
+from core.date_utils import parse_api_date
+
+
+def _text(element: ET.Element) -> str:
+    """Return all text inside an element, dropping any child tags."""
+    if element is None:
+        return ""
+    return "".join(element.itertext()).strip()
+
+
+def _inner_markup(element: ET.Element) -> str:
+    """Return element content keeping inline tags such as <i> and <sup>, like Entrez.read."""
+    parts = [element.text or ""]
+    for child in element:
+        tag = child.tag.split("}")[-1]  # Drop namespaces (e.g. MathML)
+        parts.append(f"<{tag}>{_inner_markup(child)}</{tag}>")
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _extract_link(article: ET.Element) -> str:
+    """Return the DOI URL, or the first ELocationID if no DOI is listed."""
+    locations = article.findall("ELocationID")
+    for location in locations:
+        if location.get("EIdType") == "doi":
+            return f"https://doi.org/{_text(location)}"
+
+    if locations:
+        return _text(locations[0])
+    return "No link available"
+
+
+def _extract_authors_and_institutions(article: ET.Element) -> Tuple[List[str], List[str]]:
+    """Return author names and affiliations from the AuthorList."""
+    authors = []
+    institutions = []
+
+    for author in article.iterfind("AuthorList/Author"):
+        fore_name = _text(author.find("ForeName"))
+        last_name = _text(author.find("LastName"))
+        if fore_name and last_name:
+            authors.append(f"{fore_name} {last_name}")
+        elif last_name:
+            authors.append(last_name)
+
+        for affiliation in author.iterfind("AffiliationInfo/Affiliation"):
+            institutions.append(_text(affiliation))
+
+    return authors, institutions
+
+
+def _extract_date(article: ET.Element) -> str:
+    """Return the electronic publication date as YYYY/MM/DD."""
+    article_dates = []
+    for article_date in article.iterfind("ArticleDate"):
+        article_dates.append({
+            child.tag: _text(child) for child in article_date
+        })
+    return parse_api_date(article_dates, "pubmed")
+
+
+def component_from_element(pubmed_article: ET.Element) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build a paper component from a PubmedArticle element.
+
+    Args:
+        pubmed_article: PubmedArticle element
+
+    Returns:
+        Tuple of (pmid, component) using the same fields and placeholders
+        as extract_pubmed_paper_info
+    """
+    citation = pubmed_article.find("MedlineCitation")
+    if citation is None:
+        return "", {}
+    article = citation.find("Article")
+    if article is None:
+        return "", {}
+
+    pmid = _text(citation.find("PMID"))
+    authors, institutions = _extract_authors_and_institutions(article)
+    keywords = [_text(keyword) for keyword in citation.iterfind("KeywordList/Keyword")]
+    title = article.find("ArticleTitle")
+    abstract = article.find("Abstract/AbstractText")
+
+    component = {
+        "Title": _inner_markup(title).strip() if title is not None else "No title available",
+        "Journal": _text(article.find("Journal/Title")) or "No journal available",
+        "Link": _extract_link(article),
+        "Authors": authors or ["No authors available"],
+        "Keywords": keywords or ["No keywords available"],
+        "Institution": institutions or ["No institution listed"],
+        "Abstract": _inner_markup(abstract).strip() if abstract is not None else "No abstract available",
+        "Date": _extract_date(article),
+        "Source": "pubmed",
+        "PMID": pmid
+    }
+
+    return pmid, component
+
+
+def iter_pubmed_components(source: Union[str, BinaryIO]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream paper components from a PubmedArticleSet document.
+
+    Args:
+        source: File path or binary file object with EFetch XML
+
+    Yields:
+        Tuples of (pmid, component), one per PubmedArticle
+    """
+    root = None
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+
+        if element.tag == "PubmedArticle":
+            pmid, component = component_from_element(element)
+            if pmid and component:
+                yield pmid, component
+            # Drop the finished article so memory stays at one record
+            element.clear()
+            root.clear()
@@ -0,0 +1,241 @@
+"""
+Incremental run state for the Journal Lookup Tool.
+Keeps per-topic and per-ORCID watermarks (the date each search last covered
+successfully) in the configuration directory, so later runs only query the
+interval since then and merge the results with the previous output.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+from core.paper import Paper
+from core.paper_processor import IDENTITY_KEYS, paper_identity
+from output_modules.file_writers import open_results_file, results_path
+
+
+RUN_STATE_FILENAME = "run_state.json"
+RUN_STATE_VERSION = 1
+
+# Watermark groups in the state file and the config keys they track
+WATERMARK_GROUPS = {
+    "topics": "topics",
+    "orcids": "orcids"
+}
+
+
+def load_run_state(config_dir: str) -> Dict[str, Any]:
+    """
+    Load the run state stored next to a configuration.
+
+    Args:
+        config_dir: Configuration directory path
+
+    Returns:
+        State dictionary with one watermark mapping per group (empty if
+        no state has been saved yet or the file is unreadable)
+    """
+    state = {"version": RUN_STATE_VERSION}
+    state.update({group: {} for group in WATERMARK_GROUPS})
+
+    state_path = Path(config_dir) / RUN_STATE_FILENAME
+    if not state_path.exists():
+        return state
+
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️  Ignoring unreadable run state {state_path}: {e}")
+        return state
+
+    for group in WATERMARK_GROUPS:
+        state[group].update(stored.get(group, {}))
+    state["updated_at"] = stored.get("updated_at")
+    return state
+
+
+def save_run_state(config_dir: str, state: Dict[str, Any]) -> None:
+    """
+    Write the run state atomically.
+
+    Args:
+        config_dir: Configuration directory path
+        state: State dictionary from load_run_state
+    """
+    state_path = Path(config_dir) / RUN_STATE_FILENAME
+    state["version"] = RUN_STATE_VERSION
+    state["updated_at"] = datetime.now().isoformat()
+
+    temp_path = state_path.with_suffix(".tmp")
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, state_path)
+
+
+def covered_until(end_date: str) -> str:
+    """
+    Get the date a completed search window actually covers up to.
+
+    Args:
+        end_date: Requested end date in YYYY/MM/DD format (often far future)
+
+    Returns:
+        The earlier of end_date and today, in YYYY/MM/DD format
+    """
+    today = datetime.now().strftime("%Y/%m/%d")
+    # Zero-padded YYYY/MM/DD strings compare in date order
+    return min(end_date, today)
+
+
+def plan_incremental_windows(
+    config: Dict[str, Any],
+    state: Dict[str, Any],
+    default_range: Tuple[str, str]
+) -> List[Tuple[Tuple[str, str], Dict[str, Any]]]:
+    """
+    Split the configured searches into windows starting at their watermarks.
+
+    Each topic and ORCID starts at its watermark (inclusive, so the last
+    covered day is queried again and late additions are not missed) or, if
+    it has never completed, at the default start date. Entries sharing a
+    start date are grouped so they still run as one search.
+
+    Args:
+        config: Configuration dictionary
+        state: State dictionary from load_run_state
+        default_range: (start_date, end_date) used for entries without a watermark
+
+    Returns:
+        List of ((start_date, end_date), config) pairs, where each config is
+        a copy restricted to the topics and ORCIDs of that window
+    """
+    default_start, end_date = default_range
+    starts: Dict[str, Dict[str, List[str]]] = {}
+
+    for group, config_key in WATERMARK_GROUPS.items():
+        for entry in config.get(config_key, []):
+            start_date = state[group].get(entry, default_start)
+            if start_date > end_date:
+                continue
+            window = starts.setdefault(start_date, {key: [] for key in WATERMARK_GROUPS.values()})
+            window[config_key].append(entry)
+
+    windows = []
+    for start_date in sorted(starts):
+        window_config = dict(config)
+        window_config.update(starts[start_date])
+        # PubMed author searches are keyed by name and not tracked separately
+        window_config["named_authors"] = [
+            author for author in config.get("named_authors", [])
+            if author.get("orcid") in starts[start_date]["orcids"]
+        ]
+        windows.append(((start_date, end_date), window_config))
+
+    return windows
+
+
+def record_completed_windows(
+    state: Dict[str, Any],
+    windows: List[Tuple[Tuple[str, str], Dict[str, Any]]],
+    mode: str
+) -> None:
+    """
+    Advance watermarks for every topic and ORCID searched in completed windows.
+
+    Args:
+        state: State dictionary to update in place
+        windows: Windows from plan_incremental_windows that finished
+        mode: Search mode ("keywords", "authors", or "both")
+    """
+    for (_, end_date), window_config in windows:
+        watermark = covered_until(end_date)
+        if mode in ["keywords", "both"]:
+            for topic in window_config.get("topics", []):
+                state["topics"][topic] = watermark
+        if mode in ["authors", "both"]:
+            for orcid in window_config.get("orcids", []):
+                state["orcids"][orcid] = watermark
+
+
+def load_previous_results(output_dir: str) -> Dict[str, Any]:
+    """
+    Load the results.json (or results.json.gz) written by the previous run.
+
+    Args:
+        output_dir: Output directory path
+
+    Returns:
+        Previous results dictionary, or an empty dictionary if unavailable
+    """
+    path = results_path(output_dir)
+    if not path.exists():
+        return {}
+
+    try:
+        with open_results_file(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"   ⚠️  Could not read previous results {path}: {e}")
+        return {}
+
+
+def merge_previous_results(
+    previous: Dict[str, Any],
+    components_keyword: List[Dict[str, Any]],
+    components_orcid: List[Dict[str, Any]],
+    keyword_frequencies: Dict[str, int]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Merge newly found components with those of the previous run.
+
+    New components come first; duplicates are resolved by the caller's
+    usual deduplication. Keyword frequencies are summed, except that hits
+    on papers the previous results already hold (those on the re-queried
+    watermark day) are not counted again.
+
+    Args:
+        previous: Previous results from load_previous_results
+        components_keyword: New keyword-based components
+        components_orcid: New ORCID-based components
+        keyword_frequencies: New keyword hit counts
+
+    Returns:
+        Tuple of (components_keyword, components_orcid, keyword_frequencies)
+    """
+    previous_keyword = []
+    previous_orcid = []
+    for component in previous.get("components", []):
+        paper = Paper.from_dict(component)
+        if paper.source == "keyword":
+            previous_keyword.append(paper)
+        else:
+            previous_orcid.append(paper)
+
+    previous_identities = {
+        (key, value)
+        for paper in previous_keyword
+        for key, value in paper_identity(paper).items()
+        if value
+    }
+
+    merged_frequencies = dict(keyword_frequencies)
+    for component in components_keyword:
+        identity = paper_identity(component)
+        if not any((key, identity[key]) in previous_identities for key in IDENTITY_KEYS if identity[key]):
+            continue
+        # The previous counts already include this paper's hits
+        for keyword in component.get("Search Terms") or []:
+            if merged_frequencies.get(keyword):
+                merged_frequencies[keyword] -= 1
+
+    for keyword, count in previous.get("keyword_frequency_dict", {}).items():
+        if keyword in merged_frequencies:
+            merged_frequencies[keyword] += count
+
+    return (
+        components_keyword + previous_keyword,
+        components_orcid + previous_orcid,
+        merged_frequencies
+    )
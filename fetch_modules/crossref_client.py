@@ -3,109 +3,274 @@ CrossRef API client for the Journal Lookup Tool.
 Handles fetching publications from CrossRef using ORCID IDs and other criteria.
 """
 
+import json
 import requests
-import time
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Iterator, Sequence, Tuple, Optional
 from core.date_utils import format_date_for_api
-from utils.display import print_progress
+from core.paper_processor import normalize_doi
+from fetch_modules.executor import DEFAULT_MAX_WORKERS, run_ordered
+from fetch_modules.http_cache import CachingAdapter, HttpCache
+from fetch_modules.rate_limiter import CROSSREF_HOST, RateLimiter, get_rate_limiter
+from fetch_modules.run_journal import RunJournal
+
+try:
+    import orjson
+except ImportError:  # Optional faster JSON decoder
+    orjson = None
 
 
 # CrossRef API configuration
 CROSSREF_BASE_URL = "https://api.crossref.org/works"
 DEFAULT_USER_AGENT = "JournalClubPublicationWatcher/3.7.0"
 REQUEST_TIMEOUT = 30
-RATE_LIMIT_DELAY = 1.0  # seconds between requests
+MAX_ROWS = 1000  # CrossRef limit on rows per request
+ORCIDS_PER_REQUEST = 10  # Repeated orcid: filters are ORed together in one request
+
+# Work fields used by extract_crossref_paper_info (editor is needed to match ORCIDs)
+DEFAULT_SELECT_FIELDS = ("DOI", "title", "container-title", "URL", "author", "editor", "abstract", "issued")
 
 
 class CrossRefClient:
     """Client for interacting with the CrossRef API."""
     
-    def __init__(self, email: str = None, user_agent: str = None):
+    def __init__(
+        self,
+        email: str = None,
+        user_agent: str = None,
+        rate_limiter: RateLimiter = None,
+        select: Optional[Sequence[str]] = DEFAULT_SELECT_FIELDS,
+        http_cache: HttpCache = None
+    ):
         """
         Initialize CrossRef client.
         
         Args:
             email: Contact email for API requests
             user_agent: Custom user agent string
+            rate_limiter: Rate limiter to use (default: shared limiter)
+            select: Work fields to request from search queries, or None for
+                full records
+            http_cache: Optional on-disk response cache; responses are
+                revalidated with If-None-Match/If-Modified-Since
         """
         self.email = email
+        self.select = list(select) if select else None
         self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.rate_limiter = rate_limiter or get_rate_limiter()
         self.session = requests.Session()
         self.session.headers.update({
             "User-Agent": self.user_agent
         })
+        if http_cache is not None:
+            self.session.mount("https://", CachingAdapter(http_cache))
         
         # Update user agent with email if provided
         if email:
             self.session.headers["User-Agent"] = f"{self.user_agent} (mailto:{email})"
     
-    def search_by_orcid(
-        self, 
-        orcid: str, 
-        start_date: str, 
-        end_date: str, 
-        rows: int = 100,
+    def _get(self, url: str, params: Dict[str, Any] = None) -> requests.Response:
+        """
+        Send a GET request under the shared rate limiter.
+        
+        The CrossRef budget follows the X-Rate-Limit-* response headers and
+        slows down on throttling or server errors.
+        
+        Args:
+            url: Request URL
+            params: Optional query parameters
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            requests.RequestException: On network or HTTP errors
+        """
+        self.rate_limiter.acquire(CROSSREF_HOST)
+        try:
+            response = self.session.get(url, params=params, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            self.rate_limiter.report_failure(CROSSREF_HOST)
+            raise
+        
+        self.rate_limiter.update_from_headers(CROSSREF_HOST, response.headers)
+        if response.status_code >= 400:
+            self.rate_limiter.report_failure(
+                CROSSREF_HOST,
+                response.status_code,
+                response.headers.get("Retry-After")
+            )
+        else:
+            self.rate_limiter.report_success(CROSSREF_HOST)
+        
+        response.raise_for_status()
+        return response
+    
+    def _with_select(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the select= field projection to search parameters."""
+        if self.select:
+            params["select"] = ",".join(self.select)
+        return params
+    
+    def iter_pages(
+        self,
+        params: Dict[str, Any],
+        rows: int = MAX_ROWS,
+        max_results: int = None
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Page through a /works query with cursor-based deep paging.
+        
+        Args:
+            params: Query parameters (filter, sort, order, ...) without rows/cursor
+            rows: Results per page (at most MAX_ROWS)
+            max_results: Optional cap on the total number of results
+            
+        Yields:
+            Lists of work items, one per page
+            
+        Raises:
+            requests.RequestException: On network or HTTP errors
+        """
+        page_params = self._with_select(dict(params))
+        page_params["cursor"] = "*"
+        fetched = 0
+        
+        while True:
+            page_rows = min(rows, MAX_ROWS)
+            if max_results is not None:
+                page_rows = min(page_rows, max_results - fetched)
+                if page_rows <= 0:
+                    return
+            page_params["rows"] = page_rows
+            
+            message = decode_json(self._get(CROSSREF_BASE_URL, params=page_params)).get("message", {})
+            items = message.get("items", [])
+            if not items:
+                return
+            
+            fetched += len(items)
+            yield items
+            
+            next_cursor = message.get("next-cursor")
+            total = message.get("total-results", 0)
+            if not next_cursor or len(items) < page_rows or fetched >= total:
+                return
+            page_params["cursor"] = next_cursor
+    
+    def search_by_orcids(
+        self,
+        orcids: List[str],
+        start_date: str,
+        end_date: str,
+        rows: int = MAX_ROWS,
+        max_results: int = None,
         sort: str = "published",
         order: str = "desc"
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Search for publications by ORCID ID within a date range.
+        Search for publications by several ORCID IDs in one paged request.
+        
+        The ORCIDs are sent as repeated orcid: filters, which CrossRef ORs
+        together, and every page is fetched with deep paging. Results are
+        split back out by matching each work's author ORCIDs.
         
         Args:
-            orcid: ORCID identifier (with or without URL prefix)
+            orcids: ORCID identifiers (with or without URL prefix)
             start_date: Start date in YYYY/MM/DD format
             end_date: End date in YYYY/MM/DD format
-            rows: Maximum number of results to return
+            rows: Results per page
+            max_results: Optional cap on the total number of results
             sort: Sort field (published, relevance, etc.)
             order: Sort order (asc, desc)
             
         Returns:
-            List of publication dictionaries
+            Dictionary mapping each clean ORCID to its publications, in input
+            order; a work by several requested authors is listed under the
+            first of them, with all of them in 'query_orcids'
         """
-        # Clean ORCID (remove URL prefix if present)
-        clean_orcid = orcid.replace("https://orcid.org/", "").replace("http://orcid.org/", "")
+        clean_orcids = list(dict.fromkeys(clean_orcid_id(orcid) for orcid in orcids))
+        results = {orcid: [] for orcid in clean_orcids}
+        if not clean_orcids:
+            return results
         
         # Convert dates to CrossRef format
         crossref_start = format_date_for_api(start_date, 'crossref')
         crossref_end = format_date_for_api(end_date, 'crossref')
         
         # Build filter string
-        filters = [
-            f"orcid:{clean_orcid}",
+        filters = [f"orcid:{orcid}" for orcid in clean_orcids]
+        filters += [
             f"from-pub-date:{crossref_start}",
             f"until-pub-date:{crossref_end}"
         ]
         
         params = {
             "filter": ",".join(filters),
-            "rows": min(rows, 1000),  # CrossRef limit
             "sort": sort,
             "order": order
         }
+        label = ", ".join(clean_orcids)
         
         try:
-            print(f"   Searching CrossRef for ORCID: {clean_orcid}")
-            response = self.session.get(
-                CROSSREF_BASE_URL, 
-                params=params, 
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            items = data.get("message", {}).get("items", [])
+            print(f"   Searching CrossRef for ORCID(s): {label}")
+            items = []
+            for page in self.iter_pages(params, rows=rows, max_results=max_results):
+                items.extend(page)
+        except requests.RequestException as e:
+            print(f"   ❌ Error fetching CrossRef data for ORCID(s) {label}: {e}")
+            return results
+        
+        for item in items:
+            work_orcids = set(get_work_orcids(item))
+            matched = [orcid for orcid in clean_orcids if orcid in work_orcids]
+            if not matched:
+                # Filter matched on a contributor ORCID we cannot see; keep the
+                # work with the first requested ORCID rather than dropping it
+                matched = clean_orcids[:1]
             
             # Add source metadata
-            for item in items:
-                item["Source"] = "crossref"
-                item["query_orcid"] = clean_orcid
-            
-            print(f"   Found {len(items)} papers for ORCID {clean_orcid}")
-            return items
+            item["Source"] = "crossref"
+            item["query_orcid"] = matched[0]
+            item["query_orcids"] = matched
+            results[matched[0]].append(item)
+        
+        for orcid, publications in results.items():
+            print(f"   Found {len(publications)} papers for ORCID {orcid}")
+        return results
+    
+    def search_by_orcid(
+        self, 
+        orcid: str, 
+        start_date: str, 
+        end_date: str, 
+        rows: int = MAX_ROWS,
+        sort: str = "published",
+        order: str = "desc",
+        max_results: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for publications by ORCID ID within a date range.
+        
+        Args:
+            orcid: ORCID identifier (with or without URL prefix)
+            start_date: Start date in YYYY/MM/DD format
+            end_date: End date in YYYY/MM/DD format
+            rows: Results per page (all pages are fetched)
+            sort: Sort field (published, relevance, etc.)
+            order: Sort order (asc, desc)
+            max_results: Optional cap on the total number of results
             
-        except requests.RequestException as e:
-            print(f"   ❌ Error fetching CrossRef data for ORCID {clean_orcid}: {e}")
-            return []
+        Returns:
+            List of publication dictionaries
+        """
+        results = self.search_by_orcids(
+            [orcid], start_date, end_date,
+            rows=rows,
+            max_results=max_results,
+            sort=sort,
+            order=order
+        )
+        return results.get(clean_orcid_id(orcid), [])
     
     def search_by_query(
         self,
@@ -128,10 +293,10 @@ class CrossRefClient:
         Returns:
             List of publication dictionaries
         """
-        params = {
+        params = self._with_select({
             "query": query,
-            "rows": min(rows, 1000)
-        }
+            "rows": min(rows, MAX_ROWS)
+        })
         
         # Add date filters if provided
         filter_list = []
@@ -153,14 +318,9 @@ class CrossRefClient:
         
         try:
             print(f"   Searching CrossRef with query: {query}")
-            response = self.session.get(
-                CROSSREF_BASE_URL,
-                params=params,
-                timeout=REQUEST_TIMEOUT
-            )
-            response.raise_for_status()
+            response = self._get(CROSSREF_BASE_URL, params=params)
             
-            data = response.json()
+            data = decode_json(response)
             items = data.get("message", {}).get("items", [])
             
             # Add source metadata
@@ -190,10 +350,9 @@ class CrossRefClient:
         url = f"{CROSSREF_BASE_URL}/{clean_doi}"
         
         try:
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
+            response = self._get(url)
             
-            data = response.json()
+            data = decode_json(response)
             work = data.get("message", {})
             work["Source"] = "crossref"
             
@@ -207,8 +366,14 @@ class CrossRefClient:
 def lookup_crossref(
     orcids: List[str], 
     start_end_date: Tuple[str, str], 
-    rows: int = 100,
-    email: str = None
+    rows: int = MAX_ROWS,
+    max_results: int = None,
+    email: str = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    orcids_per_request: int = ORCIDS_PER_REQUEST,
+    select: Optional[Sequence[str]] = DEFAULT_SELECT_FIELDS,
+    http_cache: HttpCache = None,
+    journal: RunJournal = None
 ) -> List[Dict[str, Any]]:
     """
     Fetch publications associated with ORCID IDs using CrossRef API.
@@ -216,8 +381,15 @@ def lookup_crossref(
     Args:
         orcids: List of ORCID identifiers
         start_end_date: Tuple of (start_date, end_date) in YYYY/MM/DD format
-        rows: Maximum results per ORCID
+        rows: Results per page (all pages are fetched)
+        max_results: Optional cap on the number of results per ORCID group
         email: Contact email for API requests
+        max_workers: Maximum number of concurrent CrossRef requests
+        orcids_per_request: Number of ORCIDs combined into one request
+        select: Work fields to download, or None for full records
+        http_cache: Optional on-disk HTTP response cache
+        journal: Optional run journal; ORCID groups already in it are not
+            searched again
         
     Returns:
         List of publication dictionaries from CrossRef
@@ -227,36 +399,57 @@ def lookup_crossref(
         return []
     
     start_date, end_date = start_end_date
-    client = CrossRefClient(email=email)
-    all_publications = []
+    client = CrossRefClient(email=email, select=select, http_cache=http_cache)
     
     print(f"  Searching CrossRef for {len(orcids)} ORCID(s)...")
     
-    for i, orcid in enumerate(orcids):
-        # Rate limiting
-        if i > 0:
-            time.sleep(RATE_LIMIT_DELAY)
-        
-        # Show progress
-        print_progress(i + 1, len(orcids), "CrossRef search")
+    def search_orcids(orcid_group: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        journal_key = f"{start_date}|{end_date}|{','.join(orcid_group)}"
+        if journal is not None:
+            results = journal.get_query("crossref", journal_key)
+            if results is not None:
+                return results
         
         try:
-            publications = client.search_by_orcid(
-                orcid=orcid,
+            results = client.search_by_orcids(
+                orcids=orcid_group,
                 start_date=start_date,
                 end_date=end_date,
-                rows=rows
+                rows=rows,
+                max_results=max_results
             )
-            all_publications.extend(publications)
-            
         except Exception as e:
-            print(f"   ❌ Unexpected error for ORCID {orcid}: {e}")
-            continue
+            print(f"   ❌ Unexpected error for ORCID(s) {', '.join(orcid_group)}: {e}")
+            return {}
+        
+        # Request errors yield empty lists, so only groups with results are journaled
+        if journal is not None and any(results.values()):
+            journal.record_query("crossref", journal_key, results)
+        return results
+    
+    groups = [
+        orcids[i:i + orcids_per_request]
+        for i in range(0, len(orcids), max(1, orcids_per_request))
+    ]
+    
+    # Groups run concurrently; results are merged in config order
+    all_publications = []
+    for grouped_results in run_ordered(search_orcids, groups, max_workers, "CrossRef search"):
+        for publications in grouped_results.values():
+            all_publications.extend(publications)
     
     # Remove duplicates based on DOI
     unique_publications = remove_duplicate_dois(all_publications)
     
     print(f"  CrossRef search completed: {len(unique_publications)} unique papers found")
+    
+    if http_cache is not None:
+        stats = http_cache.stats()
+        print(
+            f"   CrossRef HTTP cache: {stats['revalidated']} unchanged (304), "
+            f"{stats['downloaded']} downloaded, {stats['bytes_saved'] / 1024:.0f} KB not re-downloaded"
+        )
+    
     return unique_publications
 
 
@@ -265,7 +458,9 @@ def search_crossref_by_keywords(
     start_end_date: Tuple[str, str],
     journals: List[str] = None,
     rows: int = 100,
-    email: str = None
+    email: str = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    select: Optional[Sequence[str]] = DEFAULT_SELECT_FIELDS
 ) -> List[Dict[str, Any]]:
     """
     Search CrossRef by keywords and optional journal filters.
@@ -276,6 +471,8 @@ def search_crossref_by_keywords(
         journals: Optional list of journal names to filter
         rows: Maximum results per keyword
         email: Contact email for API requests
+        max_workers: Maximum number of concurrent keyword queries
+        select: Work fields to download, or None for full records
         
     Returns:
         List of publication dictionaries
@@ -285,26 +482,19 @@ def search_crossref_by_keywords(
         return []
     
     start_date, end_date = start_end_date
-    client = CrossRefClient(email=email)
-    all_publications = []
+    client = CrossRefClient(email=email, select=select)
     
     print(f"  Searching CrossRef by keywords...")
     
-    for i, keyword in enumerate(keywords):
-        # Rate limiting
-        if i > 0:
-            time.sleep(RATE_LIMIT_DELAY)
-        
-        print_progress(i + 1, len(keywords), "Keyword search")
-        
-        # Build filters
-        filters = {}
-        if journals:
-            # CrossRef uses container-title for journal names
-            # This is a simplified approach - more sophisticated matching may be needed
-            journal_query = " OR ".join(f'"{journal}"' for journal in journals)
-            filters["container-title"] = journal_query
-        
+    # Build filters
+    filters = {}
+    if journals:
+        # CrossRef uses container-title for journal names
+        # This is a simplified approach - more sophisticated matching may be needed
+        journal_query = " OR ".join(f'"{journal}"' for journal in journals)
+        filters["container-title"] = journal_query
+    
+    def search_keyword(keyword: str) -> List[Dict[str, Any]]:
         try:
             publications = client.search_by_query(
                 query=keyword,
@@ -318,11 +508,15 @@ def search_crossref_by_keywords(
             for pub in publications:
                 pub["search_keyword"] = keyword
             
-            all_publications.extend(publications)
+            return publications
             
         except Exception as e:
             print(f"   Unexpected error for keyword '{keyword}': {e}")
-            continue
+            return []
+    
+    all_publications = []
+    for publications in run_ordered(search_keyword, keywords, max_workers, "Keyword search"):
+        all_publications.extend(publications)
     
     # Remove duplicates
     unique_publications = remove_duplicate_dois(all_publications)
@@ -345,7 +539,7 @@ def remove_duplicate_dois(publications: List[Dict[str, Any]]) -> List[Dict[str,
     unique_pubs = []
     
     for pub in publications:
-        doi = pub.get("DOI", "").lower()
+        doi = normalize_doi(pub.get("DOI", ""))
         if doi and doi not in seen_dois:
             seen_dois.add(doi)
             unique_pubs.append(pub)
@@ -359,6 +553,56 @@ def remove_duplicate_dois(publications: List[Dict[str, Any]]) -> List[Dict[str,
 
 
 
+def decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+    
+    Args:
+        response: HTTP response
+        
+    Returns:
+        Decoded JSON data
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def clean_orcid_id(orcid: str) -> str:
+    """
+    Strip the URL prefix from an ORCID identifier.
+    
+    Args:
+        orcid: ORCID identifier (with or without URL prefix)
+        
+    Returns:
+        Bare ORCID in 0000-0000-0000-0000 form (X check digit upper-cased)
+    """
+    clean_orcid = orcid.strip()
+    for prefix in ("https://orcid.org/", "http://orcid.org/"):
+        if clean_orcid.lower().startswith(prefix):
+            clean_orcid = clean_orcid[len(prefix):]
+    return clean_orcid.upper()
+
+
+def get_work_orcids(publication: Dict[str, Any]) -> List[str]:
+    """
+    Get the clean ORCIDs of a work's authors and editors.
+    
+    Args:
+        publication: CrossRef publication dictionary
+        
+    Returns:
+        List of bare ORCID identifiers
+    """
+    orcids = []
+    for role in ("author", "editor"):
+        for person in publication.get(role, []):
+            if person.get("ORCID"):
+                orcids.append(clean_orcid_id(person["ORCID"]))
+    return orcids
+
+
 def validate_orcid(orcid: str) -> bool:
     """
     Validate ORCID format.
@@ -404,7 +648,7 @@ def get_crossref_api_status() -> Dict[str, Any]:
         }
         
         if response.status_code == 200:
-            data = response.json()
+            data = decode_json(response)
             message = data.get("message", {})
             status_info["total_results"] = message.get("total-results", 0)
         
@@ -0,0 +1,104 @@
+"""
+Concurrent query execution for the Journal Lookup Tool.
+Runs independent API queries on a bounded thread pool while returning
+results in the same order as the inputs.
+"""
+
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterable, List, Optional
+from utils.display import buffered_output, print_progress
+
+
+DEFAULT_MAX_WORKERS = 4  # Concurrent queries; the rate limiter still caps requests per host
+
+
+def run_ordered(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    progress_label: Optional[str] = None,
+    buffer_output: bool = False
+) -> List[Any]:
+    """
+    Apply a function to every item on a bounded worker pool.
+
+    Results are returned in input order regardless of completion order, so
+    callers that build dictionaries from them stay deterministic. With
+    max_workers <= 1 the items are processed sequentially in the calling
+    thread. Workers inherit the caller's context, including any output
+    buffer (see utils.display.buffered_output).
+
+    Args:
+        func: Function called once per item
+        items: Items to process
+        max_workers: Maximum number of concurrent workers
+        progress_label: Optional label for a progress bar
+        buffer_output: Collect what each call prints and show it in input
+            order, instead of letting concurrent calls interleave their lines
+
+    Returns:
+        List of results, one per item, in input order
+
+    Raises:
+        Exception: The first exception raised by func, after all
+            submitted work has finished
+    """
+    items = list(items)
+    total = len(items)
+    if not items:
+        return []
+
+    if max_workers <= 1 or total == 1:
+        results = []
+        for index, item in enumerate(items):
+            results.append(func(item))
+            if progress_label:
+                print_progress(index + 1, total, progress_label)
+        return results
+
+    results = [None] * total
+    outputs: List[Optional[str]] = [None] * total
+    printed = 0
+
+    def call(index: int, item: Any) -> Any:
+        if not buffer_output:
+            return func(item)
+        with buffered_output() as buffer:
+            try:
+                return func(item)
+            finally:
+                outputs[index] = buffer.getvalue()
+
+    def print_outputs(progress_shown: bool, finished: bool = False) -> None:
+        # Show collected output in input order, as far as it is complete
+        nonlocal printed
+        ready = []
+        while printed < total and (outputs[printed] is not None or finished):
+            ready.append(outputs[printed] or "")
+            printed += 1
+        text = "".join(ready)
+        if text:
+            if progress_shown:
+                print()  # Finish the progress bar line first
+            print(text, end="" if text.endswith("\n") else "\n")
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, total)) as pool:
+            # Each call gets its own copy of the caller's context
+            futures = {
+                pool.submit(contextvars.copy_context().run, call, index, item): index
+                for index, item in enumerate(items)
+            }
+
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if buffer_output:
+                    print_outputs(progress_shown=bool(progress_label) and done > 1)
+                if progress_label:
+                    print_progress(done, total, progress_label)
+    finally:
+        if buffer_output:
+            print_outputs(progress_shown=False, finished=True)
+
+    return results
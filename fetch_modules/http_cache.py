@@ -0,0 +1,298 @@
+"""
+HTTP response cache for the Journal Lookup Tool.
+Provides a requests transport adapter that stores GET responses in SQLite
+and revalidates them with If-None-Match/If-Modified-Since, so unchanged
+CrossRef results come back as small 304 responses. Only the first page of a
+cursor-paged search has a stable URL, so later pages are not stored.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from fetch_modules.record_cache import DEFAULT_CACHE_DIR
+
+
+HTTP_CACHE_FILENAME = "http_responses.sqlite"
+DEFAULT_TTL_DAYS = 7  # Entries older than this are dropped
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # Compressed size limit before LRU eviction
+FIRST_CURSOR = "*"  # CrossRef cursor of the first page of a deep-paged search
+
+# Headers that describe the transferred body rather than the stored one
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+class HttpCache:
+    """SQLite-backed store of GET responses with their validators."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Open (or create) an HTTP response cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_days: Age in days after which stored responses are dropped
+            max_bytes: Maximum total compressed size before eviction
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+        self.revalidated = 0
+        self.downloaded = 0
+        self.bytes_saved = 0
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+        """)
+        self.connection.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a stored response.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Dictionary with status, headers, body, etag and last_modified, or None
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT status, headers, body, etag, last_modified FROM responses "
+                "WHERE url = ? AND stored_at >= ?",
+                (url, time.time() - self.ttl_seconds)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, headers, body, etag, last_modified = row
+        return {
+            "status": status,
+            "headers": json.loads(headers),
+            "body": zlib.decompress(body),
+            "etag": etag,
+            "last_modified": last_modified
+        }
+
+    def put(self, url: str, response: Response) -> None:
+        """
+        Store a response that carries an ETag or Last-Modified validator.
+
+        Args:
+            url: Full request URL
+            response: Response whose content has been read
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+
+        headers = {
+            key: value for key, value in response.headers.items()
+            if key.lower() not in DROPPED_HEADERS
+        }
+        body = zlib.compress(response.content)
+        now = time.time()
+
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, headers, body, size, etag, last_modified, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.status_code, json.dumps(headers), body, len(body),
+                 etag, last_modified, now, now)
+            )
+            self._evict()
+            self.connection.commit()
+
+    def touch(self, url: str) -> None:
+        """Mark a stored response as fresh after a successful revalidation."""
+        now = time.time()
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url)
+            )
+            self.connection.commit()
+
+    def _evict(self) -> None:
+        """Drop expired responses, then least recently used ones above max_bytes (lock must be held)."""
+        self.connection.execute(
+            "DELETE FROM responses WHERE stored_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        victims = []
+        for url, size in self.connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ):
+            victims.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        self.connection.executemany("DELETE FROM responses WHERE url = ?", victims)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with revalidated (304) and downloaded response counts,
+            body bytes not re-downloaded, and stored response count
+        """
+        with self.lock:
+            count = self.connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return {
+            "revalidated": self.revalidated,
+            "downloaded": self.downloaded,
+            "bytes_saved": self.bytes_saved,
+            "responses": count
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self.lock:
+            self.connection.close()
+
+
+class CachingAdapter(HTTPAdapter):
+    """Transport adapter that revalidates GET requests against an HttpCache."""
+
+    def __init__(self, cache: HttpCache, **kwargs):
+        """
+        Initialize caching adapter.
+
+        Args:
+            cache: Response store
+            **kwargs: Passed to requests.adapters.HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self.cache = cache
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        """Send a request, adding validators and answering 304s from the cache."""
+        if request.method != "GET" or is_cursor_continuation(request.url):
+            return super().send(request, **kwargs)
+
+        cached = self.cache.get(request.url)
+        if cached:
+            if cached["etag"]:
+                request.headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                request.headers["If-Modified-Since"] = cached["last_modified"]
+
+        response = super().send(request, **kwargs)
+
+        if cached and response.status_code == 304:
+            response.close()
+            self.cache.touch(request.url)
+            with self.cache.lock:
+                self.cache.revalidated += 1
+                self.cache.bytes_saved += len(cached["body"])
+            return build_cached_response(request, cached, response)
+
+        if response.status_code == 200 and not kwargs.get("stream"):
+            self.cache.put(request.url, response)
+            with self.cache.lock:
+                self.cache.downloaded += 1
+
+        return response
+
+
+def is_cursor_continuation(url: str) -> bool:
+    """
+    Tell whether a URL requests a later page of a cursor-paged search.
+
+    Each such page carries a one-off cursor token, so its URL is never
+    requested again and caching it would only fill the store.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        True if the URL has a cursor other than the first-page cursor
+    """
+    cursors = parse_qs(urlsplit(url).query).get("cursor")
+    return bool(cursors) and cursors[0] != FIRST_CURSOR
+
+
+def build_cached_response(
+    request: PreparedRequest,
+    cached: Dict[str, Any],
+    revalidation: Response
+) -> Response:
+    """
+    Rebuild a full response from a stored entry after a 304.
+
+    Args:
+        request: Request that was revalidated
+        cached: Stored entry from HttpCache.get
+        revalidation: The 304 response (its headers update the stored ones)
+
+    Returns:
+        Response carrying the stored status and body
+    """
+    headers = CaseInsensitiveDict(cached["headers"])
+    for key, value in revalidation.headers.items():
+        if key.lower() not in DROPPED_HEADERS:
+            headers[key] = value
+
+    response = Response()
+    response.status_code = cached["status"]
+    response.headers = headers
+    response._content = cached["body"]
+    response.url = request.url
+    response.request = request
+    response.reason = "OK"
+    response.encoding = get_encoding_from_headers(headers)
+    response.elapsed = revalidation.elapsed
+    response.connection = revalidation.connection
+    response.from_cache = True
+    return response
+
+
+def open_http_cache(cache_dir: str = DEFAULT_CACHE_DIR) -> HttpCache:
+    """
+    Open the HTTP response cache inside a cache directory.
+
+    Args:
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        HttpCache instance
+    """
+    return HttpCache(Path(cache_dir) / HTTP_CACHE_FILENAME)
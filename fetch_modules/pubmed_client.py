@@ -3,34 +3,130 @@ PubMed API client for the Journal Lookup Tool.
 Handles fetching publications from PubMed using keywords and author searches.
 """
 
+import io
+import re
 import time
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from urllib.error import HTTPError
 from Bio import Entrez
-from utils.display import print_progress
+from core.pubmed_parser import iter_pubmed_components
+from fetch_modules.executor import DEFAULT_MAX_WORKERS, run_ordered
+from fetch_modules.rate_limiter import NCBI_HOST, RateLimiter, configure_ncbi_api_key, get_rate_limiter
+from fetch_modules.record_cache import RecordCache
+from fetch_modules.run_journal import RunJournal
 
 
 # PubMed API configuration
 DEFAULT_RETRY_ATTEMPTS = 2
-API_DELAY = 1.0  # seconds between requests
+API_DELAY = 1.0  # Base delay between retry attempts (seconds)
 MAX_RESULTS = 1000  # Maximum results per query
+EFETCH_BATCH_SIZE = 200  # PMIDs per EFetch request
+HISTORY_PAGE_SIZE = 5000  # PMIDs per page when reading a search from the history server
+PARSERS = ("entrez", "stream")  # Entrez.read records, or components built by iterparse
+DEFAULT_PARSER = "entrez"
+
+# Raw XML handling for the record cache
+ARTICLE_PATTERN = re.compile(rb"<PubmedArticle[\s>].*?</PubmedArticle>", re.DOTALL)
+PMID_PATTERN = re.compile(rb"<PMID[^>]*>\s*(\d+)\s*</PMID>")
 
 
 class PubMedClient:
     """Client for interacting with the PubMed API using Biopython."""
     
-    def __init__(self, email: str, tool: str = "JournalLookupTool"):
+    def __init__(
+        self,
+        email: str,
+        tool: str = "JournalLookupTool",
+        use_history: bool = False,
+        api_key: str = None,
+        rate_limiter: RateLimiter = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        record_cache: RecordCache = None,
+        parser: str = DEFAULT_PARSER,
+        journal: RunJournal = None
+    ):
         """
         Initialize PubMed client.
         
         Args:
             email: Contact email for API requests (required by NCBI)
             tool: Tool name for API requests
+            use_history: Stream results from the ESearch history server
+                instead of downloading PMID lists (no MAX_RESULTS cap)
+            api_key: Optional NCBI API key (raises the budget to 10 req/s)
+            rate_limiter: Rate limiter to use (default: shared limiter)
+            max_workers: Maximum number of concurrent ESearch/EFetch calls
+            record_cache: Optional on-disk cache of fetched records
+            parser: "entrez" to return Entrez.read records, or "stream" to
+                build paper components directly with the streaming parser
+            journal: Optional run journal that checkpoints finished ESearch
+                queries and fetched records for --resume
         """
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown PubMed parser: {parser}")
+        
         self.email = email
         self.tool = tool
+        self.use_history = use_history
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.max_workers = max_workers
+        self.record_cache = record_cache
+        self.parser = parser
+        self.journal = journal
         Entrez.email = email
         Entrez.tool = tool
+        if api_key:
+            Entrez.api_key = api_key
+            configure_ncbi_api_key(api_key, self.rate_limiter)
+    
+    def _entrez_request(self, entrez_function: Callable, **params) -> bytes:
+        """
+        Call an Entrez utility under the shared rate limiter and return the raw response.
+        
+        Throttling and server errors slow the NCBI budget down before the
+        error is re-raised; successful calls let it recover.
+        
+        Args:
+            entrez_function: Entrez function such as Entrez.esearch
+            **params: Parameters passed to the Entrez function
+            
+        Returns:
+            Raw response body
+        """
+        self.rate_limiter.acquire(NCBI_HOST)
+        try:
+            handle = entrez_function(**params)
+            try:
+                result = handle.read()
+            finally:
+                handle.close()
+        except HTTPError as e:
+            retry_after = e.headers.get("Retry-After") if e.headers else None
+            self.rate_limiter.report_failure(NCBI_HOST, e.code, retry_after)
+            raise
+        except OSError:
+            # Network errors (timeouts, resets) count as failures too
+            self.rate_limiter.report_failure(NCBI_HOST)
+            raise
+        
+        self.rate_limiter.report_success(NCBI_HOST)
+        if isinstance(result, str):
+            result = result.encode("utf-8")
+        return result
+    
+    def _entrez_read(self, entrez_function: Callable, **params) -> Any:
+        """
+        Call an Entrez utility under the shared rate limiter and parse the response.
+        
+        Args:
+            entrez_function: Entrez function such as Entrez.esearch
+            **params: Parameters passed to the Entrez function
+            
+        Returns:
+            Parsed Entrez result
+        """
+        raw = self._entrez_request(entrez_function, **params)
+        return Entrez.read(io.BytesIO(raw))
     
     def search_pmids(self, query: str, retmax: int = MAX_RESULTS) -> List[str]:
         """
@@ -43,25 +139,151 @@ class PubMedClient:
         Returns:
             List of PMID strings
         """
+        journal_key = f"{retmax}:{query}"
+        if self.journal is not None:
+            pmids = self.journal.get_query("esearch", journal_key)
+            if pmids is not None:
+                return pmids
+        
         try:
             # print(f"   Executing PubMed query: {query}")
-            handle = Entrez.esearch(
+            search_results = self._entrez_read(
+                Entrez.esearch,
                 db="pubmed",
                 term=query,
                 retmax=retmax,
                 sort="relevance"
             )
-            search_results = Entrez.read(handle)
-            handle.close()
             
             pmids = search_results.get("IdList", [])
             # print(f"   Found {len(pmids)} PMIDs")
+            
+            total_count = int(search_results.get("Count", len(pmids)))
+            if total_count > len(pmids):
+                print(
+                    f"   ⚠️  Query matched {total_count} papers, only the first {len(pmids)} "
+                    "will be fetched (use --use-history for the full set)"
+                )
+            
+            pmids = [str(pmid) for pmid in pmids]
+            if self.journal is not None and pmids:
+                # Failed searches also return [], so only non-empty results are journaled
+                self.journal.record_query("esearch", journal_key, pmids)
             return pmids
             
         except Exception as e:
             print(f"   Error in PubMed search: {e}")
             return []
     
+    def count_query(self, query: str) -> Optional[int]:
+        """
+        Get the total number of papers matching a query without fetching any IDs.
+        
+        Args:
+            query: PubMed search query
+            
+        Returns:
+            Number of matching papers (not capped at MAX_RESULTS), or None on error
+        """
+        try:
+            search_results = self._entrez_read(
+                Entrez.esearch,
+                db="pubmed",
+                term=query,
+                rettype="count"
+            )
+            return int(search_results.get("Count", 0))
+            
+        except Exception as e:
+            print(f"   Error in PubMed count query: {e}")
+            return None
+    
+    def count_keywords(
+        self,
+        keywords: List[str],
+        start_date: str,
+        end_date: str,
+        journals: List[str] = None
+    ) -> Dict[str, Optional[int]]:
+        """
+        Count matching papers for each keyword with concurrent count-only ESearch requests.
+        
+        Args:
+            keywords: List of search keywords
+            start_date: Start date in YYYY/MM/DD format
+            end_date: End date in YYYY/MM/DD format
+            journals: Optional list of journal names to restrict search
+            
+        Returns:
+            Dictionary mapping each keyword to its hit count (None on error),
+            in config order
+        """
+        queries = [
+            self.build_keyword_query(keyword, start_date, end_date, journals)
+            for keyword in keywords
+        ]
+        counts = run_ordered(self.count_query, queries, max_workers=self.max_workers)
+        return dict(zip(keywords, counts))
+    
+    def search_history(self, query: str) -> Dict[str, Any]:
+        """
+        Run an ESearch that stores its results on the NCBI history server.
+        
+        Args:
+            query: PubMed search query
+            
+        Returns:
+            Dictionary with 'count', 'webenv' and 'query_key' (count is 0 on error)
+        """
+        try:
+            search_results = self._entrez_read(
+                Entrez.esearch,
+                db="pubmed",
+                term=query,
+                retmax=0,
+                sort="relevance",
+                usehistory="y"
+            )
+            
+            return {
+                "count": int(search_results.get("Count", 0)),
+                "webenv": search_results.get("WebEnv"),
+                "query_key": search_results.get("QueryKey")
+            }
+            
+        except Exception as e:
+            print(f"   Error in PubMed history search: {e}")
+            return {"count": 0, "webenv": None, "query_key": None}
+    
+    def iter_history_pmids(
+        self,
+        history: Dict[str, Any],
+        page_size: int = HISTORY_PAGE_SIZE,
+        retry_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    ) -> Iterator[List[str]]:
+        """
+        Stream the PMIDs of a stored ESearch result page by page.
+        
+        Only PMID lists (EFetch rettype=uilist) are read, so the records
+        themselves can be fetched once per PMID, from the cache where
+        possible, by fetch_papers_batch.
+        
+        Args:
+            history: Result of search_history
+            page_size: Number of PMIDs per EFetch page
+            retry_attempts: Number of retry attempts per page
+            
+        Yields:
+            Lists of PMIDs, one per page
+        """
+        count = history.get("count", 0)
+        if not count or not history.get("webenv"):
+            return
+        
+        for retstart in range(0, count, page_size):
+            retmax = min(page_size, count - retstart)
+            yield self._fetch_history_page(history, retstart, retmax, retry_attempts)
+    
     def fetch_paper_details(self, pmid: str, retry_attempts: int = DEFAULT_RETRY_ATTEMPTS) -> Dict[str, Any]:
         """
         Fetch detailed paper information for a given PMID.
@@ -73,18 +295,14 @@ class PubMedClient:
         Returns:
             Paper details dictionary or None if failed
         """
+        pmid = str(pmid)
+        cached = self._load_cached_records([pmid])
+        if pmid in cached:
+            return cached[pmid]
+        
         for attempt in range(retry_attempts):
             try:
-                time.sleep(API_DELAY)  # Rate limiting
-                
-                handle = Entrez.efetch(
-                    db="pubmed",
-                    id=pmid,
-                    rettype="medline",
-                    retmode="xml"
-                )
-                paper_data = Entrez.read(handle)
-                handle.close()
+                paper_data = self._efetch_articles([pmid]).get(pmid)
                 
                 return paper_data
                 
@@ -93,14 +311,185 @@ class PubMedClient:
                 if attempt == retry_attempts - 1:
                     print(f"   Failed to fetch PMID {pmid} after {retry_attempts} attempts")
                     return None
-                time.sleep(API_DELAY * (attempt + 1))  # Exponential backoff
                 
             except Exception as e:
                 print(f"   Unexpected error for PMID {pmid}: {e}")
                 return None
+            
+            time.sleep(API_DELAY * (attempt + 1))  # Back off before retrying
         
         return None
     
+    def fetch_papers_batch(
+        self,
+        pmids: List[str],
+        batch_size: int = EFETCH_BATCH_SIZE,
+        retry_attempts: int = DEFAULT_RETRY_ATTEMPTS,
+        progress_label: Optional[str] = "Fetching papers"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch paper details for many PMIDs using batched EFetch requests.
+        
+        Each batch is posted as a single EFetch call and the returned
+        PubmedArticleSet is parsed once. PMIDs found in the record cache or
+        the run journal are not requested at all. Batches run on the client's worker pool and
+        batches that keep failing are bisected so one bad record cannot
+        sink its neighbours; connection and throttling errors fail the
+        batch without splitting it.
+        
+        Args:
+            pmids: PubMed IDs to fetch
+            batch_size: Number of PMIDs per EFetch request
+            retry_attempts: Number of retry attempts per batch
+            progress_label: Label for the progress bar
+            
+        Returns:
+            Dictionary mapping PMID to a paper record shaped like the
+            result of fetch_paper_details
+        """
+        unique_pmids = list(dict.fromkeys(str(pmid) for pmid in pmids))
+        
+        records = self._load_cached_records(unique_pmids)
+        unique_pmids = [pmid for pmid in unique_pmids if pmid not in records]
+        
+        batches = [
+            unique_pmids[start:start + batch_size]
+            for start in range(0, len(unique_pmids), batch_size)
+        ]
+        
+        # Batches run concurrently; merging in batch order keeps PMID order stable
+        for batch_records in run_ordered(
+            lambda batch: self._fetch_batch(batch, retry_attempts),
+            batches,
+            max_workers=self.max_workers,
+            progress_label=progress_label
+        ):
+            records.update(batch_records)
+        
+        return records
+    
+    def _fetch_batch(self, pmids: List[str], retry_attempts: int) -> Dict[str, Dict[str, Any]]:
+        """Fetch one batch of PMIDs, bisecting the batch if it keeps failing."""
+        error = None
+        for attempt in range(retry_attempts):
+            try:
+                return self._efetch_articles(pmids)
+                
+            except HTTPError as e:
+                error = e
+                print(f"   ⚠️  HTTPError for batch of {len(pmids)} PMID(s) (attempt {attempt + 1}): {e}")
+                
+            except Exception as e:
+                error = e
+                print(f"   ⚠️  Error for batch of {len(pmids)} PMID(s) (attempt {attempt + 1}): {e}")
+            
+            if attempt < retry_attempts - 1:
+                time.sleep(API_DELAY * (attempt + 1))  # Back off before retrying
+        
+        if len(pmids) == 1:
+            print(f"   Failed to fetch PMID {pmids[0]} after {retry_attempts} attempts")
+            return {}
+        
+        if not is_batch_error(error):
+            # Smaller batches would hit the same connection or throttling error
+            print(f"   Failed to fetch batch of {len(pmids)} PMID(s) after {retry_attempts} attempts")
+            return {}
+        
+        # Split the failing batch and retry each half on its own
+        middle = len(pmids) // 2
+        records = self._fetch_batch(pmids[:middle], retry_attempts)
+        records.update(self._fetch_batch(pmids[middle:], retry_attempts))
+        return records
+    
+    def _fetch_history_page(
+        self,
+        history: Dict[str, Any],
+        retstart: int,
+        retmax: int,
+        retry_attempts: int
+    ) -> List[str]:
+        """Fetch one page of PMIDs from the history server (empty if it keeps failing)."""
+        for attempt in range(retry_attempts):
+            try:
+                raw = self._entrez_request(
+                    Entrez.efetch,
+                    db="pubmed",
+                    rettype="uilist",
+                    retmode="text",
+                    webenv=history["webenv"],
+                    query_key=history["query_key"],
+                    retstart=retstart,
+                    retmax=retmax
+                )
+                return raw.decode("utf-8").split()
+                
+            except HTTPError as e:
+                print(f"   ⚠️  HTTPError for PMIDs {retstart}-{retstart + retmax} (attempt {attempt + 1}): {e}")
+                
+            except Exception as e:
+                print(f"   ⚠️  Error for PMIDs {retstart}-{retstart + retmax} (attempt {attempt + 1}): {e}")
+            
+            if attempt < retry_attempts - 1:
+                time.sleep(API_DELAY * (attempt + 1))  # Back off before retrying
+        
+        print(f"   Failed to fetch PMIDs {retstart}-{retstart + retmax} after {retry_attempts} attempts")
+        return []
+    
+    def _efetch_articles(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Run a single EFetch call and map the returned articles to their PMIDs."""
+        raw = self._entrez_request(
+            Entrez.efetch,
+            db="pubmed",
+            id=",".join(pmids),
+            rettype="medline",
+            retmode="xml"
+        )
+        records = self._parse_records(raw)
+        
+        stores = [store for store in (self.record_cache, self.journal) if store is not None]
+        if stores:
+            xml_header, articles = split_pubmed_articles(raw)
+            for store in stores:
+                store.put_many(articles, xml_header)
+        
+        return records
+    
+    def _load_cached_records(self, pmids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Parse records for the given PMIDs that are available in the record cache or run journal."""
+        records = {}
+        for store in (self.journal, self.record_cache):
+            missing = [pmid for pmid in pmids if pmid not in records]
+            if store is None or not missing:
+                continue
+            
+            articles = store.get_many(missing)
+            xml_header = store.get_xml_header()
+            if not articles or not xml_header:
+                continue
+            
+            try:
+                document = build_pubmed_document(xml_header, articles.values())
+                records.update(self._parse_records(document))
+            except Exception as e:
+                print(f"   ⚠️  Ignoring unreadable cached records: {e}")
+        
+        return records
+    
+    def _parse_records(self, raw: bytes) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse an EFetch XML document with the configured parser.
+        
+        Args:
+            raw: PubmedArticleSet XML
+            
+        Returns:
+            Dictionary mapping PMID to an Entrez.read record or, with the
+            stream parser, to a ready-made paper component
+        """
+        if self.parser == "stream":
+            return dict(iter_pubmed_components(io.BytesIO(raw)))
+        return map_articles_to_pmids(Entrez.read(io.BytesIO(raw)))
+    
     def build_keyword_query(
         self, 
         keyword: str, 
@@ -159,6 +548,228 @@ class PubMedClient:
         
         return f'{author_filter} AND {date_filter}'
     
+    def _build_search_queries(
+        self,
+        keywords: List[str],
+        named_authors: List[Dict[str, str]],
+        start_date: str,
+        end_date: str,
+        journals: List[str] = None
+    ) -> List[Tuple[str, Any, str]]:
+        """Build (kind, tag, query) triples for every keyword and named author."""
+        queries = []
+        
+        for keyword in keywords or []:
+            query = self.build_keyword_query(keyword, start_date, end_date, journals)
+            queries.append(("keywords", keyword, query))
+        
+        for author in named_authors or []:
+            if not author.get("name"):
+                print(f"   ⚠️  Skipping author with missing name: {author}")
+                continue
+            query = self.build_author_query(author["name"], start_date, end_date)
+            queries.append(("authors", author, query))
+        
+        return queries
+    
+    @staticmethod
+    def _add_membership(
+        membership: Dict[str, Dict[str, List[Any]]],
+        pmid: str,
+        kind: str,
+        tag: Any
+    ) -> None:
+        """Record that the query identified by (kind, tag) matched a PMID."""
+        entry = membership.setdefault(str(pmid), {"keywords": [], "authors": []})
+        if tag not in entry[kind]:
+            entry[kind].append(tag)
+    
+    def plan_searches(
+        self,
+        keywords: List[str],
+        named_authors: List[Dict[str, str]],
+        start_date: str,
+        end_date: str,
+        journals: List[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Run every ESearch up front and record which queries matched each PMID.
+        
+        Args:
+            keywords: List of search keywords
+            named_authors: List of author dictionaries with 'name' and 'orcid' keys
+            start_date: Start date in YYYY/MM/DD format
+            end_date: End date in YYYY/MM/DD format
+            journals: Optional list of journal names for keyword queries
+            
+        Returns:
+            Dictionary with 'membership' (PMID -> {'keywords': [...], 'authors': [...]},
+            in first-seen order) and 'keyword_frequencies' (keyword -> hit count)
+        """
+        membership = {}
+        keyword_frequencies = {}
+        
+        queries = self._build_search_queries(keywords, named_authors, start_date, end_date, journals)
+        pmid_lists = run_ordered(
+            lambda entry: self.search_pmids(entry[2]),
+            queries,
+            max_workers=self.max_workers
+        )
+        
+        # Results come back in config order, so membership order is deterministic
+        for (kind, tag, query), pmids in zip(queries, pmid_lists):
+            if kind == "keywords":
+                keyword_frequencies[tag] = len(pmids)
+            
+            for pmid in pmids:
+                self._add_membership(membership, pmid, kind, tag)
+        
+        return {
+            "membership": membership,
+            "keyword_frequencies": keyword_frequencies
+        }
+    
+    def stream_searches(
+        self,
+        keywords: List[str],
+        named_authors: List[Dict[str, str]],
+        start_date: str,
+        end_date: str,
+        journals: List[str] = None,
+        retry_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    ) -> Dict[str, Any]:
+        """
+        Plan searches through the history server, without the MAX_RESULTS cap.
+        
+        Each query's PMIDs are read page by page from the history server and
+        merged into the membership map as they arrive; no records are
+        fetched here, so search_all fetches every unique PMID once (and
+        checks the record cache first), exactly as with plan_searches.
+        
+        Args:
+            keywords: List of search keywords
+            named_authors: List of author dictionaries with 'name' and 'orcid' keys
+            start_date: Start date in YYYY/MM/DD format
+            end_date: End date in YYYY/MM/DD format
+            journals: Optional list of journal names for keyword queries
+            retry_attempts: Number of retry attempts per page
+            
+        Returns:
+            Search plan in the same shape as plan_searches
+        """
+        membership = {}
+        keyword_frequencies = {}
+        
+        queries = self._build_search_queries(keywords, named_authors, start_date, end_date, journals)
+        histories = run_ordered(
+            lambda entry: self.search_history(entry[2]),
+            queries,
+            max_workers=self.max_workers
+        )
+        
+        # Queries are read in config order, so membership order is deterministic
+        for (kind, tag, query), history in zip(queries, histories):
+            if kind == "keywords":
+                keyword_frequencies[tag] = history["count"]
+            
+            for pmids in self.iter_history_pmids(history, retry_attempts=retry_attempts):
+                for pmid in pmids:
+                    self._add_membership(membership, pmid, kind, tag)
+        
+        return {
+            "membership": membership,
+            "keyword_frequencies": keyword_frequencies
+        }
+    
+    def fan_out_records(
+        self,
+        plan: Dict[str, Any],
+        records: Dict[str, Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Attach search metadata to fetched records using the plan's membership map.
+        
+        Each PMID yields at most one keyword paper and one author paper, tagged
+        with every keyword (search_keywords) or author name (search_authors)
+        that matched it; process_papers keeps these as the paper's Search Terms.
+        
+        Args:
+            plan: Search plan from plan_searches
+            records: Fetched records keyed by PMID
+            
+        Returns:
+            Tuple of (keyword_papers, author_papers)
+        """
+        keyword_papers = []
+        author_papers = []
+        
+        for pmid, entry in plan["membership"].items():
+            record = records.get(pmid)
+            if not record:
+                continue
+            
+            if entry["keywords"]:
+                paper_data = dict(record)
+                paper_data["Source"] = "keyword"
+                paper_data["search_keyword"] = entry["keywords"][0]
+                paper_data["search_keywords"] = list(entry["keywords"])
+                keyword_papers.append(paper_data)
+            
+            if entry["authors"]:
+                first_author = entry["authors"][0]
+                paper_data = dict(record)
+                paper_data["Source"] = "pubmed_author"
+                paper_data["search_author"] = first_author.get("name")
+                paper_data["search_orcid"] = first_author.get("orcid", "")
+                paper_data["search_authors"] = [author.get("name") for author in entry["authors"]]
+                author_papers.append(paper_data)
+        
+        return keyword_papers, author_papers
+    
+    def search_all(
+        self,
+        keywords: List[str],
+        named_authors: List[Dict[str, str]],
+        start_date: str,
+        end_date: str,
+        journals: List[str] = None,
+        retry_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
+        """
+        Search PubMed by keywords and authors, fetching each unique PMID once.
+        
+        Args:
+            keywords: List of search keywords
+            named_authors: List of author dictionaries with 'name' and 'orcid' keys
+            start_date: Start date in YYYY/MM/DD format
+            end_date: End date in YYYY/MM/DD format
+            journals: Optional list of journal names for keyword queries
+            retry_attempts: Number of retry attempts for failed requests
+            
+        Returns:
+            Tuple of (keyword_papers, author_papers, keyword_frequency_dict)
+        """
+        if self.use_history:
+            plan = self.stream_searches(
+                keywords, named_authors, start_date, end_date, journals, retry_attempts
+            )
+        else:
+            plan = self.plan_searches(keywords, named_authors, start_date, end_date, journals)
+        unique_pmids = list(plan["membership"])
+        
+        total_hits = sum(
+            len(entry["keywords"]) + len(entry["authors"])
+            for entry in plan["membership"].values()
+        )
+        print(f"   Planned {len(unique_pmids)} unique PMID(s) from {total_hits} search hit(s)")
+        
+        records = {}
+        if unique_pmids:
+            records = self.fetch_papers_batch(unique_pmids, retry_attempts=retry_attempts)
+        
+        keyword_papers, author_papers = self.fan_out_records(plan, records)
+        return keyword_papers, author_papers, plan["keyword_frequencies"]
+    
     def search_by_keywords(
         self,
         keywords: List[str],
@@ -184,39 +795,15 @@ class PubMedClient:
             print("   No keywords provided for PubMed search")
             return [], {}
         
-        # print(f"🔍 Starting PubMed keyword search for {len(keywords)} keywords...")
-        
-        all_papers = []
-        keyword_frequencies = {}
-        
-        for i, keyword in enumerate(keywords):
-            # print(f"   [{i+1}/{len(keywords)}] Searching for: {keyword}")
-            
-            # Build and execute query
-            query = self.build_keyword_query(keyword, start_date, end_date, journals)
-            pmids = self.search_pmids(query)
-            keyword_frequencies[keyword] = len(pmids)
-            
-            # Fetch paper details
-            keyword_papers = []
-            if pmids:
-                # print(f"   Fetching details for {len(pmids)} papers...")
-                
-                for j, pmid in enumerate(pmids):
-                    print_progress(j + 1, len(pmids), f"Fetching papers for '{keyword}'")
-                    
-                    paper_data = self.fetch_paper_details(pmid, retry_attempts)
-                    if paper_data:
-                        # Add metadata
-                        paper_data["Source"] = "keyword"
-                        paper_data["search_keyword"] = keyword
-                        keyword_papers.append(paper_data)
-            
-            all_papers.extend(keyword_papers)
-            #print(f"   Completed keyword '{keyword}': {len(keyword_papers)} papers retrieved")
-        
-        #print(f"PubMed keyword search completed: {len(all_papers)} total papers")
-        return all_papers, keyword_frequencies
+        keyword_papers, _, keyword_frequencies = self.search_all(
+            keywords=keywords,
+            named_authors=[],
+            start_date=start_date,
+            end_date=end_date,
+            journals=journals,
+            retry_attempts=retry_attempts
+        )
+        return keyword_papers, keyword_frequencies
     
     def search_by_authors(
         self,
@@ -241,54 +828,102 @@ class PubMedClient:
             print("   No authors provided for PubMed search")
             return []
         
-        # print(f"🔍 Starting PubMed author search for {len(named_authors)} authors...")
+        _, author_papers, _ = self.search_all(
+            keywords=[],
+            named_authors=named_authors,
+            start_date=start_date,
+            end_date=end_date,
+            retry_attempts=retry_attempts
+        )
+        return author_papers
+
+
+def is_batch_error(error: Optional[BaseException]) -> bool:
+    """
+    Tell whether a failed EFetch may be caused by the PMIDs in the batch.
+    
+    Connection errors and throttling fail every batch alike, so splitting
+    the batch would only multiply requests; HTTP errors such as 400 and
+    parse errors may come from a single bad record.
+    
+    Args:
+        error: Exception raised by the last attempt
         
-        all_papers = []
+    Returns:
+        True if bisecting the batch can help
+    """
+    if isinstance(error, HTTPError):
+        return error.code != 429
+    return not isinstance(error, OSError)
+
+
+def map_articles_to_pmids(paper_set: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map the articles of a parsed PubmedArticleSet to their PMIDs.
+    
+    Args:
+        paper_set: Result of Entrez.read for an EFetch response
         
-        for i, author in enumerate(named_authors):
-            author_name = author.get("name")
-            author_orcid = author.get("orcid", "")
-            
-            if not author_name:
-                print(f"   ⚠️  Skipping author with missing name: {author}")
-                continue
-            
-            # print(f"   [{i+1}/{len(named_authors)}] Searching for: {author_name}")
-            
-            # Build and execute query
-            query = self.build_author_query(author_name, start_date, end_date)
-            # print(f"   Query: {query}")
-            
-            pmids = self.search_pmids(query)
-            
-            # Fetch paper details
-            author_papers = []
-            if pmids:
-                # print(f"   Fetching details for {len(pmids)} papers...")
-                
-                for j, pmid in enumerate(pmids):
-                    print_progress(j + 1, len(pmids), f"Fetching papers for '{author_name}'")
-                    
-                    paper_data = self.fetch_paper_details(pmid, retry_attempts)
-                    if paper_data:
-                        # Add metadata
-                        paper_data["Source"] = "pubmed_author"
-                        paper_data["search_author"] = author_name
-                        paper_data["search_orcid"] = author_orcid
-                        author_papers.append(paper_data)
-            
-            all_papers.extend(author_papers)
-            #print(f"   Completed author '{author_name}': {len(author_papers)} papers retrieved")
-        
-        #print(f"PubMed author search completed: {len(all_papers)} total papers")
-        return all_papers
+    Returns:
+        Dictionary mapping PMID to a single-article paper record
+    """
+    records = {}
+    for article in paper_set.get("PubmedArticle", []):
+        pmid = str(article.get("MedlineCitation", {}).get("PMID", ""))
+        if pmid:
+            records[pmid] = {"PubmedArticle": [article]}
+    return records
+
+
+def split_pubmed_articles(raw: bytes) -> Tuple[bytes, Dict[str, bytes]]:
+    """
+    Split a raw PubmedArticleSet response into per-article XML.
+    
+    Args:
+        raw: Raw EFetch response body
+        
+    Returns:
+        Tuple of (xml_header, articles) where xml_header holds the XML
+        declaration and DOCTYPE and articles maps PMID to article XML
+    """
+    set_start = raw.find(b"<PubmedArticleSet")
+    xml_header = raw[:set_start] if set_start > 0 else b""
+    
+    articles = {}
+    for match in ARTICLE_PATTERN.finditer(raw):
+        article = match.group(0)
+        pmid_match = PMID_PATTERN.search(article)
+        if pmid_match:
+            articles[pmid_match.group(1).decode("ascii")] = article
+    
+    return xml_header, articles
+
+
+def build_pubmed_document(xml_header: bytes, articles: Iterable[bytes]) -> bytes:
+    """
+    Reassemble per-article XML into a PubmedArticleSet document.
+    
+    Args:
+        xml_header: XML declaration and DOCTYPE from split_pubmed_articles
+        articles: Iterable of article XML fragments
+        
+    Returns:
+        Complete XML document
+    """
+    return xml_header + b"<PubmedArticleSet>" + b"".join(articles) + b"</PubmedArticleSet>"
 
 
 def lookup_pubmed(
     config_file_dict: Dict[str, Any], 
     start_end_date: Tuple[str, str], 
     mode: str = "keywords", 
-    attempt_number: int = DEFAULT_RETRY_ATTEMPTS
+    attempt_number: int = DEFAULT_RETRY_ATTEMPTS,
+    use_history: bool = False,
+    rate_limiter: RateLimiter = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    record_cache: RecordCache = None,
+    parser: str = DEFAULT_PARSER,
+    journal: RunJournal = None
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, int]]:
     """
     Search PubMed using keywords and/or author-based searches.
@@ -298,6 +933,12 @@ def lookup_pubmed(
         start_end_date: Tuple of (start_date, end_date) in YYYY/MM/DD format
         mode: Search mode ("keywords", "authors", or "both")
         attempt_number: Number of retry attempts for failed requests
+        use_history: Stream results from the ESearch history server
+        rate_limiter: Rate limiter to use (default: shared limiter)
+        max_workers: Maximum number of concurrent ESearch/EFetch calls
+        record_cache: Optional on-disk cache of fetched records
+        parser: PubMed XML parser ("entrez" or "stream")
+        journal: Optional run journal for checkpoint/resume
         
     Returns:
         Tuple of (keyword_papers, author_papers, keyword_frequency_dict)
@@ -307,7 +948,16 @@ def lookup_pubmed(
         raise ValueError("Email is required for PubMed API access")
     
     # Initialize client
-    client = PubMedClient(email=email)
+    client = PubMedClient(
+        email=email,
+        use_history=use_history,
+        api_key=config_file_dict.get('ncbi_api_key'),
+        rate_limiter=rate_limiter,
+        max_workers=max_workers,
+        record_cache=record_cache,
+        parser=parser,
+        journal=journal
+    )
     
     # Extract search parameters
     start_date, end_date = start_end_date
@@ -315,40 +965,77 @@ def lookup_pubmed(
     keywords = config_file_dict.get('topics', [])
     named_authors = config_file_dict.get('named_authors', [])
     
-    keyword_papers = []
-    author_papers = []
-    keyword_frequency_dict = {}
+    search_keywords = keywords if mode in ["keywords", "both"] else []
+    search_authors = named_authors if mode in ["authors", "both"] else []
     
-    # Keyword-based search
-    if mode in ["keywords", "both"] and keywords:
-        print("  Starting keyword-based PubMed search...")
-        keyword_papers, keyword_frequency_dict = client.search_by_keywords(
-            keywords=keywords,
-            start_date=start_date,
-            end_date=end_date,
-            journals=journals,
-            retry_attempts=attempt_number
-        )
-        
-        if not keyword_papers:
-            print("   No papers found from keyword-based search.")
+    if not (search_keywords or search_authors):
+        return [], [], {}
     
-    # Author-based search
-    if mode in ["authors", "both"] and named_authors:
+    # Run every ESearch first so papers shared between queries are fetched once
+    if search_keywords:
+        print("  Starting keyword-based PubMed search...")
+    if search_authors:
         print("  Starting author-based PubMed search...")
-        author_papers = client.search_by_authors(
-            named_authors=named_authors,
-            start_date=start_date,
-            end_date=end_date,
-            retry_attempts=attempt_number
-        )
-        
-        if not author_papers:
-            print("   No papers found from author-based search.")
+    
+    keyword_papers, author_papers, keyword_frequency_dict = client.search_all(
+        keywords=search_keywords,
+        named_authors=search_authors,
+        start_date=start_date,
+        end_date=end_date,
+        journals=journals,
+        retry_attempts=attempt_number
+    )
+    
+    if search_keywords and not keyword_papers:
+        print("   No papers found from keyword-based search.")
+    if search_authors and not author_papers:
+        print("   No papers found from author-based search.")
+    
+    if record_cache is not None:
+        stats = record_cache.stats()
+        print(f"   PubMed record cache: {stats['hits']} hit(s), {stats['misses']} miss(es)")
     
     return keyword_papers, author_papers, keyword_frequency_dict
 
 
+def count_pubmed_keywords(
+    config_file_dict: Dict[str, Any],
+    start_end_date: Tuple[str, str],
+    rate_limiter: RateLimiter = None,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> Dict[str, Optional[int]]:
+    """
+    Get PubMed hit counts for every configured topic without fetching records.
+    
+    Args:
+        config_file_dict: Configuration dictionary containing search parameters
+        start_end_date: Tuple of (start_date, end_date) in YYYY/MM/DD format
+        rate_limiter: Rate limiter to use (default: shared limiter)
+        max_workers: Maximum number of concurrent ESearch calls
+        
+    Returns:
+        Dictionary mapping each topic to its hit count (None on error)
+    """
+    email = config_file_dict.get('email')
+    if not email:
+        raise ValueError("Email is required for PubMed API access")
+    
+    client = PubMedClient(
+        email=email,
+        api_key=config_file_dict.get('ncbi_api_key'),
+        rate_limiter=rate_limiter,
+        max_workers=max_workers
+    )
+    
+    start_date, end_date = start_end_date
+    return client.count_keywords(
+        keywords=config_file_dict.get('topics', []),
+        start_date=start_date,
+        end_date=end_date,
+        journals=config_file_dict.get('journals', [])
+    )
+
+
 def validate_pubmed_config(config: Dict[str, Any]) -> List[str]:
     """
     Validate configuration for PubMed searches.
@@ -0,0 +1,255 @@
+"""
+Rate limiting for the Journal Lookup Tool.
+Provides thread-safe token buckets with per-host request budgets shared by
+the PubMed and CrossRef clients.
+"""
+
+import re
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+
+# Request budgets (requests per second)
+NCBI_HOST = "eutils.ncbi.nlm.nih.gov"
+CROSSREF_HOST = "api.crossref.org"
+NCBI_RATE = 3.0  # NCBI limit without an API key
+NCBI_RATE_WITH_KEY = 10.0  # NCBI limit with an API key
+CROSSREF_RATE = 5.0  # CrossRef public pool; raised from X-Rate-Limit-* headers
+DEFAULT_RATE = 1.0  # Budget for hosts without an explicit entry
+
+# Adaptive behaviour
+MIN_RATE = 0.2  # Never slow down below one request every 5 seconds
+BACKOFF_FACTOR = 0.5  # Rate multiplier after a 429/5xx response
+RECOVERY_FACTOR = 1.1  # Rate multiplier after each successful response
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Thread-safe token bucket that spaces requests to a target rate."""
+
+    def __init__(self, rate: float, burst: float = 1.0):
+        """
+        Initialize token bucket.
+
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Number of requests that may be sent back to back
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accumulated since the last update (lock must be held)."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until enough tokens are available and consume them.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                wait = (tokens - self.tokens) / self.rate
+
+            time.sleep(wait)
+            waited += wait
+
+    def slow_down(self, retry_after: Optional[float] = None) -> None:
+        """
+        Reduce the rate after a throttling or server error response.
+
+        Args:
+            retry_after: Optional server-requested pause in seconds
+        """
+        with self.lock:
+            self._refill()
+            self.rate = max(MIN_RATE, self.rate * BACKOFF_FACTOR)
+            # Negative tokens make the next acquire wait out the pause
+            pause = retry_after if retry_after else 1.0 / self.rate
+            self.tokens = min(self.tokens, 0.0) - pause * self.rate
+
+    def speed_up(self) -> None:
+        """Recover the rate gradually after a successful response."""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate * RECOVERY_FACTOR)
+
+    def set_max_rate(self, rate: float) -> None:
+        """
+        Change the sustained rate ceiling.
+
+        Args:
+            rate: New maximum requests per second
+        """
+        with self.lock:
+            self._refill()
+            self.max_rate = max(MIN_RATE, rate)
+            # A higher ceiling is reached gradually through speed_up()
+            self.rate = min(self.rate, self.max_rate)
+
+
+class RateLimiter:
+    """Registry of per-host token buckets shared across clients and threads."""
+
+    def __init__(self, budgets: Optional[Dict[str, float]] = None):
+        """
+        Initialize rate limiter.
+
+        Args:
+            budgets: Optional mapping of host name to requests per second
+        """
+        self.budgets = {
+            NCBI_HOST: NCBI_RATE,
+            CROSSREF_HOST: CROSSREF_RATE
+        }
+        if budgets:
+            self.budgets.update(budgets)
+
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Return the token bucket for a host, creating it on first use."""
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.budgets.get(host, DEFAULT_RATE))
+            return self.buckets[host]
+
+    def acquire(self, host: str) -> float:
+        """
+        Wait for permission to send one request to a host.
+
+        Args:
+            host: Host name the request is sent to
+
+        Returns:
+            Seconds spent waiting
+        """
+        return self.bucket(host).acquire()
+
+    def set_rate(self, host: str, rate: float) -> None:
+        """
+        Set the request budget for a host.
+
+        Args:
+            host: Host name
+            rate: Requests per second
+        """
+        with self.lock:
+            self.budgets[host] = rate
+        self.bucket(host).set_max_rate(rate)
+
+    def report_success(self, host: str) -> None:
+        """Record a successful response from a host."""
+        self.bucket(host).speed_up()
+
+    def report_failure(
+        self,
+        host: str,
+        status: Optional[int] = None,
+        retry_after: Any = None
+    ) -> None:
+        """
+        Record a failed request and slow down on throttling or server errors.
+
+        Args:
+            host: Host name
+            status: HTTP status code, or None for network errors
+            retry_after: Optional Retry-After header value
+        """
+        if status is not None and status not in RETRY_STATUS_CODES:
+            return
+        self.bucket(host).slow_down(parse_retry_after(retry_after))
+
+    def update_from_headers(self, host: str, headers: Mapping[str, str]) -> None:
+        """
+        Adopt the budget advertised in X-Rate-Limit-Limit/X-Rate-Limit-Interval headers.
+
+        Args:
+            host: Host name
+            headers: Response headers
+        """
+        limit = headers.get("X-Rate-Limit-Limit")
+        interval = headers.get("X-Rate-Limit-Interval")
+        if not limit or not interval:
+            return
+
+        match = re.match(r"(\d+(?:\.\d+)?)\s*(ms|s|m)?", str(interval).strip())
+        try:
+            limit_value = float(limit)
+        except ValueError:
+            return
+        if not match or limit_value <= 0:
+            return
+
+        seconds = float(match.group(1))
+        unit = match.group(2) or "s"
+        if unit == "ms":
+            seconds /= 1000.0
+        elif unit == "m":
+            seconds *= 60.0
+        if seconds <= 0:
+            return
+
+        rate = limit_value / seconds
+        if rate != self.budgets.get(host):
+            self.set_rate(host, rate)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value (HTTP dates are ignored)
+
+    Returns:
+        Seconds to wait, or None if not available
+    """
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+_shared_limiter: Optional[RateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter shared by all API clients."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = RateLimiter()
+        return _shared_limiter
+
+
+def configure_ncbi_api_key(api_key: Optional[str], limiter: Optional[RateLimiter] = None) -> None:
+    """
+    Apply the NCBI budget that matches whether an API key is configured.
+
+    Args:
+        api_key: NCBI API key, or None
+        limiter: Rate limiter to configure (default: shared limiter)
+    """
+    limiter = limiter or get_rate_limiter()
+    limiter.set_rate(NCBI_HOST, NCBI_RATE_WITH_KEY if api_key else NCBI_RATE)
@@ -0,0 +1,199 @@
+"""
+On-disk cache of PubMed records for the Journal Lookup Tool.
+Stores compressed raw article XML in SQLite, keyed by PMID, with TTL expiry
+and size-based least-recently-used eviction.
+"""
+
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+DEFAULT_CACHE_DIR = ".cache"
+RECORD_CACHE_FILENAME = "pubmed_records.sqlite"
+DEFAULT_TTL_DAYS = 30  # PubMed records rarely change within a month
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # Compressed size limit before LRU eviction
+SQLITE_MAX_VARIABLES = 900  # Stay below SQLite's bound-parameter limit
+
+
+class RecordCache:
+    """SQLite-backed cache of raw PubMed article XML keyed by PMID."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Open (or create) a record cache.
+
+        Args:
+            path: SQLite database file path
+            ttl_days: Age in days after which cached records are refetched
+            max_bytes: Maximum total compressed size before eviction
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                pmid TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS records_accessed ON records (accessed_at);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL
+            );
+        """)
+        self.connection.commit()
+
+    def get_many(self, pmids: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Look up raw article XML for several PMIDs.
+
+        Args:
+            pmids: PubMed IDs to look up
+
+        Returns:
+            Dictionary mapping PMID to article XML for fresh cache entries
+        """
+        pmids = [str(pmid) for pmid in pmids]
+        now = time.time()
+        oldest = now - self.ttl_seconds
+        found = {}
+
+        with self.lock:
+            for start in range(0, len(pmids), SQLITE_MAX_VARIABLES):
+                chunk = pmids[start:start + SQLITE_MAX_VARIABLES]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self.connection.execute(
+                    f"SELECT pmid, data FROM records WHERE fetched_at >= ? AND pmid IN ({placeholders})",
+                    [oldest] + chunk
+                ).fetchall()
+                for pmid, data in rows:
+                    found[pmid] = zlib.decompress(data)
+
+            if found:
+                self.connection.executemany(
+                    "UPDATE records SET accessed_at = ? WHERE pmid = ?",
+                    [(now, pmid) for pmid in found]
+                )
+                self.connection.commit()
+
+            self.hits += len(found)
+            self.misses += len(pmids) - len(found)
+
+        return found
+
+    def put_many(self, articles: Dict[str, bytes], xml_header: Optional[bytes] = None) -> None:
+        """
+        Store raw article XML and evict old entries if the cache is too large.
+
+        Args:
+            articles: Dictionary mapping PMID to article XML
+            xml_header: XML declaration and DOCTYPE of the response the
+                articles came from, needed to parse them again later
+        """
+        if not articles:
+            return
+
+        now = time.time()
+        rows = []
+        for pmid, xml in articles.items():
+            data = zlib.compress(xml)
+            rows.append((str(pmid), data, len(data), now, now))
+
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO records (pmid, data, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            if xml_header:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('xml_header', ?)",
+                    (xml_header,)
+                )
+            self._evict()
+            self.connection.commit()
+
+    def get_xml_header(self) -> Optional[bytes]:
+        """Return the XML header stored with the most recent records."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'xml_header'"
+            ).fetchone()
+        return bytes(row[0]) if row else None
+
+    def _evict(self) -> None:
+        """Drop expired records, then least recently used ones above max_bytes (lock must be held)."""
+        self.connection.execute(
+            "DELETE FROM records WHERE fetched_at < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM records").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        excess = total - self.max_bytes
+        victims = []
+        for pmid, size in self.connection.execute(
+            "SELECT pmid, size FROM records ORDER BY accessed_at ASC"
+        ):
+            victims.append((pmid,))
+            excess -= size
+            if excess <= 0:
+                break
+
+        self.connection.executemany("DELETE FROM records WHERE pmid = ?", victims)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, stored record count and size in bytes
+        """
+        with self.lock:
+            count, size = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM records"
+            ).fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "records": count,
+            "bytes": size
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self.lock:
+            self.connection.close()
+
+
+def open_record_cache(cache_dir: str = DEFAULT_CACHE_DIR) -> RecordCache:
+    """
+    Open the PubMed record cache inside a cache directory.
+
+    Args:
+        cache_dir: Directory holding the cache files
+
+    Returns:
+        RecordCache instance
+    """
+    return RecordCache(Path(cache_dir) / RECORD_CACHE_FILENAME)
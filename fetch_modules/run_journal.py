@@ -0,0 +1,169 @@
+"""
+Run journal for the Journal Lookup Tool.
+Appends completed query results and fetched PubMed records to a JSON Lines
+file as they arrive, so an interrupted run can be resumed without repeating
+finished work.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+
+JOURNAL_FILENAME = "run_journal.jsonl"
+
+
+class RunJournal:
+    """Append-only JSONL checkpoint of query results and PubMed records."""
+
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Open a run journal.
+
+        Args:
+            path: Journal file path
+            resume: Load entries left by an interrupted run instead of
+                starting a new journal
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.queries: Dict[str, Any] = {}
+        self.articles: Dict[str, bytes] = {}
+        self.xml_header: Optional[bytes] = None
+        # Entries read from disk on --resume, and the ones this run has used
+        self.loaded: Set[str] = set()
+        self.reused_entries: Set[str] = set()
+        self.lock = threading.Lock()
+
+        if resume:
+            self._load()
+        self.file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+
+    def _load(self) -> None:
+        """Read entries from an existing journal, ignoring a truncated last line."""
+        if not self.path.exists():
+            print(f"   No run journal found at {self.path}; starting from scratch")
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A crash can leave a partial final line
+                    continue
+
+                if entry.get("type") == "query":
+                    self.queries[entry["key"]] = entry["value"]
+                    self.loaded.add(entry["key"])
+                elif entry.get("type") == "articles":
+                    self.xml_header = entry["xml_header"].encode("utf-8")
+                    for pmid, xml in entry["articles"].items():
+                        self.articles[pmid] = xml.encode("utf-8")
+                        self.loaded.add(f"pmid:{pmid}")
+
+        print(
+            f"   Resuming from {self.path}: {len(self.queries)} finished query(ies), "
+            f"{len(self.articles)} fetched record(s)"
+        )
+
+    @property
+    def reused(self) -> int:
+        """Number of entries from the resumed journal that this run has used."""
+        return len(self.reused_entries)
+
+    def _mark_reused(self, keys: Iterable[str]) -> None:
+        """Count lookups that were answered by entries loaded on --resume."""
+        with self.lock:
+            self.reused_entries.update(key for key in keys if key in self.loaded)
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Write one entry and flush it to disk."""
+        line = json.dumps(entry, ensure_ascii=False)
+        with self.lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+
+    def get_query(self, kind: str, key: str) -> Any:
+        """
+        Look up the result of a finished query.
+
+        Args:
+            kind: Query type (e.g. "esearch", "crossref")
+            key: Query identifier, including everything that affects the result
+
+        Returns:
+            Stored result, or None if the query has not finished
+        """
+        full_key = f"{kind}:{key}"
+        value = self.queries.get(full_key)
+        if value is not None:
+            self._mark_reused([full_key])
+        return value
+
+    def record_query(self, kind: str, key: str, value: Any) -> None:
+        """
+        Record the JSON-serializable result of a finished query.
+
+        Args:
+            kind: Query type (e.g. "esearch", "crossref")
+            key: Query identifier
+            value: Query result
+        """
+        full_key = f"{kind}:{key}"
+        self.queries[full_key] = value
+        self._append({"type": "query", "key": full_key, "value": value})
+
+    def get_many(self, pmids: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Look up raw article XML fetched earlier in this run.
+
+        Args:
+            pmids: PubMed IDs to look up
+
+        Returns:
+            Dictionary mapping PMID to article XML for journaled records
+        """
+        found = {}
+        for pmid in pmids:
+            xml = self.articles.get(str(pmid))
+            if xml is not None:
+                found[str(pmid)] = xml
+        self._mark_reused(f"pmid:{pmid}" for pmid in found)
+        return found
+
+    def put_many(self, articles: Dict[str, bytes], xml_header: Optional[bytes] = None) -> None:
+        """
+        Record a batch of fetched articles.
+
+        Args:
+            articles: Dictionary mapping PMID to article XML
+            xml_header: XML declaration and DOCTYPE of the response
+        """
+        if not articles:
+            return
+
+        self.articles.update(articles)
+        if xml_header:
+            self.xml_header = xml_header
+        self._append({
+            "type": "articles",
+            "xml_header": (self.xml_header or b"").decode("utf-8"),
+            "articles": {pmid: xml.decode("utf-8") for pmid, xml in articles.items()}
+        })
+
+    def get_xml_header(self) -> Optional[bytes]:
+        """Return the XML header of the journaled records."""
+        return self.xml_header
+
+    def close(self) -> None:
+        """Close the journal, keeping it for a later --resume."""
+        with self.lock:
+            if not self.file.closed:
+                self.file.close()
+
+    def discard(self) -> None:
+        """Close and delete the journal once the run has completed."""
+        self.close()
+        self.path.unlink(missing_ok=True)
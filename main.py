@@ -11,28 +11,45 @@ See CHANGELOG.md for version history.
 import argparse
 import json
 import os
+import sqlite3
+import time
 import webbrowser
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-
-
 from config.config_loader import load_config
-from core.date_utils import ask_user_date
-from core.paper_processor import process_papers, combine_components
+from core.backfill import CHECKPOINT_DIRNAME, build_backfill_slices, run_backfill
+from core.date_utils import ask_user_date, validate_date
+from core.near_duplicates import DEFAULT_THRESHOLD, NEAR_DUPLICATE_ACTIONS, handle_near_duplicates
+from core.paper_processor import process_papers, combine_components, deduplicate_categories, split_categories
+from core.paper_store import PAPER_SOURCES, PAPER_STORE_FILENAME, PaperStore, open_paper_store
+from core.run_state import (
+    load_previous_results, load_run_state, merge_previous_results,
+    plan_incremental_windows, record_completed_windows, save_run_state
+)
 from fetch_modules.crossref_client import lookup_crossref
-from fetch_modules.pubmed_client import lookup_pubmed
-from output_modules.file_writers import write_txt_file, write_json_file
-from output_modules.html_builder import write_html_dashboard
+from fetch_modules.executor import DEFAULT_MAX_WORKERS
+from fetch_modules.http_cache import HttpCache, open_http_cache
+from fetch_modules.pubmed_client import DEFAULT_PARSER, PARSERS, count_pubmed_keywords, lookup_pubmed
+from fetch_modules.record_cache import DEFAULT_CACHE_DIR, RecordCache, open_record_cache
+from fetch_modules.run_journal import JOURNAL_FILENAME, RunJournal
+from output_modules.file_writers import RESULTS_FILENAME, append_keyword_counts, write_txt_file, write_json_file
+from output_modules.html_builder import DASHBOARD_LAYOUTS, write_html_dashboard
+from output_modules.output_scheduler import DIGEST_SUFFIX, inputs_digest, output_task, print_output_timings, run_output_tasks
+from output_modules.paper_archive import ARCHIVE_DIRNAME, write_archive
 from make_modules.pptx_maker import create_presentation
 from utils.browser_utils import open_links_in_safari
-from utils.display import print_opener, print_results_summary
+from utils.display import (
+    print_keyword_counts, print_near_duplicates, print_opener, print_results_summary, print_search_results
+)
 
 
 VERSION = "3.7.0"
 UPDATE_DATE = "20260126"
 
+# Configuration shown in the text report, slides and dashboard (part of their input digests)
+OUTPUT_CONFIG_KEYS = ("email", "lookup_frequency", "journals", "topics", "orcids", "authors", "named_authors")
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -45,6 +62,7 @@ Examples:
   %(prog)s --auto --mode keywords    # Auto mode, keywords only
   %(prog)s --mode authors           # Interactive mode, authors only
   %(prog)s                          # Interactive mode, both keywords and authors
+  %(prog)s search "crispr AND delivery" --since 2024/01/01   # Search stored papers
         """
     )
     
@@ -73,13 +91,161 @@ Examples:
         help="Output directory for generated files (default: current directory)"
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--use-history",
+        action="store_true",
+        help="Stream PubMed results from the ESearch history server (no 1,000-result cap)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of concurrent PubMed/CrossRef queries (default: {DEFAULT_MAX_WORKERS})"
+    )
+    
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for the local PubMed record and CrossRef response caches (default: {DEFAULT_CACHE_DIR})"
+    )
+    
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always download PubMed records and CrossRef responses instead of using the local caches"
+    )
+    
+    parser.add_argument(
+        "--parser",
+        choices=PARSERS,
+        default=DEFAULT_PARSER,
+        help=f"PubMed XML parser; 'stream' is faster and uses less memory (default: {DEFAULT_PARSER})"
+    )
+    
+    parser.add_argument(
+        "--counts-only",
+        action="store_true",
+        help="Only count PubMed hits per keyword (no records fetched) and append them to keyword_counts.jsonl"
+    )
+    
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only search since each topic/ORCID last completed (run_state.json) and merge with the previous results.json"
+    )
+    
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="Search every date range in dates.yaml in parallel, checkpointing each slice, and merge the results"
+    )
+    
+    parser.add_argument(
+        "--slice-days",
+        type=int,
+        default=0,
+        help="With --backfill, split each date range into slices of this many days (e.g. 7 for weekly)"
+    )
+    
+    parser.add_argument(
+        "--near-duplicates",
+        choices=NEAR_DUPLICATE_ACTIONS,
+        help="Find papers with near-identical titles/abstracts (preprints, errata) and list ('flag') or 'merge' them"
+    )
+    
+    parser.add_argument(
+        "--near-duplicate-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Minimum title/abstract similarity (Jaccard, 0-1) for --near-duplicates (default: {DEFAULT_THRESHOLD})"
+    )
+    
+    parser.add_argument(
+        "--paper-store",
+        help=f"SQLite paper store that every run adds to and 'search' reads (default: OUTPUT_DIR/{PAPER_STORE_FILENAME})"
+    )
+    
+    parser.add_argument(
+        "--dashboard",
+        choices=DASHBOARD_LAYOUTS,
+        default="table",
+        help="HTML dashboard layout: 'table' (DataTables) or 'virtual' (embedded data, renders only visible rows; for large result sets)"
+    )
+    
+    parser.add_argument(
+        "--dashboard-sidecar",
+        action="store_true",
+        help="With --dashboard virtual, write the paper data to publications.data.js instead of inlining it"
+    )
+    
+    parser.add_argument(
+        "--gzip-json",
+        action="store_true",
+        help="Write results.json.gz (gzip-compressed) instead of results.json"
+    )
+    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"Rewrite every output, even those whose inputs match the stored {DIGEST_SUFFIX} file"
+    )
+    
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help=f"Append this run's papers to the columnar archive in OUTPUT_DIR/{ARCHIVE_DIRNAME} (partitioned by run date and source)"
+    )
+    
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=f"Continue an interrupted run from {JOURNAL_FILENAME}, skipping finished queries and fetched records"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", metavar="command")
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search papers stored by earlier runs (no PubMed/CrossRef requests)"
+    )
+    search_parser.add_argument(
+        "query",
+        help='Full-text (FTS5) query over title, abstract, keywords, authors and journal, e.g. \'crispr AND "base editing"\' or \'cas*\''
+    )
+    search_parser.add_argument("--since", help="Only papers dated on or after YYYY/MM/DD")
+    search_parser.add_argument("--until", help="Only papers dated on or before YYYY/MM/DD")
+    search_parser.add_argument(
+        "--source",
+        action="append",
+        choices=PAPER_SOURCES,
+        help="Only papers from this source (repeatable)"
+    )
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum number of results (default: 20)")
+    
+    args = parser.parse_args()
+    for date_option in ("since", "until"):
+        if getattr(args, date_option, None):
+            try:
+                validate_date(getattr(args, date_option))
+            except ValueError as e:
+                parser.error(f"--{date_option}: {e}")
+    if args.backfill and args.incremental:
+        parser.error("--backfill and --incremental cannot be combined")
+    if not 0 < args.near_duplicate_threshold <= 1:
+        parser.error("--near-duplicate-threshold must be between 0 and 1")
+    return args
 
 
 def search_publications(
     config: Dict, 
     date_range: Tuple[str, str], 
-    mode: str
+    mode: str,
+    use_history: bool = False,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    record_cache: RecordCache = None,
+    pubmed_parser: str = DEFAULT_PARSER,
+    http_cache: HttpCache = None,
+    journal: RunJournal = None
 ) -> Tuple[List, List, List, Dict]:
     """
     Search for publications based on configuration and mode.
@@ -98,7 +264,12 @@ def search_publications(
         keyword_papers, _, keyword_frequencies = lookup_pubmed(
             config_file_dict=config,
             start_end_date=date_range,
-            mode="keywords"
+            mode="keywords",
+            use_history=use_history,
+            max_workers=max_workers,
+            record_cache=record_cache,
+            parser=pubmed_parser,
+            journal=journal
         )
         print(f'   Found {len(keyword_papers)} keyword-based papers')
     
@@ -111,13 +282,92 @@ def search_publications(
             print('   Searching CrossRef by ORCIDs...')
             crossref_papers = lookup_crossref(
                 orcids=config['orcids'],
-                start_end_date=date_range
+                start_end_date=date_range,
+                max_workers=max_workers,
+                http_cache=http_cache,
+                journal=journal
             )
             print(f'   Found {len(crossref_papers)} CrossRef papers')
     
     return keyword_papers, pubmed_author_papers, crossref_papers, keyword_frequencies
 
 
+def search_and_process(
+    config: Dict,
+    date_range: Tuple[str, str],
+    mode: str,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    paper_store: PaperStore = None,
+    **search_options
+) -> Tuple[List, List, Dict]:
+    """
+    Search one date window and process the papers into components.
+    
+    Processed papers are also added to the paper store, if one is given.
+    
+    Returns:
+        Tuple of (components_keyword, components_orcid, keyword_frequencies)
+    """
+    keyword_papers, pubmed_author_papers, crossref_papers, keyword_frequencies = search_publications(
+        config, date_range, mode,
+        max_workers=max_workers,
+        **search_options
+    )
+    
+    print('Processing paper data...')
+    components_keyword, components_orcid = process_papers(
+        keyword_papers, pubmed_author_papers, crossref_papers, paper_store
+    )
+    return components_keyword, components_orcid, keyword_frequencies
+
+
+def search_paper_store(args: argparse.Namespace) -> None:
+    """Run the 'search' command against the local paper store."""
+    store_path = Path(args.paper_store or Path(args.output_dir) / PAPER_STORE_FILENAME)
+    if not store_path.exists():
+        print(f"No paper store found at {store_path}; run a search first to build it.")
+        return
+    
+    store = PaperStore(store_path)
+    try:
+        results = store.search(args.query, args.since, args.until, args.source, args.limit)
+    except sqlite3.OperationalError as e:
+        print(f" ❌ Invalid search query '{args.query}': {e}")
+        return
+    finally:
+        store.close()
+    
+    print_search_results(results)
+
+
+def report_keyword_counts(
+    config: Dict,
+    date_range: Tuple[str, str],
+    output_dir: str,
+    max_workers: int = DEFAULT_MAX_WORKERS
+) -> None:
+    """Count PubMed hits per keyword and append them to the trend file."""
+    if not config.get('topics'):
+        print("No topics configured; nothing to count.")
+        return
+    
+    print('Counting PubMed hits per keyword...')
+    keyword_counts = count_pubmed_keywords(
+        config_file_dict=config,
+        start_end_date=date_range,
+        max_workers=max_workers
+    )
+    print_keyword_counts(keyword_counts)
+    
+    output_path = Path(output_dir)
+    output_path.mkdir(exist_ok=True)
+    append_keyword_counts(
+        start_end_date=date_range,
+        keyword_counts=keyword_counts,
+        filename=str(output_path / 'keyword_counts.jsonl')
+    )
+
+
 def generate_outputs(
     config: Dict,
     date_range: Tuple[str, str],
@@ -125,75 +375,119 @@ def generate_outputs(
     components_orcid: List,
     keyword_frequencies: Dict,
     output_dir: str,
-    auto_mode: bool
-) -> None:
-    """Generate all output files."""
+    auto_mode: bool,
+    dashboard_layout: str = "table",
+    dashboard_sidecar: bool = False,
+    compress_json: bool = False,
+    force: bool = False
+) -> bool:
+    """
+    Generate all output files.
+    
+    Writers whose inputs (papers, displayed configuration, date range and
+    options) match the digest stored next to their output are skipped,
+    unless force is set.
+    
+    Returns:
+        True if every writer succeeded
+    """
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
     
     components_all = components_keyword + components_orcid
+    html_path = output_path / 'publications.html'
+    html_artifacts = [html_path]
+    if dashboard_layout == "virtual" and dashboard_sidecar:
+        html_artifacts.append(html_path.with_suffix('.data.js'))
+    json_path = str(output_path / RESULTS_FILENAME) + ('.gz' if compress_json else '')
     
-    # Text file
-    print('Writing text file...')
-    write_txt_file(
-        start_end_date=date_range,
-        config_file_dict=config,
-        components_keyword=components_keyword,
-        components_orcid=components_orcid,
-        keyword_frequency_dict=keyword_frequencies,
-        txt_name=str(output_path / 'publications.txt'),
-        auto_mode=auto_mode
+    # Hash the papers once; every writer's digest builds on these
+    shared_digest = inputs_digest(
+        VERSION, date_range, inputs_digest(components_keyword), inputs_digest(components_orcid),
+        keyword_frequencies, {key: config.get(key) for key in OUTPUT_CONFIG_KEYS}
     )
     
-    # PowerPoint presentation
-    print('Creating PowerPoint presentation...')
-    create_presentation(
-        start_end_date=date_range,
-        config_file_dict=config,
-        components_keyword=components_keyword,
-        components_orcid=components_orcid,
-        keyword_frequency_dict=keyword_frequencies,
-        auto_mode=auto_mode,
-        version=VERSION,
-        output_path=str(output_path / 'publications.pptx')
-    )
+    tasks = [
+        output_task(
+            "Text report", write_txt_file,
+            artifacts=[output_path / 'publications.txt'],
+            digest=shared_digest,
+            start_end_date=date_range,
+            config_file_dict=config,
+            components_keyword=components_keyword,
+            components_orcid=components_orcid,
+            keyword_frequency_dict=keyword_frequencies,
+            txt_name=str(output_path / 'publications.txt'),
+            auto_mode=auto_mode
+        ),
+        # Building slides is CPU-bound, so it gets its own process
+        output_task(
+            "PowerPoint", create_presentation, in_process=True,
+            artifacts=[output_path / 'publications.pptx'],
+            digest=shared_digest,
+            start_end_date=date_range,
+            config_file_dict=config,
+            components_keyword=components_keyword,
+            components_orcid=components_orcid,
+            keyword_frequency_dict=keyword_frequencies,
+            auto_mode=auto_mode,
+            version=VERSION,
+            output_path=str(output_path / 'publications.pptx')
+        ),
+        output_task(
+            "HTML dashboard", write_html_dashboard,
+            artifacts=html_artifacts,
+            digest=inputs_digest(shared_digest, dashboard_layout, dashboard_sidecar),
+            start_end_date=date_range,
+            config_file_dict=config,
+            components=components_all,
+            keyword_frequency_dict=keyword_frequencies,
+            html_name=str(html_path),
+            auto_mode=auto_mode,
+            layout=dashboard_layout,
+            sidecar=dashboard_sidecar
+        ),
+        output_task(
+            "JSON results", write_json_file,
+            artifacts=[json_path],
+            # results.json holds the whole configuration, not only the displayed keys
+            digest=inputs_digest(shared_digest, config),
+            data={
+                "start_end_date": date_range,
+                "config_file_dict": config,
+                "components": components_all,
+                "keyword_frequency_dict": keyword_frequencies,
+                "generated_at": datetime.now().isoformat(),
+                "version": VERSION
+            },
+            filename=str(output_path / RESULTS_FILENAME),
+            auto_mode=auto_mode,
+            compress=compress_json
+        )
+    ]
     
-    # HTML dashboard
-    print('Creating HTML dashboard...')
-    html_path = output_path / 'publications.html'
-    write_html_dashboard(
-        start_end_date=date_range,
-        config_file_dict=config,
-        components=components_all,
-        keyword_frequency_dict=keyword_frequencies,
-        html_name=str(html_path),
-        auto_mode=auto_mode
-    )
-    
-    # JSON results
-    print('Saving JSON results...')
-    write_json_file(
-        data={
-            "start_end_date": date_range,
-            "config_file_dict": config,
-            "components": components_all,
-            "keyword_frequency_dict": keyword_frequencies,
-            "generated_at": datetime.now().isoformat(),
-            "version": VERSION
-        },
-        filename=str(output_path / 'results.json')
-    )
+    # Overwrite prompts need the terminal one at a time, so only --auto runs writers concurrently
+    print('Writing text report, PowerPoint, HTML dashboard and JSON results...')
+    started = time.perf_counter()
+    results = run_output_tasks(tasks, parallel=auto_mode, force=force)
+    print_output_timings(results, time.perf_counter() - started)
     
     # Open browser if not in auto mode
     if not auto_mode:
         print(' Opening dashboard in browser...')
         webbrowser.open(f'file://{html_path.resolve()}')
+    
+    return all(result["ok"] for result in results.values())
 
 
 def main() -> None:
     """Main entry point."""
     args = parse_arguments()
     
+    if args.command == "search":
+        search_paper_store(args)
+        return
+    
     # Display header
     print_opener(VERSION, UPDATE_DATE)
     
@@ -205,46 +499,160 @@ def main() -> None:
         # print('  Loading configuration...')
         config, keyword_frequencies = load_config(args.config_dir)
         
-        # Get date range
-        date_range = ask_user_date(
-            config['lookup_frequency'], 
-            auto_mode=args.auto
-        )
+        # Get date range (a backfill covers every configured range instead)
+        if args.backfill:
+            if not config['date_ranges']:
+                print("No date_ranges configured in dates.yaml; nothing to backfill.")
+                return
+            slices = build_backfill_slices(config['date_ranges'], args.slice_days)
+            date_range = (slices[0][0], max(end_date for _, end_date in slices))
+            print(f" Backfill mode - {len(slices)} slice(s) from {date_range[0]} to {date_range[1]}")
+        else:
+            date_range = ask_user_date(
+                config['lookup_frequency'], 
+                auto_mode=args.auto
+            )
         
-        # Search for publications
+        if args.counts_only:
+            report_keyword_counts(config, date_range, args.output_dir, max_workers=args.workers)
+            return
+        
+        # Plan search windows (one window unless running incrementally;
+        # backfill slices are planned above and run by run_backfill)
+        if args.incremental:
+            run_state = load_run_state(args.config_dir)
+            windows = plan_incremental_windows(config, run_state, date_range)
+            if not windows:
+                print(" Incremental mode - nothing new to search")
+        elif args.backfill:
+            windows = []
+        else:
+            windows = [(date_range, config)]
+        
+        # Search for publications and process them into components
         print('Searching for publications...')
-        keyword_papers, pubmed_author_papers, crossref_papers, keyword_frequencies = search_publications(
-            config, date_range, args.mode
-        )
+        components_keyword, components_orcid = [], []
+        record_cache = None if args.no_cache else open_record_cache(args.cache_dir)
+        http_cache = None if args.no_cache else open_http_cache(args.cache_dir)
+        journal = RunJournal(Path(args.output_dir) / JOURNAL_FILENAME, resume=args.resume)
+        paper_store = PaperStore(args.paper_store) if args.paper_store else open_paper_store(args.output_dir)
+        search_options = {
+            "use_history": args.use_history,
+            "record_cache": record_cache,
+            "pubmed_parser": args.parser,
+            "http_cache": http_cache,
+            "journal": journal,
+            "paper_store": paper_store
+        }
+        try:
+            if args.backfill:
+                components_keyword, components_orcid, keyword_frequencies = run_backfill(
+                    config, args.mode, slices,
+                    search_slice=lambda slice_config, slice_range, workers: search_and_process(
+                        slice_config, slice_range, args.mode, workers, **search_options
+                    ),
+                    checkpoint_dir=str(Path(args.output_dir) / CHECKPOINT_DIRNAME),
+                    max_workers=args.workers
+                )
+            
+            for window_range, window_config in windows:
+                if args.incremental:
+                    print(
+                        f" Incremental window {window_range[0]} to {window_range[1]}: "
+                        f"{len(window_config['topics'])} topic(s), {len(window_config['orcids'])} ORCID(s)"
+                    )
+                window_keyword, window_orcid, window_frequencies = search_and_process(
+                    window_config, window_range, args.mode, args.workers, **search_options
+                )
+                components_keyword.extend(window_keyword)
+                components_orcid.extend(window_orcid)
+                keyword_frequencies.update(window_frequencies)
+        finally:
+            journal.close()
+            paper_store.close()
+            if record_cache is not None:
+                record_cache.close()
+            if http_cache is not None:
+                http_cache.close()
         
-        # Process papers into components
-        print('Processing paper data...')
-        components_keyword, components_orcid = process_papers(
-            keyword_papers, pubmed_author_papers, crossref_papers
-        )
+        if args.resume and journal.reused:
+            print(f" Resumed run - reused {journal.reused} journaled query result(s) and record(s)")
+        
+        if len(windows) > 1:
+            components_keyword, components_orcid, _ = deduplicate_categories(components_keyword, components_orcid)
+        
+        new_components = components_keyword + components_orcid
+        
+        # Merge with the previous run's results
+        if args.incremental:
+            previous = load_previous_results(args.output_dir)
+            components_keyword, components_orcid, keyword_frequencies = merge_previous_results(
+                previous, components_keyword, components_orcid, keyword_frequencies
+            )
+            components_keyword, components_orcid, _ = deduplicate_categories(components_keyword, components_orcid)
+            
+            window_starts = [window_range[0] for window_range, _ in windows]
+            previous_range = previous.get("start_end_date")
+            if previous_range:
+                window_starts.append(previous_range[0])
+            date_range = (min(window_starts, default=date_range[0]), date_range[1])
+            print(f" Incremental mode - {len(new_components)} new paper(s) merged with previous results")
+        
+        # Flag or merge near-duplicates (preprints, corrections) across both categories,
+        # so a preprint found by one search and the published version found by the other match
+        if args.near_duplicates:
+            components, clusters = handle_near_duplicates(
+                components_keyword + components_orcid, args.near_duplicates, args.near_duplicate_threshold
+            )
+            components_keyword, components_orcid = split_categories(components)
+            print_near_duplicates("Keyword and author", clusters, args.near_duplicates == "merge")
         
         # Display results summary
         print_results_summary(components_keyword, components_orcid)
         
         if not (components_keyword or components_orcid):
             print("No papers found matching your criteria.")
+            if args.incremental:
+                record_completed_windows(run_state, windows, args.mode)
+                save_run_state(args.config_dir, run_state)
+            journal.discard()
             return
         
         # Generate outputs
-        generate_outputs(
+        outputs_ok = generate_outputs(
             config, date_range, components_keyword, components_orcid,
-            keyword_frequencies, args.output_dir, args.auto
+            keyword_frequencies, args.output_dir, args.auto,
+            args.dashboard, args.dashboard_sidecar, args.gzip_json, args.force
         )
         
-        # Open links in browser
+        if not outputs_ok:
+            # Keep the watermarks and journal so the run can be repeated
+            print(" ⚠️ Some outputs failed (see above); run again with --resume to retry without searching again.")
+            return
+        
+        # Archive only this run's papers; incremental results also hold earlier runs
+        if args.archive:
+            archived = new_components if args.incremental else components_keyword + components_orcid
+            write_archive(archived, str(Path(args.output_dir) / ARCHIVE_DIRNAME))
+        
+        # Advance watermarks only once the outputs are written
+        if args.incremental:
+            record_completed_windows(run_state, windows, args.mode)
+            save_run_state(args.config_dir, run_state)
+        
+        # The run is complete, so there is nothing left to resume
+        journal.discard()
+        
+        # Open links in browser (only papers found in this run)
         if not args.auto:
-            components_all = components_keyword + components_orcid
-            open_links_in_safari(components_all, auto_mode=args.auto)
+            open_links_in_safari(new_components, auto_mode=args.auto)
         
         print("Journal lookup completed successfully!")
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
+        if (Path(args.output_dir) / JOURNAL_FILENAME).exists():
+            print(" Run again with --resume to continue where this run stopped.")
     except Exception as e:
         print(f" Error: {e}")
         if not args.auto:
@@ -3,45 +3,80 @@ File writing utilities for the Journal Lookup Tool.
 Handles creation of text files, JSON exports, and other file outputs.
 """
 
+import gzip
 import json
 import os
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
+from core.paper import Paper
 
 
-def make_json_safe(obj: Any) -> Any:
+RESULTS_FILENAME = "results.json"
+
+
+class ResultsEncoder(json.JSONEncoder):
+    """
+    JSON encoder for results data.
+    
+    Paper records, Biopython Entrez elements, dates and sets are converted
+    as the encoder reaches them, instead of copying the whole data
+    structure into JSON-safe form first. Entrez StringElement and
+    ListElement values encode as their plain str/list contents.
     """
-    Convert objects to JSON-serializable format.
+    
+    def default(self, obj: Any) -> Any:
+        if isinstance(obj, Paper):
+            return obj.to_dict()
+        elif isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        elif isinstance(obj, (set, frozenset)):
+            return list(obj)
+        elif hasattr(obj, '__dict__'):
+            # Convert custom objects to dictionaries
+            return obj.__dict__
+        elif hasattr(obj, 'value') and hasattr(obj, 'attributes'):
+            # Handle special objects with value and attributes
+            return {'value': str(obj.value), 'attributes': obj.attributes}
+        # Fall back to the string form of anything else
+        return str(obj)
+
+
+def stream_json(obj: Any, file_handle, depth: int = 2, encoder: json.JSONEncoder = None) -> None:
+    """
+    Write obj as compact JSON, one element at a time.
+    
+    The outer `depth` levels of dicts and lists are written piece by piece;
+    each value below them (e.g. one paper record) is encoded in a single
+    call, so memory use stays near one record rather than a copy of the
+    whole dataset.
     
     Args:
-        obj: Object to convert
-        
-    Returns:
-        JSON-serializable version of the object
+        obj: Data to write
+        file_handle: Open text file handle
+        depth: Number of container levels to stream
+        encoder: Encoder to use (default: compact ResultsEncoder)
     """
-    if isinstance(obj, dict):
-        return {key: make_json_safe(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [make_json_safe(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return [make_json_safe(item) for item in obj]
-    elif hasattr(obj, '__dict__'):
-        # Convert custom objects to dictionaries
-        return make_json_safe(obj.__dict__)
-    elif hasattr(obj, 'value') and hasattr(obj, 'attributes'):
-        # Handle special objects with value and attributes
-        return {
-            'value': str(obj.value),
-            'attributes': make_json_safe(getattr(obj, 'attributes', {}))
-        }
+    if encoder is None:
+        encoder = ResultsEncoder(ensure_ascii=False, separators=(",", ":"))
+    
+    if depth > 0 and isinstance(obj, dict):
+        file_handle.write("{")
+        for index, (key, value) in enumerate(obj.items()):
+            if index:
+                file_handle.write(",")
+            file_handle.write(encoder.encode(key if isinstance(key, str) else str(key)) + ":")
+            stream_json(value, file_handle, depth - 1, encoder)
+        file_handle.write("}")
+    elif depth > 0 and isinstance(obj, (list, tuple)):
+        file_handle.write("[")
+        for index, item in enumerate(obj):
+            if index:
+                file_handle.write(",")
+            stream_json(item, file_handle, depth - 1, encoder)
+        file_handle.write("]")
     else:
-        # Try to convert to string for non-serializable objects
-        try:
-            json.dumps(obj)
-            return obj
-        except (TypeError, ValueError):
-            return str(obj)
+        file_handle.write(encoder.encode(obj))
 
 
 def write_txt_file(
@@ -228,34 +263,97 @@ def wrap_text(text: str, width: int = 70, indent: str = "") -> str:
     return wrapped
 
 
+def results_path(output_dir: str) -> Path:
+    """
+    Find the results file in an output directory.
+    
+    Args:
+        output_dir: Output directory path
+        
+    Returns:
+        Path of the newer of results.json and results.json.gz, or of
+        results.json if neither exists
+    """
+    candidates = [
+        path for path in (Path(output_dir) / RESULTS_FILENAME, Path(output_dir) / (RESULTS_FILENAME + ".gz"))
+        if path.exists()
+    ]
+    if not candidates:
+        return Path(output_dir) / RESULTS_FILENAME
+    return max(candidates, key=lambda path: path.stat().st_mtime)
+
+
+def open_results_file(filename: str, mode: str = 'r'):
+    """Open a results file as text, through gzip if its name ends in .gz."""
+    if str(filename).endswith(".gz"):
+        return gzip.open(filename, mode + 't', encoding='utf-8')
+    return open(filename, mode, encoding='utf-8')
+
+
 def write_json_file(
     data: Dict[str, Any],
-    filename: str = "results.json",
-    auto_mode: bool = False
-) -> None:
+    filename: str = RESULTS_FILENAME,
+    auto_mode: bool = False,
+    compress: bool = False
+) -> str:
     """
-    Write data to JSON file.
+    Write data to a compact JSON file.
+    
+    The data is encoded and written record by record without indentation
+    (see stream_json); with compress it is gzipped to <filename>.gz.
     
     Args:
         data: Data dictionary to write
         filename: Output filename
         auto_mode: Whether running in automatic mode
+        compress: Write a gzip-compressed file
+        
+    Returns:
+        Path of the written file, or None if cancelled
     """
+    if compress and not filename.endswith(".gz"):
+        filename += ".gz"
+    
     # Check if file exists and get permission if not in auto mode
     if Path(filename).exists() and not auto_mode:
         response = input(f"{filename} already exists. Overwrite? (y/n): ").strip().lower()
         if response not in ['y', 'yes']:
             print("JSON file creation cancelled.")
-            return
-    
-    # Make data JSON-safe
-    safe_data = make_json_safe(data)
+            return None
     
     # Write JSON file
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(safe_data, f, indent=2, ensure_ascii=False)
+    with open_results_file(filename, 'w') as f:
+        stream_json(data, f)
     
     print(f"  JSON data written to: {filename}")
+    return filename
+
+
+def append_keyword_counts(
+    start_end_date: Tuple[str, str],
+    keyword_counts: Dict[str, Any],
+    filename: str = "keyword_counts.jsonl"
+) -> None:
+    """
+    Append one line of keyword hit counts to a JSON Lines trend file.
+    
+    Args:
+        start_end_date: Date range tuple the counts cover
+        keyword_counts: Keyword to hit count mapping
+        filename: Output filename (created if missing)
+    """
+    start_date, end_date = start_end_date
+    entry = {
+        "generated_at": datetime.now().isoformat(),
+        "start_date": start_date,
+        "end_date": end_date,
+        "counts": keyword_counts
+    }
+    
+    with open(filename, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    
+    print(f"  Keyword counts appended to: {filename}")
 
 
 def write_csv_file(
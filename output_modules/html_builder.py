@@ -5,45 +5,20 @@ Creates interactive HTML dashboards with DataTables and dark/light mode support.
 
 import json
 import os
-from datetime import datetime, date
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Tuple
+from core.paper_processor import is_placeholder
+from output_modules.file_writers import write_json_file
 
 
-def make_json_safe(obj: Any) -> Any:
-    """
-    Convert objects to JSON-serializable format.
-    
-    Args:
-        obj: Object to convert
-        
-    Returns:
-        JSON-serializable version of the object
-    """
-    if isinstance(obj, (datetime, date)):
-        return obj.isoformat()
-    elif isinstance(obj, dict):
-        return {k: make_json_safe(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [make_json_safe(item) for item in obj]
-    elif isinstance(obj, tuple):
-        return [make_json_safe(item) for item in obj]
-    elif hasattr(obj, '__dict__'):
-        # Convert custom objects to dictionaries
-        return make_json_safe(obj.__dict__)
-    elif hasattr(obj, 'value') and hasattr(obj, 'attributes'):
-        # Handle special objects with value and attributes
-        return {
-            'value': str(obj.value),
-            'attributes': make_json_safe(getattr(obj, 'attributes', {}))
-        }
-    else:
-        # Try to convert to string for non-serializable objects
-        try:
-            json.dumps(obj)
-            return obj
-        except (TypeError, ValueError):
-            return str(obj)
+DASHBOARD_LAYOUTS = ("table", "virtual")
+
+# Order of the per-paper arrays in the virtual dashboard's data island
+DATA_ISLAND_FIELDS = ("title", "journal", "date", "link", "authors", "institution", "abstract", "source")
+
+# Fixed row height of the virtual table; rows are only rendered while in view
+VIRTUAL_ROW_HEIGHT = 44
 
 
 def safe_date_str(date: Any) -> str:
@@ -692,7 +667,7 @@ def write_table_section(f, components: List[Dict[str, Any]], paper_type: str) ->
 
 
 def write_html_scripts(f) -> None:
-    """Write JavaScript for interactivity."""
+    """Write JavaScript for the DataTables layout."""
     f.write("""
 <script src="https://code.jquery.com/jquery-3.7.0.min.js"></script>
 <script src="https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js"></script>
@@ -739,19 +714,6 @@ def write_html_scripts(f) -> None:
     }
   }
 
-  function toggleTheme() {
-    var body = document.body;
-    var themeText = document.getElementById('theme-text');
-    
-    if (body.getAttribute('data-theme') === 'light') {
-      body.setAttribute('data-theme', 'dark');
-      themeText.textContent = 'Light Mode';
-    } else {
-      body.setAttribute('data-theme', 'light');
-      themeText.textContent = 'Dark Mode';
-    }
-  }
-  
   function exportData() {
     // Export current view data as CSV
     var tables = document.querySelectorAll('table.display');
@@ -790,6 +752,106 @@ def write_html_scripts(f) -> None:
     document.body.removeChild(link);
   }
   
+  function generateStatistics() {
+    const tables = document.querySelectorAll('table.display tbody tr');
+    let totalPapers = 0;
+    let journals = {};
+    let authors = {};
+    let sources = {};
+    let years = {};
+    let totalAuthorCount = 0;
+
+    tables.forEach(row => {
+      const cells = row.querySelectorAll('td');
+      if (cells.length < 6) return;
+
+      totalPapers++;
+
+      // Extract journal
+      const journal = cells[2].textContent.trim();
+      if (journal && journal !== 'N/A') {
+        journals[journal] = (journals[journal] || 0) + 1;
+      }
+
+      // Extract authors
+      const authorCell = cells[5];
+      const authorText = authorCell.textContent.trim();
+      if (authorText && authorText !== 'N/A') {
+        const authorList = authorText.split(',').map(a => a.trim()).filter(a => 
+          a && !a.includes('(+') && !a.includes('more)')
+        );
+        totalAuthorCount += authorList.length;
+        
+        authorList.forEach(author => {
+          if (author.length > 3) {
+            authors[author] = (authors[author] || 0) + 1;
+          }
+        });
+      }
+
+      // Extract year from date
+      const dateCell = cells[3].textContent.trim();
+      const yearMatch = dateCell.match(/(\\d{4})/);
+      if (yearMatch) {
+        const year = yearMatch[1];
+        years[year] = (years[year] || 0) + 1;
+      }
+
+      // Determine source from table ID
+      const table = row.closest('table');
+      if (table) {
+        const tableId = table.id || '';
+        if (tableId.includes('keyword')) {
+          sources['keyword'] = (sources['keyword'] || 0) + 1;
+        } else if (tableId.includes('crossref')) {
+          sources['crossref'] = (sources['crossref'] || 0) + 1;
+        } else if (tableId.includes('pubmed')) {
+          sources['pubmed_author'] = (sources['pubmed_author'] || 0) + 1;
+        } else {
+          sources['other'] = (sources['other'] || 0) + 1;
+        }
+      }
+    });
+
+    const sortByCount = (obj) => Object.entries(obj)
+      .map(([name, count]) => ({name, count}))
+      .sort((a, b) => b.count - a.count);
+
+    return {
+      totalPapers,
+      totalJournals: Object.keys(journals).length,
+      totalAuthors: Object.keys(authors).length,
+      averageAuthorsPerPaper: totalPapers > 0 ? totalAuthorCount / totalPapers : 0,
+      topJournals: sortByCount(journals),
+      topAuthors: sortByCount(authors),
+      sourceBreakdown: sources,
+      yearBreakdown: Object.fromEntries(
+        Object.entries(years).sort(([a], [b]) => b.localeCompare(a))
+      )
+    };
+  }
+</script>
+""")
+    write_shared_scripts(f)
+
+
+def write_shared_scripts(f) -> None:
+    """Write the theme and statistics scripts shared by both layouts and close the page."""
+    f.write("""
+<script>
+  function toggleTheme() {
+    var body = document.body;
+    var themeText = document.getElementById('theme-text');
+    
+    if (body.getAttribute('data-theme') === 'light') {
+      body.setAttribute('data-theme', 'dark');
+      themeText.textContent = 'Light Mode';
+    } else {
+      body.setAttribute('data-theme', 'light');
+      themeText.textContent = 'Dark Mode';
+    }
+  }
+  
   function showStatistics() {
     const modal = document.getElementById('statisticsModal');
     const content = document.getElementById('statisticsContent');
@@ -870,96 +932,450 @@ def write_html_scripts(f) -> None:
     document.getElementById('statisticsModal').style.display = 'none';
   }
 
-  function generateStatistics() {
-    const tables = document.querySelectorAll('table.display tbody tr');
-    let totalPapers = 0;
-    let journals = {};
-    let authors = {};
-    let sources = {};
-    let years = {};
-    let totalAuthorCount = 0;
+  // Close modal when clicking outside
+  window.onclick = function(event) {
+    const modal = document.getElementById('statisticsModal');
+    if (event.target === modal) {
+      closeStatistics();
+    }
+  }
+</script>
+</body>
+</html>
+""")
 
-    tables.forEach(row => {
-      const cells = row.querySelectorAll('td');
-      if (cells.length < 6) return;
 
-      totalPapers++;
+def _island_text(value: Any) -> str:
+    """Convert a field to data island text (placeholders become empty)."""
+    return "" if is_placeholder(value) else str(value)
 
-      // Extract journal
-      const journal = cells[2].textContent.trim();
-      if (journal && journal !== 'N/A') {
-        journals[journal] = (journals[journal] || 0) + 1;
-      }
 
-      // Extract authors
-      const authorCell = cells[5];
-      const authorText = authorCell.textContent.trim();
-      if (authorText && authorText !== 'N/A') {
-        const authorList = authorText.split(',').map(a => a.trim()).filter(a => 
-          a && !a.includes('(+') && !a.includes('more)')
-        );
-        totalAuthorCount += authorList.length;
-        
-        authorList.forEach(author => {
-          if (author.length > 3) {
-            authors[author] = (authors[author] || 0) + 1;
-          }
-        });
-      }
+def _island_list(value: Any) -> List[str]:
+    """Convert a list field to data island strings, dropping placeholders."""
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, (list, tuple)):
+        return []
+    return [str(item) for item in value if not is_placeholder(item)]
 
-      // Extract year from date
-      const dateCell = cells[3].textContent.trim();
-      const yearMatch = dateCell.match(/(\\d{4})/);
-      if (yearMatch) {
-        const year = yearMatch[1];
-        years[year] = (years[year] || 0) + 1;
-      }
 
-      // Determine source from table ID
-      const table = row.closest('table');
-      if (table) {
-        const tableId = table.id || '';
-        if (tableId.includes('keyword')) {
-          sources['keyword'] = (sources['keyword'] || 0) + 1;
-        } else if (tableId.includes('crossref')) {
-          sources['crossref'] = (sources['crossref'] || 0) + 1;
-        } else if (tableId.includes('pubmed')) {
-          sources['pubmed_author'] = (sources['pubmed_author'] || 0) + 1;
-        } else {
-          sources['other'] = (sources['other'] || 0) + 1;
-        }
-      }
-    });
+def build_dashboard_data(components: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the compact data island of the virtual dashboard.
+
+    Each paper is an array in DATA_ISLAND_FIELDS order; journals and
+    sources are stored once and referenced by index.
+
+    Args:
+        components: List of paper components
+
+    Returns:
+        JSON-serializable dictionary with fields, journals, sources and papers
+    """
+    journals: Dict[str, int] = {}
+    sources: Dict[str, int] = {}
+    papers = []
+    for comp in components:
+        date_str = safe_date_str(comp.get("Date"))
+        link = safe_link(comp.get("Link"))
+        papers.append([
+            _island_text(comp.get("Title")),
+            journals.setdefault(_island_text(comp.get("Journal")), len(journals)),
+            "" if date_str == "N/A" else _island_text(date_str),
+            "" if link == "N/A" else _island_text(link),
+            _island_list(safe_authors(comp.get("Authors", []))),
+            _island_list(comp.get("Institution", [])),
+            _island_text(comp.get("Abstract")),
+            sources.setdefault(str(comp.get("Source", "unknown")), len(sources))
+        ])
+
+    return {
+        "fields": list(DATA_ISLAND_FIELDS),
+        "journals": list(journals),
+        "sources": list(sources),
+        "papers": papers
+    }
+
+
+def write_virtual_styles(f) -> None:
+    """Write the styles of the virtual table layout."""
+    f.write(f"""
+  <style>
+    .vt-toolbar {{
+      display: flex;
+      gap: 10px;
+      align-items: center;
+      margin-bottom: 10px;
+    }}
+
+    .vt-filter {{
+      flex: 1;
+      max-width: 420px;
+      padding: 6px 10px;
+      border: 1px solid var(--border-color);
+      border-radius: 4px;
+      background: var(--bg-color);
+      color: var(--text-color);
+    }}
+
+    .vt-grid {{
+      display: grid;
+      grid-template-columns: minmax(0, 3fr) minmax(0, 1.4fr) 100px minmax(0, 2fr) minmax(0, 1.2fr);
+      gap: 8px;
+      align-items: center;
+    }}
+
+    .vt-header {{
+      background: var(--header-bg);
+      border-bottom: 2px solid var(--border-color);
+      padding: 10px 8px;
+      font-weight: 600;
+    }}
+
+    .vt-header [data-sort] {{
+      cursor: pointer;
+    }}
+
+    .vt-viewport {{
+      position: relative;
+      max-height: 600px;
+      overflow-y: auto;
+      border-bottom: 1px solid var(--border-color);
+    }}
+
+    .vt-rows {{
+      position: absolute;
+      top: 0;
+      left: 0;
+      right: 0;
+    }}
+
+    .vt-row {{
+      height: {VIRTUAL_ROW_HEIGHT}px;
+      box-sizing: border-box;
+      padding: 0 8px;
+      border-bottom: 1px solid var(--border-color);
+      cursor: pointer;
+    }}
+
+    .vt-row > span {{
+      overflow: hidden;
+      white-space: nowrap;
+      text-overflow: ellipsis;
+    }}
+
+    .vt-row:hover, .vt-row.selected {{
+      background-color: var(--hover-bg);
+    }}
+
+    .vt-detail:empty {{
+      display: none;
+    }}
+
+    .vt-detail {{
+      margin-top: 10px;
+      padding: 15px;
+      background: var(--header-bg);
+      border-radius: 6px;
+      border-left: 3px solid var(--link-color);
+    }}
+
+    .vt-detail h3 {{
+      margin-top: 0;
+    }}
+  </style>
+""")
+
+
+def write_virtual_sections(f, data: Dict[str, Any], paper_types: List[str]) -> None:
+    """Write an empty virtual table for each paper type; rows are rendered by script."""
+    counts = {}
+    for paper in data["papers"]:
+        source = data["sources"][paper[-1]]
+        counts[source] = counts.get(source, 0) + 1
+
+    for paper_type in paper_types:
+        f.write(f"""
+  <div class="section vt-section" data-source="{data['sources'].index(paper_type)}">
+    <h2>
+      {get_source_label(paper_type)}
+      <span style="font-size: 0.7em; font-weight: normal; color: var(--text-color); opacity: 0.7;">
+        ({counts[paper_type]} papers)
+      </span>
+    </h2>
+    <div class="vt-toolbar">
+      <input type="search" class="vt-filter" placeholder="Filter by title, author, journal or abstract">
+      <span class="vt-count"></span>
+    </div>
+    <div class="vt-header vt-grid">
+      <span data-sort="title">Title</span>
+      <span data-sort="journal">Journal</span>
+      <span data-sort="date">Date &#9660;</span>
+      <span data-sort="authors">Authors (first & last)</span>
+      <span>DOI</span>
+    </div>
+    <div class="vt-viewport">
+      <div class="vt-spacer"></div>
+      <div class="vt-rows"></div>
+    </div>
+    <div class="vt-detail"></div>
+  </div>
+""")
+
+
+def write_data_island(f, data: Dict[str, Any], html_name: str, sidecar: bool = False) -> None:
+    """
+    Write the dashboard data inline as a JSON data island, or to a sidecar script.
+
+    Args:
+        f: Open HTML file handle
+        data: Data from build_dashboard_data
+        html_name: Output HTML filename (the sidecar is written next to it)
+        sidecar: Write <name>.data.js next to the HTML instead of inlining the data
+    """
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    if sidecar:
+        sidecar_path = Path(html_name).with_suffix(".data.js")
+        with open(sidecar_path, 'w', encoding='utf-8') as sf:
+            sf.write(f"window.dashboardData = {payload};\n")
+        # A script tag (unlike fetch) also loads from file:// URLs
+        f.write(f'\n<script src="{sidecar_path.name}"></script>\n')
+        return
+
+    # "</" would end the script element early
+    payload = payload.replace("</", "<\\/")
+    f.write(f'\n<script id="dashboard-data" type="application/json">{payload}</script>\n')
+
+
+def write_virtual_scripts(f) -> None:
+    """Write JavaScript for the virtual table layout."""
+    f.write(f"""
+<script>
+  const ROW_HEIGHT = {VIRTUAL_ROW_HEIGHT};
+  const OVERSCAN = 8;
+  const dashboardData = window.dashboardData || JSON.parse(document.getElementById('dashboard-data').textContent);
+  const papers = dashboardData.papers;
+  const F = {{}};
+  dashboardData.fields.forEach((name, index) => {{ F[name] = index; }});
+  const views = [];
+  let searchTexts = null;
+
+  function escapeHtml(text) {{
+    return String(text).replace(/[&<>"']/g, c => ({{'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'}})[c]);
+  }}
+
+  function doiHref(link) {{
+    return /^https?:/.test(link) ? link : 'https://doi.org/' + link;
+  }}
+
+  function doiAnchor(link) {{
+    if (!link) return 'N/A';
+    return '<a href="' + escapeHtml(doiHref(link)) + '" target="_blank" class="doi-link">' + escapeHtml(link) + '</a>';
+  }}
+
+  function authorSummary(authors) {{
+    if (!authors.length) return 'N/A';
+    if (authors.length <= 2) return authors.join(', ');
+    return authors[0] + ', ' + authors[authors.length - 1] + ' (+' + (authors.length - 2) + ' more)';
+  }}
+
+  function sortValue(paper, key) {{
+    if (key === 'journal') return dashboardData.journals[paper[F.journal]];
+    if (key === 'authors') return paper[F.authors][0] || '';
+    return paper[F[key]];
+  }}
+
+  function applyView(view) {{
+    const query = view.filter.value.trim().toLowerCase();
+    let rows = view.all;
+    if (query) {{
+      // Search text is built on first use, not at page load
+      if (!searchTexts) {{
+        searchTexts = papers.map(p => [p[F.title], dashboardData.journals[p[F.journal]], p[F.authors].join(' '), p[F.abstract]].join(' ').toLowerCase());
+      }}
+      rows = rows.filter(index => searchTexts[index].includes(query));
+    }}
+    const direction = view.sortDesc ? -1 : 1;
+    view.rows = rows.slice().sort((a, b) => {{
+      const x = sortValue(papers[a], view.sortKey), y = sortValue(papers[b], view.sortKey);
+      return x < y ? -direction : x > y ? direction : a - b;
+    }});
+    view.spacer.style.height = (view.rows.length * ROW_HEIGHT) + 'px';
+    view.count.textContent = view.rows.length + ' of ' + view.all.length + ' papers';
+    view.first = view.last = -1;
+    view.viewport.scrollTop = 0;
+    renderView(view);
+  }}
+
+  function renderView(view) {{
+    const top = view.viewport.scrollTop;
+    const height = view.viewport.clientHeight || 600;
+    const first = Math.max(0, Math.floor(top / ROW_HEIGHT) - OVERSCAN);
+    const last = Math.min(view.rows.length, Math.ceil((top + height) / ROW_HEIGHT) + OVERSCAN);
+    if (first === view.first && last === view.last) return;
+    view.first = first;
+    view.last = last;
+
+    let html = '';
+    for (let position = first; position < last; position++) {{
+      const index = view.rows[position];
+      const paper = papers[index];
+      html += '<div class="vt-row vt-grid' + (index === view.selected ? ' selected' : '') + '" data-index="' + index + '">'
+        + '<span title="' + escapeHtml(paper[F.title]) + '">' + escapeHtml(paper[F.title] || 'N/A') + '</span>'
+        + '<span>' + escapeHtml(dashboardData.journals[paper[F.journal]] || 'N/A') + '</span>'
+        + '<span>' + escapeHtml(paper[F.date] || 'N/A') + '</span>'
+        + '<span>' + escapeHtml(authorSummary(paper[F.authors])) + '</span>'
+        + '<span>' + doiAnchor(paper[F.link]) + '</span>'
+        + '</div>';
+    }}
+    view.body.style.transform = 'translateY(' + (first * ROW_HEIGHT) + 'px)';
+    view.body.innerHTML = html;
+  }}
+
+  function showDetail(view, index) {{
+    // Abstracts and full author lists are only put in the DOM when a row is opened
+    view.selected = view.selected === index ? -1 : index;
+    view.first = view.last = -1;
+    renderView(view);
+    if (view.selected < 0) {{
+      view.detail.innerHTML = '';
+      return;
+    }}
+    const paper = papers[index];
+    view.detail.innerHTML = '<h3>' + escapeHtml(paper[F.title] || 'N/A') + '</h3>'
+      + '<p><strong>Journal:</strong> ' + escapeHtml(dashboardData.journals[paper[F.journal]] || 'N/A')
+      + ' &middot; <strong>Date:</strong> ' + escapeHtml(paper[F.date] || 'N/A')
+      + ' &middot; <strong>DOI:</strong> ' + doiAnchor(paper[F.link]) + '</p>'
+      + '<p><strong>Authors:</strong> ' + escapeHtml(paper[F.authors].join(', ') || 'N/A') + '</p>'
+      + '<p><strong>Institutions:</strong> ' + escapeHtml(paper[F.institution].join('; ') || 'N/A') + '</p>'
+      + '<p><strong>Abstract:</strong><br>' + escapeHtml(paper[F.abstract] || 'No abstract available') + '</p>';
+  }}
+
+  document.querySelectorAll('.vt-section').forEach(section => {{
+    const sourceIndex = Number(section.dataset.source);
+    const view = {{
+      all: [],
+      rows: [],
+      sortKey: 'date',
+      sortDesc: true,
+      selected: -1,
+      first: -1,
+      last: -1,
+      filter: section.querySelector('.vt-filter'),
+      count: section.querySelector('.vt-count'),
+      viewport: section.querySelector('.vt-viewport'),
+      spacer: section.querySelector('.vt-spacer'),
+      body: section.querySelector('.vt-rows'),
+      detail: section.querySelector('.vt-detail')
+    }};
+    papers.forEach((paper, index) => {{
+      if (paper[F.source] === sourceIndex) view.all.push(index);
+    }});
+    views.push(view);
+
+    let frame = null;
+    view.viewport.addEventListener('scroll', () => {{
+      if (frame === null) {{
+        frame = requestAnimationFrame(() => {{ frame = null; renderView(view); }});
+      }}
+    }});
+
+    let timer = null;
+    view.filter.addEventListener('input', () => {{
+      clearTimeout(timer);
+      timer = setTimeout(() => applyView(view), 150);
+    }});
+
+    view.body.addEventListener('click', event => {{
+      const row = event.target.closest('.vt-row');
+      if (row && !event.target.closest('a')) showDetail(view, Number(row.dataset.index));
+    }});
+
+    section.querySelectorAll('.vt-header [data-sort]').forEach(header => {{
+      header.addEventListener('click', () => {{
+        const key = header.dataset.sort;
+        view.sortDesc = view.sortKey === key ? !view.sortDesc : key === 'date';
+        view.sortKey = key;
+        section.querySelectorAll('.vt-header [data-sort]').forEach(other => {{
+          other.textContent = other.textContent.replace(/ [\\u25B2\\u25BC]$/, '');
+        }});
+        header.textContent += view.sortDesc ? ' \\u25BC' : ' \\u25B2';
+        applyView(view);
+      }});
+    }});
+
+    applyView(view);
+  }});
+
+  function exportData() {{
+    // Export the filtered, sorted rows of every section as CSV
+    const quote = value => '"' + String(value).replace(/"/g, '""') + '"';
+    const lines = [];
+    views.forEach((view, viewIndex) => {{
+      if (viewIndex > 0) lines.push('', '');
+      lines.push(['Title', 'Abstract', 'Journal', 'Date', 'DOI', 'Authors', 'Institutions'].map(quote).join(','));
+      view.rows.forEach(index => {{
+        const paper = papers[index];
+        lines.push([
+          paper[F.title], paper[F.abstract], dashboardData.journals[paper[F.journal]], paper[F.date],
+          paper[F.link], paper[F.authors].join(', '), paper[F.institution].join(', ')
+        ].map(quote).join(','));
+      }});
+    }});
+
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(new Blob([lines.join('\\n') + '\\n'], {{type: 'text/csv;charset=utf-8'}}));
+    link.download = 'journal_lookup_results.csv';
+    document.body.appendChild(link);
+    link.click();
+    document.body.removeChild(link);
+    URL.revokeObjectURL(link.href);
+  }}
+
+  function generateStatistics() {{
+    let journals = {{}};
+    let authors = {{}};
+    let sources = {{}};
+    let years = {{}};
+    let totalAuthorCount = 0;
+
+    papers.forEach(paper => {{
+      const journal = dashboardData.journals[paper[F.journal]];
+      if (journal) journals[journal] = (journals[journal] || 0) + 1;
+
+      totalAuthorCount += paper[F.authors].length;
+      paper[F.authors].forEach(author => {{
+        authors[author] = (authors[author] || 0) + 1;
+      }});
+
+      const yearMatch = paper[F.date].match(/(\\d{{4}})/);
+      if (yearMatch) years[yearMatch[1]] = (years[yearMatch[1]] || 0) + 1;
+
+      const source = dashboardData.sources[paper[F.source]];
+      sources[source] = (sources[source] || 0) + 1;
+    }});
 
     const sortByCount = (obj) => Object.entries(obj)
-      .map(([name, count]) => ({name, count}))
+      .map(([name, count]) => ({{name, count}}))
       .sort((a, b) => b.count - a.count);
 
-    return {
-      totalPapers,
+    return {{
+      totalPapers: papers.length,
       totalJournals: Object.keys(journals).length,
       totalAuthors: Object.keys(authors).length,
-      averageAuthorsPerPaper: totalPapers > 0 ? totalAuthorCount / totalPapers : 0,
+      averageAuthorsPerPaper: papers.length > 0 ? totalAuthorCount / papers.length : 0,
       topJournals: sortByCount(journals),
       topAuthors: sortByCount(authors),
       sourceBreakdown: sources,
       yearBreakdown: Object.fromEntries(
         Object.entries(years).sort(([a], [b]) => b.localeCompare(a))
       )
-    };
-  }
-
-  // Close modal when clicking outside
-  window.onclick = function(event) {
-    const modal = document.getElementById('statisticsModal');
-    if (event.target === modal) {
-      closeStatistics();
-    }
-  }
+    }};
+  }}
 </script>
-</body>
-</html>
 """)
+    write_shared_scripts(f)
 
 
 def write_html_dashboard(
@@ -968,8 +1384,10 @@ def write_html_dashboard(
     components: List[Dict[str, Any]],
     keyword_frequency_dict: Dict[str, int],
     html_name: str = "publications.html",
-    json_dump_path: str = "results.json",
-    auto_mode: bool = False
+    json_dump_path: str = None,
+    auto_mode: bool = False,
+    layout: str = "table",
+    sidecar: bool = False
 ) -> None:
     """
     Write an interactive HTML dashboard with the search results.
@@ -980,8 +1398,14 @@ def write_html_dashboard(
         components: List of paper components
         keyword_frequency_dict: Keyword frequency data
         html_name: Output HTML filename
-        json_dump_path: Output JSON filename
+        json_dump_path: Also write the data to this JSON file (main writes
+            results.json itself, so this is off by default)
         auto_mode: Whether running in automatic mode
+        layout: "table" renders every paper as a DataTables row; "virtual"
+            embeds the papers once as JSON and renders only visible rows,
+            which keeps large dashboards fast to open
+        sidecar: With the virtual layout, write the data to <name>.data.js
+            instead of inlining it
     """
     # Check if file exists and get permission if not in auto mode
     if Path(html_name).exists() and not auto_mode:
@@ -990,31 +1414,38 @@ def write_html_dashboard(
             print("HTML dashboard creation cancelled.")
             return
     
-    # Save JSON data
-    data_for_json = {
-        "start_end_date": [str(d) for d in start_end_date],
-        "config_file_dict": make_json_safe(config_file_dict),
-        "components": make_json_safe(components),
-        "keyword_frequency_dict": make_json_safe(keyword_frequency_dict),
-        "generated_at": datetime.now().isoformat()
-    }
-    
-    with open(json_dump_path, 'w', encoding='utf-8') as jf:
-        json.dump(data_for_json, jf, indent=2)
+    if json_dump_path:
+        write_json_file(
+            data={
+                "start_end_date": [str(d) for d in start_end_date],
+                "config_file_dict": config_file_dict,
+                "components": components,
+                "keyword_frequency_dict": keyword_frequency_dict,
+                "generated_at": datetime.now().isoformat()
+            },
+            filename=json_dump_path,
+            auto_mode=True
+        )
     
     # Write HTML dashboard
     with open(html_name, 'w', encoding='utf-8') as f:
         write_html_head(f)
         write_html_header(f, config_file_dict, start_end_date, components)
         
-        # Write table sections for each paper type
-        for paper_type in get_table_types(components):
-            write_table_section(f, components, paper_type)
-        
-        write_html_scripts(f)
+        if layout == "virtual":
+            data = build_dashboard_data(components)
+            write_virtual_styles(f)
+            write_virtual_sections(f, data, get_table_types(components))
+            write_data_island(f, data, html_name, sidecar)
+            write_virtual_scripts(f)
+        else:
+            # Write table sections for each paper type
+            for paper_type in get_table_types(components):
+                write_table_section(f, components, paper_type)
+            
+            write_html_scripts(f)
     
     print(f"Interactive HTML dashboard written to: {html_name}")
-    print(f"Data saved to: {json_dump_path}")
 
 
 # Legacy function name for backward compatibility
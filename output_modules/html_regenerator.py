@@ -4,20 +4,39 @@ import json
 import argparse
 import os
 from datetime import datetime
+from output_modules.file_writers import open_results_file
+from output_modules.paper_archive import PaperArchive
+
+# Paper fields the regenerated table shows (keywords and PMIDs are not read)
+ARCHIVE_COLUMNS_USED = ["title", "abstract", "journal", "date", "link", "authors", "institution"]
 
 def regenerate_html_from_json(json_path: str, output_html: str = "0_publications_regenerated.html"):
     if not os.path.exists(json_path):
         print(f"JSON file not found at {json_path}")
         return
 
-    with open(json_path, "r", encoding="utf-8") as f:
+    with open_results_file(json_path) as f:
         data = json.load(f)
 
     start_end_date = data.get("start_end_date", ["?", "?"])
     config_file_dict = data.get("config_file_dict", {})
     components = data.get("components", [])
-    keyword_frequency_dict = data.get("keyword_frequency_dict", {})
+    write_regenerated_html(components, start_end_date, config_file_dict, output_html)
+
+
+def regenerate_html_from_archive(archive_dir: str, output_html: str = "0_publications_regenerated.html",
+                                 sources=None, start_date=None, end_date=None):
+    if not os.path.isdir(archive_dir):
+        print(f"Archive not found at {archive_dir}")
+        return
+
+    components = PaperArchive(archive_dir).read_papers(
+        ARCHIVE_COLUMNS_USED, sources=sources, start_date=start_date, end_date=end_date
+    )
+    write_regenerated_html(components, [start_date or "?", end_date or "?"], {}, output_html)
+
 
+def write_regenerated_html(components, start_end_date, config_file_dict, output_html):
     with open(output_html, 'w', encoding='utf-8') as f:
         f.write(f"""
 <!DOCTYPE html>
@@ -64,10 +83,21 @@ def regenerate_html_from_json(json_path: str, output_html: str = "0_publications
             journal = comp.get("Journal", "N/A")
             authors = ", ".join(comp.get("Authors", [])) or "N/A"
             institutions = ", ".join(comp.get("Institution", [])) or "N/A"
-            link = comp.get("Link", [""])[0]
-            date = comp.get("Date", [{}])[0]
-            date_str = f"{date.get('Year','')}/{date.get('Month','')}/{date.get('Day','')}" if all(k in date for k in ('Year','Month','Day')) else "N/A"
-            doi_link = f'<a href="https://doi.org/{link}" target="_blank">{link}</a>' if link else "N/A"
+            link = comp.get("Link", "")
+            if isinstance(link, list):
+                link = link[0] if link else ""
+            if link.startswith("No "):
+                link = ""
+            date = comp.get("Date", "N/A")
+            if isinstance(date, list):
+                date = date[0] if date else {}
+                date_str = f"{date.get('Year','')}/{date.get('Month','')}/{date.get('Day','')}" if all(k in date for k in ('Year','Month','Day')) else "N/A"
+            else:
+                date_str = date
+            if link.startswith("http"):
+                doi_link = f'<a href="{link}" target="_blank">{link}</a>'
+            else:
+                doi_link = f'<a href="https://doi.org/{link}" target="_blank">{link}</a>' if link else "N/A"
             abstract_id = f"abstract_{hash(title)}"
 
             f.write(f"""
@@ -111,6 +141,13 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Regenerate HTML dashboard from saved JSON output.")
     parser.add_argument("--json", default="last_results.json", help="Path to saved JSON file")
     parser.add_argument("--out", default="0_publications_regenerated.html", help="Output HTML file path")
+    parser.add_argument("--archive", help="Read papers from a columnar archive directory instead of --json")
+    parser.add_argument("--since", help="With --archive, only papers dated on or after YYYY/MM/DD")
+    parser.add_argument("--until", help="With --archive, only papers dated on or before YYYY/MM/DD")
+    parser.add_argument("--source", action="append", help="With --archive, only papers from this source (repeatable)")
     args = parser.parse_args()
 
-    regenerate_html_from_json(args.json, args.out)
+    if args.archive:
+        regenerate_html_from_archive(args.archive, args.out, args.source, args.since, args.until)
+    else:
+        regenerate_html_from_json(args.json, args.out)
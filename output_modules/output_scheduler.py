@@ -0,0 +1,274 @@
+"""
+Output scheduler for the Journal Lookup Tool.
+Runs the independent output writers (text, PowerPoint, HTML, JSON) at the
+same time: CPU-heavy writers in a separate process, I/O-bound writers on
+threads. Each writer is timed, a failing writer is reported without
+stopping the others, and writers whose inputs have not changed since they
+last wrote their output are skipped.
+"""
+
+import hashlib
+import multiprocessing
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+from output_modules.file_writers import stream_json
+from utils.display import buffered_output
+
+
+# Writers that only wait on disk share a small thread pool
+DEFAULT_OUTPUT_THREADS = 4
+
+# Input digests are stored next to each output as <output><DIGEST_SUFFIX>
+DIGEST_SUFFIX = ".digest"
+
+
+class _HashWriter:
+    """File-like sink that hashes the text written to it."""
+
+    def __init__(self):
+        self.hash = hashlib.sha256()
+
+    def write(self, text: str) -> None:
+        self.hash.update(text.encode("utf-8"))
+
+
+def inputs_digest(*inputs: Any) -> str:
+    """
+    Compute a stable digest of writer inputs.
+
+    Inputs are encoded like results.json (paper records, dates and Entrez
+    elements included), so equal data gives equal digests across runs.
+    A digest can itself be an input, which lets large component lists be
+    hashed once and shared by several writers.
+
+    Args:
+        *inputs: JSON-encodable values
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    writer = _HashWriter()
+    stream_json(list(inputs), writer, depth=3)
+    return writer.hash.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _writer_fingerprint(func: Callable[..., Any]) -> str:
+    """Hash the source of a writer's module, so template changes invalidate stored digests."""
+    module_file = getattr(sys.modules.get(func.__module__), "__file__", None)
+    try:
+        return hashlib.sha256(Path(module_file).read_bytes()).hexdigest()
+    except (OSError, TypeError):
+        return f"{func.__module__}.{func.__qualname__}"
+
+
+def output_task(
+    name: str,
+    func: Callable[..., Any],
+    in_process: bool = False,
+    artifacts: Sequence[Union[str, Path]] = (),
+    digest: Optional[str] = None,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """
+    Describe one output writer for run_output_tasks.
+
+    Args:
+        name: Label used in timings and error messages
+        func: Writer function (module-level, so it can run in another process)
+        in_process: Run in a worker process (for CPU-bound writers)
+        artifacts: Files the writer produces; the first one gets the digest file
+        digest: Digest of everything the output depends on (see
+            inputs_digest); without it the writer always runs
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Task dictionary
+    """
+    if digest is not None:
+        digest = inputs_digest(name, digest, _writer_fingerprint(func))
+    return {
+        "name": name, "func": func, "in_process": in_process,
+        "artifacts": [Path(artifact) for artifact in artifacts], "digest": digest, "kwargs": kwargs
+    }
+
+
+def _digest_path(task: Dict[str, Any]) -> Optional[Path]:
+    """Return the digest file of a task, or None if it cannot be skipped."""
+    if task["digest"] is None or not task["artifacts"]:
+        return None
+    artifact = task["artifacts"][0]
+    return artifact.with_name(artifact.name + DIGEST_SUFFIX)
+
+
+def _is_unchanged(task: Dict[str, Any]) -> bool:
+    """Check whether a task's outputs exist and were written from the same inputs."""
+    digest_path = _digest_path(task)
+    if digest_path is None or not all(artifact.exists() for artifact in task["artifacts"]):
+        return False
+    try:
+        return digest_path.read_text(encoding="utf-8").strip() == task["digest"]
+    except OSError:
+        return False
+
+
+def _modified_time(path: Path) -> Optional[int]:
+    """Return a file's modification time in nanoseconds, or None if it is missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _record_digest(task: Dict[str, Any], result: Dict[str, Any], previous_mtime: Optional[int]) -> None:
+    """Store the input digest next to an output the writer has just rewritten."""
+    digest_path = _digest_path(task)
+    if digest_path is None:
+        return
+    # A declined overwrite prompt succeeds without touching the old output
+    rewritten = _modified_time(task["artifacts"][0]) not in (None, previous_mtime)
+    if result["ok"] and rewritten and all(artifact.exists() for artifact in task["artifacts"]):
+        digest_path.write_text(task["digest"] + "\n", encoding="utf-8")
+    else:
+        # A failed or cancelled write must not be mistaken for an up-to-date one
+        digest_path.unlink(missing_ok=True)
+
+
+def _run_task(func: Callable[..., Any], kwargs: Dict[str, Any], buffered: bool = False) -> Dict[str, Any]:
+    """
+    Run a writer and describe the outcome as {"ok", "seconds", "error", "output"}.
+
+    With buffered, what the writer prints is returned as "output" instead of
+    being shown, so concurrent writers cannot interleave their messages.
+    """
+    started = time.perf_counter()
+    with buffered_output() if buffered else nullcontext() as buffer:
+        try:
+            func(**kwargs)
+            error = None
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+    return {
+        "ok": error is None, "seconds": time.perf_counter() - started, "error": error,
+        "output": buffer.getvalue() if buffer is not None else ""
+    }
+
+
+def run_output_tasks(
+    tasks: List[Dict[str, Any]],
+    parallel: bool = True,
+    max_threads: int = DEFAULT_OUTPUT_THREADS,
+    force: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run output writers and collect per-writer timings and failures.
+
+    Process tasks use "spawn" workers (the macOS default, and safe to start
+    while other threads are running); a worker that crashes fails only the
+    process tasks, never this process. Without parallel, tasks run one
+    after another in order, which keeps interactive overwrite prompts
+    readable.
+
+    Tasks with a digest are skipped when their outputs exist and the digest
+    stored next to them matches, unless force is set.
+
+    Args:
+        tasks: Tasks from output_task
+        parallel: Run tasks concurrently
+        max_threads: Maximum number of writer threads
+        force: Run every writer, even if its inputs are unchanged
+
+    Returns:
+        Dictionary mapping task name to {"ok", "seconds", "error", "skipped"}
+        in task order (concurrent writers' printed "output" is shown as each
+        result is collected)
+    """
+    results = {
+        task["name"]: {"ok": True, "seconds": 0.0, "error": None, "skipped": True}
+        for task in tasks
+        if not force and _is_unchanged(task)
+    }
+    pending = [task for task in tasks if task["name"] not in results]
+    previous_mtimes = [
+        _modified_time(task["artifacts"][0]) if task["artifacts"] else None for task in pending
+    ]
+
+    outcomes = _run_pending(pending, parallel, max_threads)
+    for task, result, previous_mtime in zip(pending, outcomes, previous_mtimes):
+        result["skipped"] = False
+        _record_digest(task, result, previous_mtime)
+        results[task["name"]] = result
+
+    return {task["name"]: results[task["name"]] for task in tasks}
+
+
+def _run_pending(
+    tasks: List[Dict[str, Any]],
+    parallel: bool,
+    max_threads: int
+) -> List[Dict[str, Any]]:
+    """Run tasks sequentially or on the pools, returning results in task order."""
+    if not parallel or not tasks:
+        return [_run_task(task["func"], task["kwargs"]) for task in tasks]
+
+    process_tasks = [task for task in tasks if task["in_process"]]
+    thread_tasks = [task for task in tasks if not task["in_process"]]
+    futures: Dict[str, Future] = {}
+    started = time.perf_counter()
+
+    process_pool: Optional[ProcessPoolExecutor] = None
+    if process_tasks:
+        process_pool = ProcessPoolExecutor(
+            max_workers=len(process_tasks), mp_context=multiprocessing.get_context("spawn")
+        )
+    thread_pool = ThreadPoolExecutor(max_workers=max(1, min(max_threads, len(thread_tasks))))
+
+    results = []
+    try:
+        # Start the process work first; it is usually the longest
+        for task in process_tasks:
+            futures[task["name"]] = process_pool.submit(_run_task, task["func"], task["kwargs"], True)
+        for task in thread_tasks:
+            futures[task["name"]] = thread_pool.submit(_run_task, task["func"], task["kwargs"], True)
+
+        # Writers' messages are shown one writer at a time, in task order
+        for task in tasks:
+            try:
+                result = futures[task["name"]].result()
+            except Exception as e:
+                # The worker process died or could not receive the task
+                result = {
+                    "ok": False, "seconds": time.perf_counter() - started,
+                    "error": f"{type(e).__name__}: {e}", "output": ""
+                }
+            print(result["output"], end="")
+            results.append(result)
+    finally:
+        thread_pool.shutdown(wait=True)
+        if process_pool is not None:
+            process_pool.shutdown(wait=True)
+
+    return results
+
+
+def print_output_timings(results: Dict[str, Dict[str, Any]], total_seconds: float) -> None:
+    """
+    Print per-writer timings and failures.
+
+    Args:
+        results: Results from run_output_tasks
+        total_seconds: Wall-clock time of the whole output stage
+    """
+    print(f"Outputs finished in {total_seconds:.2f}s:")
+    for name, result in results.items():
+        if result.get("skipped"):
+            print(f"   {name:<16} unchanged, skipped")
+        elif result["ok"]:
+            print(f"   {name:<16} {result['seconds']:6.2f}s")
+        else:
+            print(f"   ❌ {name:<13} failed after {result['seconds']:.2f}s - {result['error']}")
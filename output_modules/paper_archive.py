@@ -0,0 +1,347 @@
+"""
+Columnar paper archive for the Journal Lookup Tool.
+Appends each run's papers to a directory partitioned by run date and source
+(archive/run_date=YYYY-MM-DD/source=keyword/part-....parquet), so readers can
+load only the columns and partitions they need instead of a whole results.json.
+Parquet via pyarrow is used when installed; otherwise each part is stored as
+one gzip-compressed JSON array per column, which keeps column projection.
+"""
+
+import gzip
+import json
+import os
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from core.paper import FIELD_SLOTS, TUPLE_FIELDS, Paper
+from core.paper_processor import is_placeholder
+
+try:
+    import pyarrow
+    import pyarrow.dataset
+    import pyarrow.parquet
+except ImportError:  # Optional; parts are written as per-column JSON without it
+    pyarrow = None
+
+
+ARCHIVE_DIRNAME = "archive"
+PARTITION_COLUMNS = ("run_date", "source")
+
+# Paper fields stored in each part (source is a partition, not a column)
+ARCHIVE_COLUMNS = tuple(slot for slot in FIELD_SLOTS.values() if slot != "source")
+
+PARQUET_SUFFIX = ".parquet"
+COLUMNS_SUFFIX = ".columns"  # Directory holding one <column>.json.gz per column
+META_FILENAME = "_meta.json"
+
+
+def _archive_value(slot: str, value: Any) -> Any:
+    """Convert a field to its archived form; placeholders are stored as null."""
+    if is_placeholder(value):
+        return None
+    if slot in TUPLE_FIELDS:
+        return [str(item) for item in value if not is_placeholder(item)]
+    return str(value)
+
+
+def _partition_path(archive_dir: Path, run_date: str, source: str) -> Path:
+    """Return the directory of one run date/source partition."""
+    return archive_dir / f"run_date={run_date}" / f"source={source}"
+
+
+def _write_parquet_part(path: Path, columns: Dict[str, List[Any]]) -> None:
+    """Write one part as a Parquet file."""
+    schema = pyarrow.schema([
+        (slot, pyarrow.list_(pyarrow.string()) if slot in TUPLE_FIELDS else pyarrow.string())
+        for slot in ARCHIVE_COLUMNS
+    ])
+    table = pyarrow.table(columns, schema=schema)
+    temp_path = path.with_name("." + path.name)
+    pyarrow.parquet.write_table(table, str(temp_path), compression="zstd")
+    os.replace(temp_path, path)
+
+
+def _write_columns_part(path: Path, columns: Dict[str, List[Any]]) -> None:
+    """Write one part as a directory of per-column gzip JSON arrays."""
+    temp_path = path.with_name("." + path.name)
+    temp_path.mkdir()
+    for slot, values in columns.items():
+        with gzip.open(temp_path / f"{slot}.json.gz", 'wt', encoding='utf-8') as f:
+            json.dump(values, f, ensure_ascii=False, separators=(",", ":"))
+    with open(temp_path / META_FILENAME, 'w', encoding='utf-8') as f:
+        json.dump({"rows": len(columns[ARCHIVE_COLUMNS[0]]), "columns": list(columns)}, f)
+    os.replace(temp_path, path)
+
+
+def write_archive(
+    components: Iterable[Dict[str, Any]],
+    archive_dir: str,
+    run_date: Optional[str] = None
+) -> List[Path]:
+    """
+    Append papers to the archive, one new part per source.
+
+    Existing parts are never rewritten, and parts are renamed into place
+    once complete, so an interrupted write leaves no partial part behind.
+
+    Args:
+        components: Paper components
+        archive_dir: Archive directory (created if missing)
+        run_date: Partition date as YYYY-MM-DD (default: today)
+
+    Returns:
+        Paths of the parts written
+    """
+    run_date = run_date or datetime.now().strftime("%Y-%m-%d")
+    part_name = f"part-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    by_source: Dict[str, Dict[str, List[Any]]] = defaultdict(lambda: {slot: [] for slot in ARCHIVE_COLUMNS})
+    for component in components:
+        paper = component if isinstance(component, Paper) else Paper.from_dict(component)
+        columns = by_source[paper.source]
+        for slot in ARCHIVE_COLUMNS:
+            columns[slot].append(_archive_value(slot, getattr(paper, slot)))
+
+    written = []
+    for source, columns in by_source.items():
+        partition = _partition_path(Path(archive_dir), run_date, source)
+        partition.mkdir(parents=True, exist_ok=True)
+        if pyarrow is not None:
+            path = partition / (part_name + PARQUET_SUFFIX)
+            _write_parquet_part(path, columns)
+        else:
+            path = partition / (part_name + COLUMNS_SUFFIX)
+            _write_columns_part(path, columns)
+        written.append(path)
+
+    total = sum(len(columns[ARCHIVE_COLUMNS[0]]) for columns in by_source.values())
+    print(f"  Archive: {total} paper(s) appended to {archive_dir} ({len(written)} part(s))")
+    return written
+
+
+class PaperArchive:
+    """Reader for an archive written by write_archive."""
+
+    def __init__(self, archive_dir: str):
+        """
+        Open an archive directory.
+
+        Args:
+            archive_dir: Archive directory path
+        """
+        self.path = Path(archive_dir)
+
+    def partitions(
+        self,
+        run_dates: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None
+    ) -> List[Tuple[str, str, Path]]:
+        """
+        List partitions, pruned by run date and source without opening any part.
+
+        Args:
+            run_dates: Only these run dates (YYYY-MM-DD)
+            sources: Only these sources
+
+        Returns:
+            List of (run_date, source, partition directory), oldest run first
+        """
+        found = []
+        for date_dir in sorted(self.path.glob("run_date=*")):
+            run_date = date_dir.name.split("=", 1)[1]
+            if run_dates and run_date not in run_dates:
+                continue
+            for source_dir in sorted(date_dir.glob("source=*")):
+                source = source_dir.name.split("=", 1)[1]
+                if sources and source not in sources:
+                    continue
+                found.append((run_date, source, source_dir))
+        return found
+
+    def _parts(self, run_dates, sources) -> List[Tuple[str, str, Path]]:
+        """List (run_date, source, part path) for matching partitions, skipping hidden temp parts."""
+        return [
+            (run_date, source, part)
+            for run_date, source, partition in self.partitions(run_dates, sources)
+            for part in sorted(partition.iterdir())
+            if not part.name.startswith((".", "_"))
+            and part.name.endswith((PARQUET_SUFFIX, COLUMNS_SUFFIX))
+        ]
+
+    def partition_counts(
+        self,
+        run_dates: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        Count papers per (run_date, source) from part metadata, without reading any column.
+
+        Args:
+            run_dates: Only these run dates
+            sources: Only these sources
+
+        Returns:
+            Dictionary mapping (run_date, source) to paper count
+        """
+        counts: Dict[Tuple[str, str], int] = defaultdict(int)
+        for run_date, source, part in self._parts(run_dates, sources):
+            if part.name.endswith(COLUMNS_SUFFIX):
+                with open(part / META_FILENAME, 'r', encoding='utf-8') as f:
+                    counts[(run_date, source)] += json.load(f)["rows"]
+            elif pyarrow is not None:
+                counts[(run_date, source)] += pyarrow.parquet.ParquetFile(str(part)).metadata.num_rows
+            else:
+                print(f"   ⚠️ Skipping {part}: pyarrow is required to read Parquet parts")
+        return dict(counts)
+
+    def read_columns(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        sources: Optional[Sequence[str]] = None,
+        run_dates: Optional[Sequence[str]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Read selected columns of matching papers.
+
+        Run dates and sources prune whole partitions; the publication date
+        range is applied while scanning (Parquet row-group statistics with
+        pyarrow, the date column first without it), before other columns
+        are materialized.
+
+        Args:
+            columns: Paper fields to read (default: all), e.g. ["title", "date"]
+            sources: Only papers from these sources
+            run_dates: Only papers archived on these dates (YYYY-MM-DD)
+            start_date: Only papers dated on or after this YYYY/MM/DD date
+            end_date: Only papers dated on or before this YYYY/MM/DD date
+
+        Returns:
+            Dictionary mapping each requested column, plus "run_date" and
+            "source", to its values (null/None where a field was missing)
+
+        Raises:
+            ValueError: If a column is not an archived Paper field
+        """
+        columns = list(columns) if columns else list(ARCHIVE_COLUMNS)
+        unknown = [column for column in columns if column not in ARCHIVE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown archive column(s): {', '.join(unknown)}")
+
+        result: Dict[str, List[Any]] = {column: [] for column in columns + list(PARTITION_COLUMNS)}
+        parquet_parts = []
+        for run_date, source, part in self._parts(run_dates, sources):
+            if part.name.endswith(PARQUET_SUFFIX):
+                parquet_parts.append(part)
+                continue
+
+            rows = self._read_columns_part(part, columns, start_date, end_date)
+            for column in columns:
+                result[column].extend(rows[column])
+            count = len(rows[columns[0]])
+            result["run_date"].extend([run_date] * count)
+            result["source"].extend([source] * count)
+
+        if parquet_parts:
+            if pyarrow is None:
+                print(f"   ⚠️ Skipping {len(parquet_parts)} Parquet part(s): pyarrow is not installed")
+            else:
+                table = self._read_parquet_parts(parquet_parts, columns, start_date, end_date)
+                for column in result:
+                    result[column].extend(table.column(column).to_pylist())
+
+        return result
+
+    def _read_columns_part(
+        self,
+        part: Path,
+        columns: List[str],
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Dict[str, List[Any]]:
+        """Read columns from a per-column JSON part, filtering on the date column first."""
+        def load(column: str) -> List[Any]:
+            with gzip.open(part / f"{column}.json.gz", 'rt', encoding='utf-8') as f:
+                return json.load(f)
+
+        keep = None
+        if start_date or end_date:
+            keep = [
+                index for index, date in enumerate(load("date"))
+                if date is not None
+                and (not start_date or date >= start_date)
+                and (not end_date or date <= end_date)
+            ]
+
+        rows = {}
+        for column in columns:
+            values = load(column)
+            rows[column] = values if keep is None else [values[index] for index in keep]
+        return rows
+
+    def _read_parquet_parts(
+        self,
+        parts: List[Path],
+        columns: List[str],
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> Any:
+        """Read Parquet parts as one pyarrow table with the date filter pushed down."""
+        partitioning = pyarrow.dataset.partitioning(
+            pyarrow.schema([(column, pyarrow.string()) for column in PARTITION_COLUMNS]),
+            flavor="hive"
+        )
+        dataset = pyarrow.dataset.dataset(
+            [str(part) for part in parts], format="parquet",
+            partitioning=partitioning, partition_base_dir=str(self.path)
+        )
+
+        date = pyarrow.dataset.field("date")
+        expression = None
+        if start_date:
+            expression = date >= start_date
+        if end_date:
+            expression = date <= end_date if expression is None else expression & (date <= end_date)
+        return dataset.to_table(columns=columns + list(PARTITION_COLUMNS), filter=expression)
+
+    def read_papers(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        **filters: Any
+    ) -> List[Paper]:
+        """
+        Read matching papers as Paper records.
+
+        Fields that are not read (or were missing) hold the usual
+        "No ... available" placeholders, so dashboards can request only the
+        fields they show, e.g. columns=["title", "journal", "date", "link"].
+
+        Args:
+            columns: Paper fields to read (default: all)
+            **filters: sources, run_dates, start_date, end_date (see read_columns)
+
+        Returns:
+            List of Paper records
+        """
+        data = self.read_columns(columns, **filters)
+        names = [name for name in data if name != "run_date"]
+        return [
+            Paper(**{name: value for name, value in zip(names, values) if value is not None})
+            for values in zip(*(data[name] for name in names))
+        ]
+
+
+def open_paper_archive(output_dir: str) -> PaperArchive:
+    """
+    Open the archive inside an output directory.
+
+    Args:
+        output_dir: Output directory path
+
+    Returns:
+        PaperArchive instance
+    """
+    return PaperArchive(Path(output_dir) / ARCHIVE_DIRNAME)
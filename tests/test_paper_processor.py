@@ -0,0 +1,66 @@
+"""
+Tests for cross-source deduplication in core.paper_processor.
+"""
+
+import unittest
+from core.paper import Paper
+from core.paper_processor import deduplicate_categories, process_papers
+
+
+class CrossSourceDeduplicationTest(unittest.TestCase):
+    """PubMed and CrossRef records of one work must become one paper."""
+
+    def setUp(self):
+        # Streaming-parser component from a PubMed keyword search
+        self.keyword_papers = [{
+            "Title": "Base editing in primary cells",
+            "Journal": "Nature",
+            "Link": "https://doi.org/10.1000/aaa",
+            "Abstract": "No abstract available",
+            "PMID": "101",
+            "Source": "pubmed",
+            "search_keywords": ["CRISPR"]
+        }]
+        # CrossRef work for the same DOI in upper case, with an abstract PubMed lacks
+        self.crossref_papers = [{
+            "DOI": "10.1000/AAA",
+            "URL": "http://dx.doi.org/10.1000/AAA",
+            "title": ["Base editing in primary cells."],
+            "container-title": ["Nature"],
+            "author": [{"given": "Jane", "family": "Doe"}],
+            "abstract": "We edit bases.",
+            "Source": "crossref"
+        }]
+
+    def test_same_doi_in_different_case_is_merged_across_sources(self):
+        components_keyword, components_orcid = process_papers(self.keyword_papers, [], self.crossref_papers)
+
+        self.assertEqual(len(components_keyword) + len(components_orcid), 1)
+        self.assertEqual(components_orcid, [])
+
+        paper = components_keyword[0]
+        self.assertEqual(paper["Source"], "keyword")
+        self.assertEqual(paper["PMID"], "101")
+        self.assertEqual(paper["Abstract"], "We edit bases.")
+        self.assertEqual(paper["Search Terms"], ["CRISPR"])
+
+    def test_merge_statistics_count_the_doi_match(self):
+        keyword = [Paper(title="Base editing", link="https://doi.org/10.1000/aaa", source="keyword")]
+        orcid = [Paper(title="Base editing (preprint)", link="https://doi.org/10.1000/AAA", source="crossref")]
+
+        components_keyword, components_orcid, stats = deduplicate_categories(keyword, orcid)
+
+        self.assertEqual((len(components_keyword), len(components_orcid)), (1, 0))
+        self.assertEqual((stats["records"], stats["unique"], stats["doi"]), (2, 1, 1))
+
+    def test_different_dois_are_not_merged(self):
+        self.crossref_papers[0]["URL"] = "https://doi.org/10.1000/bbb"
+        components_keyword, components_orcid = process_papers(self.keyword_papers, [], self.crossref_papers)
+
+        self.assertEqual(len(components_keyword), 1)
+        self.assertEqual(len(components_orcid), 1)
+        self.assertEqual(components_orcid[0]["Source"], "crossref")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,67 @@ Display utilities for the Journal Lookup Tool.
 Handles console output formatting and user interface elements.
 """
 
-from typing import List, Dict, Any
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Dict, Any, Iterator, Optional
+
+
+# Buffer that print() output of the current context goes to (None: the console)
+_output_buffer: ContextVar[Optional[io.StringIO]] = ContextVar("output_buffer", default=None)
+_buffer_lock = threading.Lock()
+_buffer_users = 0
+
+
+class _BufferedStdout:
+    """Stand-in for sys.stdout that sends writes to the current context's buffer, if any."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text: str) -> int:
+        buffer = _output_buffer.get()
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self) -> None:
+        if _output_buffer.get() is None:
+            self.stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+@contextmanager
+def buffered_output() -> Iterator[io.StringIO]:
+    """
+    Collect everything printed in the current context instead of showing it.
+
+    Used to run several workers at once and show their messages one worker
+    at a time. Only the calling context is affected: other threads keep
+    printing to the console, and threads started through
+    fetch_modules.executor.run_ordered inherit the buffer.
+
+    Yields:
+        Buffer holding the collected output
+    """
+    global _buffer_users
+    with _buffer_lock:
+        if _buffer_users == 0:
+            sys.stdout = _BufferedStdout(sys.stdout)
+        _buffer_users += 1
+
+    buffer = io.StringIO()
+    token = _output_buffer.set(buffer)
+    try:
+        yield buffer
+    finally:
+        _output_buffer.reset(token)
+        with _buffer_lock:
+            _buffer_users -= 1
+            if _buffer_users == 0 and isinstance(sys.stdout, _BufferedStdout):
+                sys.stdout = sys.stdout.stream
 
 
 def print_opener(version: str, update_date: str) -> None:
@@ -64,6 +124,66 @@ def print_results_summary(
         print_paper_breakdown(components_keyword, components_orcid)
 
 
+def print_keyword_counts(keyword_counts: Dict[str, Any]) -> None:
+    """
+    Print PubMed hit counts per keyword.
+    
+    Args:
+        keyword_counts: Keyword to hit count mapping (None for failed queries)
+    """
+    print("\n" + "="*80)
+    print("KEYWORD HIT COUNTS")
+    print("="*80)
+    for keyword, count in keyword_counts.items():
+        shown = "error" if count is None else count
+        print(f"{keyword[:60]:<60} {shown:>10}")
+    print("="*80)
+
+
+def print_near_duplicates(label: str, clusters: List[List[Dict[str, Any]]], merged: bool) -> None:
+    """
+    Print clusters of near-duplicate papers.
+    
+    Args:
+        label: Result category (e.g. "Keyword")
+        clusters: Lists of near-duplicate components, first one kept
+        merged: Whether the clusters were merged into their first paper
+    """
+    if not clusters:
+        return
+    
+    action = "merged" if merged else "flagged"
+    print(f"\n{label} results: {len(clusters)} near-duplicate cluster(s) {action}")
+    for cluster in clusters:
+        print(f"  • [{cluster[0].get('Source', 'unknown')}] {str(cluster[0].get('Title', 'No title'))[:64]}")
+        for component in cluster[1:]:
+            print(f"    ≈ [{component.get('Source', 'unknown')}] {str(component.get('Title', 'No title'))[:62]}")
+
+
+def print_search_results(results: List[tuple]) -> None:
+    """
+    Print ranked paper store search results.
+    
+    Args:
+        results: (paper, score) pairs from PaperStore.search
+    """
+    if not results:
+        print("No stored papers match your search.")
+        return
+    
+    print("\n" + "="*80)
+    print(f"SEARCH RESULTS ({len(results)})")
+    print("="*80)
+    for rank, (paper, score) in enumerate(results, 1):
+        print(f"[{rank:2d}] {str(paper.get('Title', 'No title'))[:74]}")
+        print(f"     {paper.get('Journal', 'Unknown journal')} | {paper.get('Date', 'Unknown date')} | "
+              f"{paper.get('Source', 'unknown')} | score {-score:.2f}")
+        link = paper.get('Link', 'No link available')
+        if link != 'No link available':
+            print(f"     {link}")
+    print("="*80)
+
+
 def print_no_results() -> None:
     """Print message when no papers are found."""
     art = """